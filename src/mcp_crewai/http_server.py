@@ -11,11 +11,11 @@ from datetime import datetime
 
 from fastapi import FastAPI, HTTPException, Request, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel
 import uvicorn
 
-from .server import MCPCrewAIServer
+from .server import MCPCrewAIServer, tool_catalog_json
 from .monitoring import monitoring_manager, update_system
 from .config import get_config
 
@@ -104,6 +104,11 @@ class MCPHTTPServer:
                 logger.error(f"MCP endpoint error: {e}")
                 return MCPResponse(error=str(e))
         
+        @self.app.get("/api/tools")
+        async def list_tools():
+            """MCP tool catalog, served from bytes encoded once per process"""
+            return Response(content=tool_catalog_json(), media_type="application/json")
+        
         @self.app.get("/api/monitoring/dashboard")
         async def get_dashboard():
             """Get monitoring dashboard data"""
@@ -181,6 +186,7 @@ class MCPHTTPServer:
                 "endpoints": {
                     "health": "/health",
                     "mcp": "/api/mcp",
+                    "tools": "/api/tools",
                     "dashboard": "/api/monitoring/dashboard",
                     "events": "/api/monitoring/events",
                     "agent_details": "/api/monitoring/agent/{agent_id}",
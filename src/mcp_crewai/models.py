@@ -2,8 +2,9 @@
 Models for Evolving Agents and Autonomous Crews
 """
 
-from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Any, Iterator
+from collections.abc import Mapping
+from datetime import date, datetime, timedelta
 from pydantic import BaseModel, Field
 import json
 import sqlite3
@@ -12,6 +13,18 @@ import sys
 import io
 import contextlib
 
+import numpy as np
+
+from .monitoring import TRAIT_ORDER
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the kernels below run as plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
 # Lazy import CrewAI components to avoid FilteredStream issues
 def _safe_import_crewai():
     """Safely import CrewAI components with stream protection"""
@@ -23,8 +36,8 @@ def _safe_import_crewai():
         safe_stderr = io.StringIO()
         
         with contextlib.redirect_stdout(safe_stdout), contextlib.redirect_stderr(safe_stderr):
-            from crewai import Agent, Crew, Task
-            return Agent, Crew, Task
+            from crewai import Agent, Crew, Task, Process
+            return Agent, Crew, Task, Process
     finally:
         sys.stdout = original_stdout
         sys.stderr = original_stderr
@@ -48,6 +61,105 @@ class PersonalityTrait(BaseModel):
     last_updated: datetime = Field(default_factory=datetime.now)
 
 
+# Personality traits are stored Struct-of-Arrays style on each agent: one
+# float array for values, one for evolution rates and one for timestamps,
+# all indexed by the fixed trait order shared with the monitoring wire format.
+_TRAIT_NAMES = TRAIT_ORDER
+_TRAIT_INDEX = {name: index for index, name in enumerate(_TRAIT_NAMES)}
+_DEFAULT_TRAIT_VALUES = (0.5, 0.5, 0.5, 0.5, 0.5, 0.3)
+_DEFAULT_EVOLUTION_RATE = 0.1
+
+
+@njit(cache=True)
+def _alignment(trait_values: np.ndarray) -> float:
+    """Mean trait value of one agent, capped at 1.0"""
+    return min(trait_values.mean(), 1.0)
+
+
+@njit(cache=True)
+def _balance_score(values: np.ndarray) -> float:
+    """Mean per-trait variance across agents for an (agents, traits) array, capped at 1.0"""
+    n_agents, n_traits = values.shape
+    if n_agents < 2:
+        return 0.0
+    
+    total_variance = 0.0
+    for t in range(n_traits):
+        mean_val = 0.0
+        for a in range(n_agents):
+            mean_val += values[a, t]
+        mean_val /= n_agents
+        
+        variance = 0.0
+        for a in range(n_agents):
+            diff = values[a, t] - mean_val
+            variance += diff * diff
+        total_variance += variance / n_agents
+    
+    return min(total_variance / n_traits, 1.0)
+
+
+class PersonalityTraitView:
+    """Live view of a single trait backed by an agent's trait arrays"""
+    
+    __slots__ = ("_agent", "_index", "name")
+    
+    def __init__(self, agent: "EvolvingAgent", name: str):
+        self._agent = agent
+        self._index = _TRAIT_INDEX[name]
+        self.name = name
+    
+    @property
+    def value(self) -> float:
+        return float(self._agent._trait_values[self._index])
+    
+    @value.setter
+    def value(self, new_value: float) -> None:
+        self._agent._trait_values[self._index] = new_value
+    
+    @property
+    def evolution_rate(self) -> float:
+        return float(self._agent._trait_rates[self._index])
+    
+    @evolution_rate.setter
+    def evolution_rate(self, new_rate: float) -> None:
+        self._agent._trait_rates[self._index] = new_rate
+    
+    @property
+    def last_updated(self) -> datetime:
+        return self._agent._trait_updated[self._index].astype("datetime64[us]").item()
+    
+    @last_updated.setter
+    def last_updated(self, timestamp: datetime) -> None:
+        self._agent._trait_updated[self._index] = np.datetime64(timestamp, "ns")
+    
+    def __repr__(self) -> str:
+        return f"PersonalityTraitView(name={self.name!r}, value={self.value})"
+
+
+class PersonalityTraits(Mapping):
+    """Read-only mapping of trait name -> PersonalityTraitView for an agent"""
+    
+    __slots__ = ("_agent",)
+    
+    def __init__(self, agent: "EvolvingAgent"):
+        self._agent = agent
+    
+    def __getitem__(self, name: str) -> PersonalityTraitView:
+        if name not in _TRAIT_INDEX:
+            raise KeyError(name)
+        return PersonalityTraitView(self._agent, name)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(_TRAIT_NAMES)
+    
+    def __len__(self) -> int:
+        return len(_TRAIT_NAMES)
+    
+    def __contains__(self, name: object) -> bool:
+        return name in _TRAIT_INDEX
+
+
 class AgentMemory(BaseModel):
     """Persistent memory for agents across sessions"""
     agent_id: str
@@ -60,7 +172,7 @@ class AgentMemory(BaseModel):
 
 
 # Get CrewAI classes at module level with protection
-Agent, Crew, Task = _safe_import_crewai()
+Agent, Crew, Task, Process = _safe_import_crewai()
 
 class EvolvingAgent(Agent):
     """Agent that evolves autonomously over time"""
@@ -72,39 +184,42 @@ class EvolvingAgent(Agent):
         super().__init__(*args, **kwargs)
         
         # Evolution tracking - use __dict__ to bypass Pydantic restrictions
-        agent_id = f"agent_{datetime.now().timestamp()}"
+        now = datetime.now()
+        agent_id = f"agent_{now.timestamp()}"
         self.__dict__['agent_id'] = agent_id
-        self.__dict__['birth_date'] = datetime.now()
+        self.__dict__['birth_date'] = now
+        self.__dict__['_birth_ordinal'] = now.toordinal()
         self.__dict__['evolution_metrics'] = EvolutionMetrics()
         self.__dict__['memory'] = AgentMemory(agent_id=agent_id)
         
-        # Personality traits that can evolve
-        self.__dict__['personality_traits'] = {
-            "analytical": PersonalityTrait(name="analytical", value=0.5),
-            "creative": PersonalityTrait(name="creative", value=0.5),
-            "collaborative": PersonalityTrait(name="collaborative", value=0.5),
-            "decisive": PersonalityTrait(name="decisive", value=0.5),
-            "adaptable": PersonalityTrait(name="adaptable", value=0.5),
-            "risk_taking": PersonalityTrait(name="risk_taking", value=0.3)
-        }
+        # Personality traits that can evolve (SoA arrays indexed by _TRAIT_NAMES)
+        self.__dict__['_trait_values'] = np.array(_DEFAULT_TRAIT_VALUES, dtype=np.float64)
+        self.__dict__['_trait_rates'] = np.full(len(_TRAIT_NAMES), _DEFAULT_EVOLUTION_RATE, dtype=np.float64)
+        self.__dict__['_trait_updated'] = np.full(
+            len(_TRAIT_NAMES), np.datetime64(now, "ns"), dtype="datetime64[ns]"
+        )
+        self.__dict__['personality_traits'] = PersonalityTraits(self)
         
         # Evolution state
         self.__dict__['weeks_active'] = 0
         self.__dict__['tasks_completed'] = 0
         self.__dict__['evolution_cycles'] = 0
-        self.__dict__['last_evolution'] = datetime.now()
+        self.__dict__['last_evolution'] = now
+        self.__dict__['_last_evolution_ordinal'] = self._birth_ordinal
         
     def age_in_weeks(self) -> int:
         """Calculate how many weeks this agent has been active"""
-        return (datetime.now() - self.birth_date).days // 7
+        return (date.today().toordinal() - self._birth_ordinal) // 7
     
     def should_evolve(self) -> bool:
         """Determine if agent should undergo evolution"""
-        weeks_since_evolution = (datetime.now() - self.last_evolution).days // 7
+        today = date.today().toordinal()
+        age_in_weeks = (today - self._birth_ordinal) // 7
+        weeks_since_evolution = (today - self._last_evolution_ordinal) // 7
         
         # Evolution triggers
         conditions = [
-            self.age_in_weeks() >= 2,  # Minimum age
+            age_in_weeks >= 2,  # Minimum age
             weeks_since_evolution >= 1,  # Time since last evolution
             self.tasks_completed >= 5,  # Minimum experience
             self.evolution_metrics.success_rate < 0.6,  # Performance issues
@@ -143,11 +258,14 @@ class EvolvingAgent(Agent):
             "suggested_role_adjustments": self._suggest_role_changes()
         }
     
+    def traits_snapshot(self) -> Dict[str, float]:
+        """Trait name -> value as a new plain dict, read straight from the trait array"""
+        return dict(zip(_TRAIT_NAMES, self._trait_values.tolist()))
+    
     def _calculate_personality_role_alignment(self) -> float:
         """Calculate how well personality traits align with current role"""
         # This would be more sophisticated in practice
-        traits_sum = sum(trait.value for trait in self.personality_traits.values())
-        return min(traits_sum / len(self.personality_traits), 1.0)
+        return float(_alignment(self._trait_values))
     
     def _identify_skill_gaps(self) -> List[str]:
         """Identify skills the agent needs to develop"""
@@ -201,15 +319,22 @@ class EvolvingAgent(Agent):
     
     def evolve(self, evolution_plan: Dict[str, Any]) -> None:
         """Execute evolution plan to improve agent capabilities"""
+        now = datetime.now()
         self.evolution_cycles += 1
-        self.last_evolution = datetime.now()
+        self.last_evolution = now
+        self.__dict__['_last_evolution_ordinal'] = now.toordinal()
         
         # Apply personality adjustments
         if "personality_adjustments" in evolution_plan:
-            for trait_name, new_value in evolution_plan["personality_adjustments"].items():
-                if trait_name in self.personality_traits:
-                    self.personality_traits[trait_name].value = new_value
-                    self.personality_traits[trait_name].last_updated = datetime.now()
+            adjustments = [
+                (_TRAIT_INDEX[trait_name], new_value)
+                for trait_name, new_value in evolution_plan["personality_adjustments"].items()
+                if trait_name in _TRAIT_INDEX
+            ]
+            if adjustments:
+                indices, new_values = zip(*adjustments)
+                np.put(self._trait_values, indices, new_values)
+                np.put(self._trait_updated, indices, np.datetime64(now, "ns"))
         
         # Apply role changes if suggested
         if "role_changes" in evolution_plan:
@@ -289,16 +414,12 @@ class AutonomousCrew(Crew):
     
     def _analyze_skill_coverage(self) -> Dict[str, float]:
         """Analyze what skills are covered by current agents"""
-        skills = {}
-        
-        for agent in self.agents:
-            if hasattr(agent, 'personality_traits'):
-                for trait_name, trait in agent.personality_traits.items():
-                    if trait_name not in skills:
-                        skills[trait_name] = 0.0
-                    skills[trait_name] = max(skills[trait_name], trait.value)
+        evo_agents = [agent for agent in self.agents if isinstance(agent, EvolvingAgent)]
+        if not evo_agents:
+            return {}
         
-        return skills
+        coverage = np.maximum.reduce([agent._trait_values for agent in evo_agents])
+        return dict(zip(_TRAIT_NAMES, coverage.tolist()))
     
     def _check_resource_adequacy(self) -> Dict[str, bool]:
         """Check if crew has adequate resources for assigned tasks"""
@@ -339,30 +460,14 @@ class AutonomousCrew(Crew):
     
     def _evaluate_team_balance(self) -> float:
         """Evaluate how well-balanced the team is"""
-        if not self.agents:
+        evo_agents = [agent for agent in self.agents if isinstance(agent, EvolvingAgent)]
+        if not evo_agents:
             return 0.0
         
         # Simple balance check based on personality diversity
-        trait_diversity = 0.0
-        if hasattr(self.agents[0], 'personality_traits'):
-            trait_sums = {}
-            for agent in self.agents:
-                for trait_name, trait in agent.personality_traits.items():
-                    if trait_name not in trait_sums:
-                        trait_sums[trait_name] = []
-                    trait_sums[trait_name].append(trait.value)
-            
-            # Calculate variance in traits (higher variance = better balance)
-            trait_variances = []
-            for trait_values in trait_sums.values():
-                if len(trait_values) > 1:
-                    mean_val = sum(trait_values) / len(trait_values)
-                    variance = sum((x - mean_val) ** 2 for x in trait_values) / len(trait_values)
-                    trait_variances.append(variance)
-            
-            trait_diversity = sum(trait_variances) / len(trait_variances) if trait_variances else 0.0
-        
-        return min(trait_diversity, 1.0)
+        # (higher variance across agents = better balance)
+        trait_matrix = np.stack([agent._trait_values for agent in evo_agents])
+        return float(_balance_score(trait_matrix))
     
     def _identify_missing_elements(self) -> List[str]:
         """Identify what the crew is missing to be more effective"""
@@ -4,15 +4,40 @@ Provides APIs and utilities for live monitoring of agents, crews, and evolution
 """
 
 import asyncio
+import base64
+import itertools
 import json
+import logging
+import struct
 import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Final, Tuple
 from dataclasses import dataclass, asdict
 from collections import deque
 import threading
 import queue
 
+logger = logging.getLogger(__name__)
+
+# Fixed on-wire order of personality traits. Agent statuses carry their
+# traits as little-endian float32s packed in this order instead of a dict.
+TRAIT_ORDER: Final[tuple] = ("analytical", "creative", "collaborative", "decisive", "adaptable", "risk_taking")
+_TRAIT_STRUCT = struct.Struct(f"<{len(TRAIT_ORDER)}f")
+_EMPTY_TRAITS = bytes(_TRAIT_STRUCT.size)
+
+
+def pack_traits(traits: Dict[str, float]) -> bytes:
+    """Pack a trait-name -> value mapping into TRAIT_ORDER float32 bytes"""
+    return _TRAIT_STRUCT.pack(*(traits.get(name, 0.0) for name in TRAIT_ORDER))
+
+
+def unpack_traits(packed: bytes) -> Dict[str, float]:
+    """Inverse of pack_traits; also accepts the base64 form used on the wire"""
+    if isinstance(packed, str):
+        packed = base64.b64decode(packed)
+    return dict(zip(TRAIT_ORDER, _TRAIT_STRUCT.unpack(packed)))
+
+
 @dataclass
 class MonitoringEvent:
     """Event structure for monitoring"""
@@ -33,11 +58,21 @@ class AgentStatus:
     current_task: Optional[str]
     task_progress: float  # 0.0 to 1.0
     task_eta: Optional[int]  # seconds
-    personality_traits: Dict[str, float]
+    trait_values: bytes  # pack_traits() output, see TRAIT_ORDER
     evolution_cycles: int
     success_rate: float
     tasks_completed: int
     last_activity: str
+    
+    @property
+    def personality_traits(self) -> Dict[str, float]:
+        return unpack_traits(self.trait_values)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-ready dict with trait_values base64-encoded"""
+        data = asdict(self)
+        data['trait_values'] = base64.b64encode(self.trait_values).decode('ascii')
+        return data
 
 @dataclass
 class CrewStatus:
@@ -66,19 +101,39 @@ class SystemStatus:
 class MonitoringManager:
     """Manages real-time monitoring data"""
     
-    def __init__(self, max_events: int = 1000):
+    def __init__(self, max_events: int = 1000, thread_buffer_size: int = 4096,
+                 flush_threshold: int = 256, flush_interval: float = 0.5):
         self.events: deque = deque(maxlen=max_events)
         self.agent_statuses: Dict[str, AgentStatus] = {}
         self.crew_statuses: Dict[str, CrewStatus] = {}
         self.system_status: Optional[SystemStatus] = None
         self.start_time = datetime.now()
+        # Events are stamped with monotonic_ns() and rendered as wall-clock
+        # ISO strings against this anchor when they are flushed
+        self._wall_anchor_ns = time.time_ns()
+        self._monotonic_anchor_ns = time.monotonic_ns()
         
         # Event queue for real-time streaming
         self.event_queue = queue.Queue()
         self.subscribers = set()
         
+        # Producers append to a per-thread buffer; buffers are merged into
+        # self.events (ordered by timestamp) by readers, by a producer whose
+        # buffer reaches flush_threshold, and by a background flusher every
+        # flush_interval seconds. The producer flushes its own buffer before
+        # it can fill, so thread_buffer_size only bounds memory.
+        self._tls = threading.local()
+        self._all_tls: List[Tuple[threading.Thread, deque]] = []
+        self._tls_lock = threading.Lock()
+        self._thread_buffer_size = thread_buffer_size
+        self._flush_threshold = min(flush_threshold, thread_buffer_size)
+        self._flush_interval = flush_interval
+        self._event_sequence = itertools.count()
+        self._flusher: Optional[threading.Thread] = None
+        self._flusher_stop = threading.Event()
+        
         # Performance metrics
-        self.metrics = {
+        self._metrics = {
             'total_tasks': 0,
             'successful_tasks': 0,
             'total_evolutions': 0,
@@ -90,24 +145,89 @@ class MonitoringManager:
     def add_event(self, event_type: str, message: str, agent_id: str = None, 
                   crew_id: str = None, details: Dict = None, severity: str = "info"):
         """Add a monitoring event"""
-        event = MonitoringEvent(
-            timestamp=datetime.now().isoformat(),
-            event_type=event_type,
-            agent_id=agent_id,
-            crew_id=crew_id,
-            message=message,
-            details=details or {},
-            severity=severity
-        )
-        
-        self.events.append(event)
-        self.event_queue.put(event)
-        
-        # Update metrics based on event
-        self._update_metrics(event)
+        buffer = self._thread_buffer()
+        buffer.append((
+            time.monotonic_ns(), next(self._event_sequence),
+            event_type, message, agent_id, crew_id, details, severity
+        ))
+        if len(buffer) >= self._flush_threshold:
+            self.flush_events()
+    
+    def _iso_timestamp(self, monotonic_ns: int) -> str:
+        """Render a monotonic_ns() stamp as a local wall-clock ISO timestamp"""
+        seconds, remainder = divmod(self._wall_anchor_ns + monotonic_ns - self._monotonic_anchor_ns, 1_000_000_000)
+        return datetime.fromtimestamp(seconds).replace(microsecond=remainder // 1000).isoformat()
+    
+    def _thread_buffer(self) -> deque:
+        """Get (or lazily register) the calling thread's event buffer"""
+        buffer = getattr(self._tls, 'buffer', None)
+        if buffer is None:
+            buffer = deque(maxlen=self._thread_buffer_size)
+            self._tls.buffer = buffer
+            with self._tls_lock:
+                self._all_tls.append((threading.current_thread(), buffer))
+                if self._flusher is None:
+                    self._flusher = threading.Thread(
+                        target=self._flush_periodically, name="monitoring-flusher", daemon=True
+                    )
+                    self._flusher.start()
+        return buffer
+    
+    def _flush_periodically(self):
+        """Background flusher so subscribers and metrics see events without a reader"""
+        while not self._flusher_stop.wait(self._flush_interval):
+            try:
+                self.flush_events()
+            except Exception:
+                logger.exception("Monitoring event flush failed")
+    
+    def close(self):
+        """Stop the background flusher and flush what is still buffered"""
+        self._flusher_stop.set()
+        flusher = self._flusher
+        if flusher is not None and flusher is not threading.current_thread():
+            flusher.join()
+        self.flush_events()
+    
+    def flush_events(self):
+        """Merge all per-thread buffers into the global event log"""
+        with self._tls_lock:
+            pending = []
+            for _, buffer in self._all_tls:
+                while buffer:
+                    pending.append(buffer.popleft())
+            
+            # Forget buffers of threads that have exited (and been drained)
+            self._all_tls = [(thread, buffer) for thread, buffer in self._all_tls
+                             if buffer or thread.is_alive()]
+            
+            pending.sort()
+            for stamp, _, event_type, message, agent_id, crew_id, details, severity in pending:
+                event = MonitoringEvent(
+                    timestamp=self._iso_timestamp(stamp),
+                    event_type=event_type,
+                    agent_id=agent_id,
+                    crew_id=crew_id,
+                    message=message,
+                    details=details or {},
+                    severity=severity
+                )
+                self.events.append(event)
+                self.event_queue.put(event)
+                
+                # Update metrics based on event
+                self._update_metrics(event)
+    
+    @property
+    def metrics(self) -> Dict[str, Any]:
+        self.flush_events()
+        return self._metrics
     
     def update_agent_status(self, agent_id: str, **kwargs):
         """Update agent status"""
+        if 'personality_traits' in kwargs:
+            kwargs['trait_values'] = pack_traits(kwargs.pop('personality_traits') or {})
+        
         if agent_id in self.agent_statuses:
             current = self.agent_statuses[agent_id]
             # Update fields that are provided
@@ -123,7 +243,7 @@ class MonitoringManager:
                 current_task=kwargs.get('current_task'),
                 task_progress=kwargs.get('task_progress', 0.0),
                 task_eta=kwargs.get('task_eta'),
-                personality_traits=kwargs.get('personality_traits', {}),
+                trait_values=kwargs.get('trait_values', _EMPTY_TRAITS),
                 evolution_cycles=kwargs.get('evolution_cycles', 0),
                 success_rate=kwargs.get('success_rate', 0.0),
                 tasks_completed=kwargs.get('tasks_completed', 0),
@@ -151,6 +271,7 @@ class MonitoringManager:
     
     def update_system_status(self, **kwargs):
         """Update system status"""
+        self.flush_events()
         uptime = str(datetime.now() - self.start_time).split('.')[0]
         
         self.system_status = SystemStatus(
@@ -159,13 +280,14 @@ class MonitoringManager:
             memory_usage=kwargs.get('memory_usage', '0MB'),
             active_agents=len([a for a in self.agent_statuses.values() if a.status != 'idle']),
             active_crews=len([c for c in self.crew_statuses.values() if c.status == 'running']),
-            total_evolutions=self.metrics['total_evolutions'],
+            total_evolutions=self._metrics['total_evolutions'],
             background_tasks=kwargs.get('background_tasks', True),
             connections=kwargs.get('connections', 0)
         )
     
     def get_recent_events(self, count: int = 50, event_type: str = None) -> List[MonitoringEvent]:
         """Get recent events, optionally filtered by type"""
+        self.flush_events()
         events = list(self.events)
         
         if event_type:
@@ -178,13 +300,15 @@ class MonitoringManager:
         if agent_id not in self.agent_statuses:
             return None
         
+        self.flush_events()
         status = self.agent_statuses[agent_id]
         
         # Get agent's recent events
         agent_events = [e for e in self.events if e.agent_id == agent_id][-10:]
         
         return {
-            'status': asdict(status),
+            'status': status.to_dict(),
+            'trait_order': list(TRAIT_ORDER),
             'recent_events': [asdict(e) for e in agent_events],
             'evolution_history': self._get_evolution_history(agent_id),
             'performance_metrics': self._get_agent_metrics(agent_id)
@@ -195,6 +319,7 @@ class MonitoringManager:
         if crew_id not in self.crew_statuses:
             return None
         
+        self.flush_events()
         status = self.crew_statuses[crew_id]
         
         # Get crew's agents
@@ -206,16 +331,22 @@ class MonitoringManager:
         
         return {
             'status': asdict(status),
-            'agents': [asdict(a) for a in crew_agents],
+            'trait_order': list(TRAIT_ORDER),
+            'agents': [a.to_dict() for a in crew_agents],
             'recent_events': [asdict(e) for e in crew_events],
             'performance_metrics': self._get_crew_metrics(crew_id)
         }
     
     def get_dashboard_data(self) -> Dict[str, Any]:
-        """Get all data for dashboard display"""
+        """Get all data for dashboard display
+        
+        Agent traits are sent as base64 float32 blobs; decode them with
+        unpack_traits() or zip struct.unpack('<6f', ...) with 'trait_order'.
+        """
         return {
             'system_status': asdict(self.system_status) if self.system_status else None,
-            'agents': [asdict(a) for a in self.agent_statuses.values()],
+            'trait_order': list(TRAIT_ORDER),
+            'agents': [a.to_dict() for a in self.agent_statuses.values()],
             'crews': [asdict(c) for c in self.crew_statuses.values()],
             'recent_events': [asdict(e) for e in self.get_recent_events(20)],
             'metrics': self.metrics,
@@ -224,6 +355,7 @@ class MonitoringManager:
     
     def get_evolution_summary(self) -> Dict[str, Any]:
         """Get summary of evolution activity"""
+        self.flush_events()
         evolution_events = [e for e in self.events if e.event_type == 'evolution']
         
         return {
@@ -237,12 +369,12 @@ class MonitoringManager:
     def _update_metrics(self, event: MonitoringEvent):
         """Update system metrics based on event"""
         if event.event_type == 'evolution':
-            self.metrics['total_evolutions'] += 1
+            self._metrics['total_evolutions'] += 1
         elif event.event_type == 'task':
             if 'completed' in event.message.lower():
-                self.metrics['total_tasks'] += 1
+                self._metrics['total_tasks'] += 1
                 if 'success' in event.details.get('status', '').lower():
-                    self.metrics['successful_tasks'] += 1
+                    self._metrics['successful_tasks'] += 1
     
     def _get_evolution_history(self, agent_id: str) -> List[Dict[str, Any]]:
         """Get evolution history for an agent"""
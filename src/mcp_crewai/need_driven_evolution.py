@@ -4,16 +4,197 @@ Need-Driven Evolution System
 Agents only improve when they encounter real user challenges and fail to meet requirements
 """
 
-import asyncio
+import functools
+import hashlib
+import heapq
+import itertools
 import json
 import logging
-from datetime import datetime
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass
+import os
+import re
+import sqlite3
+import string
+import sys
+import threading
+import uuid
+import zlib
+from collections import Counter, OrderedDict, deque
+from datetime import datetime, timedelta
+from typing import Dict, Any, Deque, Iterable, List, Optional, Tuple
+from dataclasses import asdict, dataclass, is_dataclass
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; dump() falls back to the stdlib encoder
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Process-wide ID sequences (timestamps collide within the same second). The
+# counters restart with every process, so IDs also carry a random per-process
+# tag to stay unique against history reloaded from SQLite.
+_ID_PROCESS_TAG = uuid.uuid4().hex[:12]
+_REQ_COUNTER = itertools.count()
+_TASK_COUNTER = itertools.count()
+_NEED_COUNTER = itertools.count()
+
+# Full history lives in SQLite; only this many recent records stay in memory
+HOT_WINDOW_SIZE = int(os.getenv("NDE_MAX_RECORDS", 10000))
+
+# SQLite history file used when no db_path is passed; read per instance so
+# NDE_DB_PATH can point tests and deployments elsewhere
+_DEFAULT_DB_PATH = "need_driven_evolution.db"
+
+# Improvement need priority by request complexity (anything else is medium, 3)
+_PRIORITY_BY_COMPLEXITY = {"complex": 5, "simple": 2}
+
+# Improvement needs older than this no longer trigger research
+RESEARCH_WINDOW = timedelta(hours=24)
+
+# Skill gap -> personality trait / research focus, one regex search each
+_TRAIT_RE = re.compile(r"(creative|analytical|collaborative|decisive|adaptable|risk_taking)")
+_RESEARCH_FOCUS_RE = re.compile(r"(creative|analytical|collaborative|technical)")
+_TRAIT_QUERY_TEMPLATES = {
+    "creative": "improve creative thinking skills for {user_context}",
+    "analytical": "enhance analytical abilities for {user_context}",
+    "collaborative": "develop collaboration skills for {user_context}",
+    "technical": "build technical expertise for {user_context}"
+}
+
+# Research result cache: exact match on the query skeleton, then cosine
+# similarity over hashed bag-of-words embeddings of the skeleton
+RESEARCH_CACHE_SIZE = 1024
+SEMANTIC_MATCH_THRESHOLD = 0.85
+_EMBEDDING_DIM = 512
+_SKELETON_STRIP_RE = re.compile(r"[^a-z\s]+")
+
+
+def _query_skeleton(query: str) -> str:
+    """Normalize a research query: lowercase, drop digits/punctuation, collapse whitespace"""
+    return " ".join(_SKELETON_STRIP_RE.sub(" ", query.lower()).split())
+
+
+def _embed_skeleton(skeleton: str) -> np.ndarray:
+    """L2-normalized hashed bag-of-words vector for a skeleton"""
+    vector = np.zeros(_EMBEDDING_DIM, dtype=np.float32)
+    for token in skeleton.split():
+        vector[zlib.crc32(token.encode()) % _EMBEDDING_DIM] += 1.0
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+# Skill detection patterns
+SKILL_PATTERNS = {
+    "creative": ["creative", "design", "brainstorm", "innovative", "artistic", "imaginative"],
+    "analytical": ["analyze", "data", "research", "evaluate", "assess", "calculate", "logical"],
+    "collaborative": ["team", "collaborate", "coordinate", "communicate", "together", "group"],
+    "technical": ["code", "program", "technical", "engineering", "development", "system"],
+    "decisive": ["decide", "choose", "select", "recommend", "conclude", "determine"],
+    "leadership": ["lead", "manage", "direct", "guide", "supervise", "organize"]
+}
+
+# Complexity indicators
+COMPLEX_INDICATORS = ["complex", "advanced", "expert", "comprehensive", "detailed", "thorough"]
+MODERATE_INDICATORS = ["analyze", "research", "develop", "create", "design", "plan"]
+SIMPLE_INDICATORS = ["simple", "basic", "quick", "easy", "summarize", "list"]
+
+
+# Minimum skill level an agent needs for each request complexity
+COMPLEXITY_THRESHOLDS = {
+    "simple": 0.4,
+    "moderate": 0.6,
+    "complex": 0.8,
+    "expert": 0.9
+}
+_DEFAULT_THRESHOLD = 0.6
+
+# Keyword sets for whole-word matching against a tokenized query
+_SKILL_KW = {skill: frozenset(keywords) for skill, keywords in SKILL_PATTERNS.items()}
+_COMPLEXITY_KW = (
+    ("complex", frozenset(COMPLEX_INDICATORS)),
+    ("moderate", frozenset(MODERATE_INDICATORS)),
+    ("simple", frozenset(SIMPLE_INDICATORS))
+)
+_PUNCT_TABLE = str.maketrans(string.punctuation, " " * len(string.punctuation))
+
+
+def _tokenize(query_lower: str) -> frozenset:
+    """Split a lowercased query into a set of punctuation-free words"""
+    return frozenset(query_lower.translate(_PUNCT_TABLE).split())
+
+
+def _build_keyword_matcher():
+    """Generate a straight-line matcher for the fixed keyword tables
+    
+    The vocabulary never changes at runtime, so instead of intersecting a
+    frozenset per skill/level on every call we emit one ``if kw in tokens or
+    ...`` chain per table row, with the keywords inlined as constants, and
+    compile it once at import time.
+    """
+    def any_of(keywords: Iterable[str]) -> str:
+        return " or ".join(f"{keyword!r} in tokens" for keyword in sorted(keywords))
+    
+    lines = ["def _match_keywords(tokens):", "    skills = []"]
+    for skill, keywords in _SKILL_KW.items():
+        lines.append(f"    if {any_of(keywords)}: skills.append({skill!r})")
+    for position, (level, indicators) in enumerate(_COMPLEXITY_KW):
+        branch = "if" if position == 0 else "elif"
+        lines.append(f"    {branch} {any_of(indicators)}: level = {level!r}")
+    lines.append("    else: level = 'moderate'")
+    lines.append("    return tuple(skills), level")
+    
+    namespace: Dict[str, Any] = {}
+    exec(compile("\n".join(lines), "<need-driven keyword matcher>", "exec"), namespace)
+    return namespace["_match_keywords"]
+
+
+# tokens -> (matched skills in SKILL_PATTERNS order, complexity level or 'moderate')
+_match_keywords = _build_keyword_matcher()
+
+
+# Numbers and capitalized words (names, products, places) vary between
+# otherwise identical templated requests. Blanking them - unless the word is
+# itself a keyword - gives a skeleton whose analysis equals the original's.
+_SKELETON_RE = re.compile(r"\b(?:\d+|[A-Z][a-z]+)\b")
+_VOCABULARY = frozenset().union(*_SKILL_KW.values(), *(indicators for _, indicators in _COMPLEXITY_KW))
+
+
+def _blank_entity(match: "re.Match") -> str:
+    word = match.group(0)
+    return word if word.lower() in _VOCABULARY else "·"
+
+
+def _request_skeleton(user_query: str) -> str:
+    """Lowercased query with numbers and non-keyword proper nouns blanked out"""
+    return _SKELETON_RE.sub(_blank_entity, user_query).lower()
+
+
+@functools.lru_cache(maxsize=4096)
+def _analyze_query_cached(query_lower: str) -> Tuple[Tuple[str, ...], str]:
+    """Tokenize once and return (required skills, complexity level)"""
+    required_skills, complexity_level = _match_keywords(_tokenize(query_lower))
+    
+    # If no specific skills detected, assume general problem-solving
+    return required_skills or ("analytical", "collaborative"), complexity_level
+
+
+def _extract_required_skills_cached(query_lower: str) -> Tuple[str, ...]:
+    """Extract required skills from a lowercased user query"""
+    return _analyze_query_cached(query_lower)[0]
+
+
+def _assess_complexity_cached(query_lower: str) -> str:
+    """Assess complexity level of a lowercased user query"""
+    return _analyze_query_cached(query_lower)[1]
+
+
+# Records are immutable once created; slots drop the per-instance __dict__
+# (slots=True needs Python 3.10+, older interpreters just get frozen records)
+_RECORD_OPTIONS = {"frozen": True, **({"slots": True} if sys.version_info >= (3, 10) else {})}
+
+
+@dataclass(**_RECORD_OPTIONS)
 class UserRequest:
     """Represents a user request that triggers potential evolution"""
     request_id: str
@@ -23,7 +204,7 @@ class UserRequest:
     timestamp: datetime
     crew_id: str
 
-@dataclass
+@dataclass(**_RECORD_OPTIONS)
 class TaskFailure:
     """Represents a failure that triggers need-based improvement"""
     task_id: str
@@ -33,7 +214,7 @@ class TaskFailure:
     agent_id: str
     timestamp: datetime
 
-@dataclass
+@dataclass(**_RECORD_OPTIONS)
 class ImprovementNeed:
     """Identifies specific improvement needs based on user requests"""
     need_id: str
@@ -42,94 +223,324 @@ class ImprovementNeed:
     priority: int  # 1-5, 5 being critical
     evidence: List[str]
     timestamp: datetime
+    agent_id: Optional[str] = None
+
+def _json_default(obj: Any) -> Any:
+    """Encode the non-JSON types found in need-driven records"""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dump(obj: Any) -> bytes:
+    """Serialize a record (or any JSON-compatible structure of them) to JSON bytes
+    
+    Uses orjson's native dataclass/datetime support when installed. Naive
+    datetimes are written as plain ISO strings either way, matching the
+    timestamps stored in SQLite.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_SERIALIZE_DATACLASS)
+    return json.dumps(obj, default=_json_default, separators=(",", ":")).encode()
+
 
 class NeedDrivenEvolution:
     """Evolution engine that responds to actual user needs"""
     
-    def __init__(self):
-        self.task_failures: List[TaskFailure] = []
-        self.improvement_needs: List[ImprovementNeed] = []
-        self.user_requests: List[UserRequest] = []
-        
+    def __init__(self, db_path: Optional[str] = None):
+        if db_path is None:
+            db_path = os.getenv("NDE_DB_PATH", _DEFAULT_DB_PATH)
+        self.db_path = db_path
+        
+        # All in-memory state below is guarded by _state_lock. The hot
+        # windows are bounded deques (O(1) append and eviction); readers get
+        # a tuple snapshot taken under the lock so they never see a deque
+        # mutate mid-iteration.
+        self._state_lock = threading.Lock()
+        
+        # Hot windows of the most recent records (full history is in SQLite)
+        self._task_failures: Deque[TaskFailure] = deque(maxlen=HOT_WINDOW_SIZE)
+        self._improvement_needs: Deque[ImprovementNeed] = deque(maxlen=HOT_WINDOW_SIZE)
+        self._user_requests: Deque[UserRequest] = deque(maxlen=HOT_WINDOW_SIZE)
+        
+        # Needs inside RESEARCH_WINDOW, oldest first, plus a max-priority heap
+        # over the same needs (stale heap entries are dropped lazily)
+        self._recent_needs: deque = deque()
+        self._need_heap: List[Tuple[int, datetime, int, ImprovementNeed]] = []
+        self._need_sequence = itertools.count()
+        
+        # Validated research results, LRU-ordered (see get_cached_research)
+        self._research_exact: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._research_embeds: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._research_matrix: Optional[Tuple[List[str], np.ndarray]] = None
+        
+        self._db_lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._setup_database()
+        self._load_recent_needs()
+    
+    @property
+    def task_failures(self) -> Tuple[TaskFailure, ...]:
+        with self._state_lock:
+            return tuple(self._task_failures)
+    
+    @property
+    def improvement_needs(self) -> Tuple[ImprovementNeed, ...]:
+        with self._state_lock:
+            return tuple(self._improvement_needs)
+    
+    @property
+    def user_requests(self) -> Tuple[UserRequest, ...]:
+        with self._state_lock:
+            return tuple(self._user_requests)
+    
+    def _setup_database(self):
+        """Setup SQLite tables (WAL mode) for persistent need-driven history"""
+        with self._db_lock:
+            cursor = self._conn.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS user_requests (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    request_id TEXT NOT NULL,
+                    user_query TEXT NOT NULL,
+                    required_skills TEXT NOT NULL,
+                    complexity_level TEXT NOT NULL,
+                    crew_id TEXT NOT NULL,
+                    timestamp TEXT NOT NULL
+                )
+            """)
+            
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS task_failures (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    task_id TEXT NOT NULL,
+                    request_id TEXT NOT NULL,
+                    agent_id TEXT NOT NULL,
+                    failure_reason TEXT NOT NULL,
+                    missing_capabilities TEXT NOT NULL,
+                    timestamp TEXT NOT NULL
+                )
+            """)
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_task_failures_agent ON task_failures (agent_id)")
+            
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS improvement_needs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    need_id TEXT NOT NULL,
+                    agent_id TEXT,
+                    skill_gap TEXT NOT NULL,
+                    user_context TEXT NOT NULL,
+                    priority INTEGER NOT NULL,
+                    evidence TEXT NOT NULL,
+                    timestamp TEXT NOT NULL
+                )
+            """)
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_needs_agent_priority ON improvement_needs (agent_id, priority)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_needs_timestamp ON improvement_needs (timestamp)")
+    
+    def _load_recent_needs(self):
+        """Reload needs still inside RESEARCH_WINDOW so research triggers survive restarts"""
+        cutoff = (datetime.now() - RESEARCH_WINDOW).isoformat()
+        with self._db_lock:
+            rows = self._conn.execute("""
+                SELECT need_id, skill_gap, user_context, priority, evidence, timestamp, agent_id
+                FROM improvement_needs WHERE timestamp > ? ORDER BY id
+            """, (cutoff,)).fetchall()
+        
+        with self._state_lock:
+            for need_id, skill_gap, user_context, priority, evidence, timestamp, agent_id in rows:
+                self._track_recent_need(ImprovementNeed(
+                    need_id=need_id,
+                    skill_gap=skill_gap,
+                    user_context=user_context,
+                    priority=priority,
+                    evidence=json.loads(evidence),
+                    timestamp=datetime.fromisoformat(timestamp),
+                    agent_id=agent_id
+                ))
+    
+    def close(self):
+        """Close the SQLite connection"""
+        with self._db_lock:
+            self._conn.close()
+    
+    def _track_recent_need(self, improvement_need: ImprovementNeed):
+        """Add a need to the research window and priority heap (caller holds _state_lock)"""
+        self._recent_needs.append(improvement_need)
+        heapq.heappush(
+            self._need_heap,
+            (-improvement_need.priority, improvement_need.timestamp, next(self._need_sequence), improvement_need)
+        )
+    
     def analyze_user_request(self, user_query: str, crew_id: str) -> UserRequest:
         """Analyze user request to identify required capabilities"""
-        request_id = f"req_{int(datetime.now().timestamp())}"
+        now = datetime.now()
+        request_id = f"req_{_ID_PROCESS_TAG}_{next(_REQ_COUNTER)}"
         
         # Analyze what skills are needed for this request
-        required_skills = self._extract_required_skills(user_query)
-        complexity_level = self._assess_complexity(user_query)
+        # Cached per skeleton, so templated repeats skip the analysis entirely
+        skills, complexity_level = _analyze_query_cached(_request_skeleton(user_query))
+        required_skills = list(skills)
         
         user_request = UserRequest(
             request_id=request_id,
             user_query=user_query,
             required_skills=required_skills,
             complexity_level=complexity_level,
-            timestamp=datetime.now(),
+            timestamp=now,
             crew_id=crew_id
         )
         
-        self.user_requests.append(user_request)
+        with self._state_lock:
+            self._user_requests.append(user_request)
+        with self._db_lock:
+            self._conn.execute("""
+                INSERT INTO user_requests
+                (request_id, user_query, required_skills, complexity_level, crew_id, timestamp)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, (
+                user_request.request_id,
+                user_query,
+                json.dumps(required_skills),
+                complexity_level,
+                crew_id,
+                user_request.timestamp.isoformat()
+            ))
         logger.info(f"Analyzed user request: {required_skills} skills needed")
         
         return user_request
     
     def check_capability_gaps(self, user_request: UserRequest, agent_capabilities: Dict[str, float]) -> List[str]:
         """Check if agent has required capabilities for user request"""
-        gaps = []
-        
-        for required_skill in user_request.required_skills:
-            agent_skill_level = agent_capabilities.get(required_skill, 0.0)
-            
-            # Define minimum thresholds based on complexity
-            min_threshold = {
-                "simple": 0.4,
-                "moderate": 0.6,
-                "complex": 0.8,
-                "expert": 0.9
-            }.get(user_request.complexity_level, 0.6)
-            
-            if agent_skill_level < min_threshold:
-                gaps.append(f"{required_skill} (has {agent_skill_level:.2f}, needs {min_threshold:.2f})")
-        
+        return self.check_capability_gaps_batch([user_request], agent_capabilities)[0]
+    
+    def check_capability_gaps_batch(self, user_requests: List[UserRequest],
+                                    agent_capabilities: Dict[str, float]) -> List[List[str]]:
+        """Capability gaps of one agent for many requests, in a single vectorized comparison"""
+        if not user_requests:
+            return []
+        
+        # Canonical skill columns: every skill required by any request in the batch
+        skill_index = {}
+        for user_request in user_requests:
+            for skill in user_request.required_skills:
+                skill_index.setdefault(skill, len(skill_index))
+        skills = list(skill_index)
+        
+        required = np.zeros((len(user_requests), len(skills)), dtype=bool)
+        for row, user_request in enumerate(user_requests):
+            required[row, [skill_index[skill] for skill in user_request.required_skills]] = True
+        
+        # Define minimum thresholds based on complexity
+        thresholds = np.array([
+            COMPLEXITY_THRESHOLDS.get(user_request.complexity_level, _DEFAULT_THRESHOLD)
+            for user_request in user_requests
+        ])
+        levels = np.array([agent_capabilities.get(skill, 0.0) for skill in skills], dtype=float)
+        
+        gap_mask = required & np.less(levels[None, :], thresholds[:, None])
+        
+        # Report gaps in each request's own skill order
+        gaps: List[List[str]] = []
+        for row, user_request in enumerate(user_requests):
+            row_gaps = gap_mask[row]
+            threshold = thresholds[row]
+            gaps.append([
+                f"{skill} (has {levels[skill_index[skill]]:.2f}, needs {threshold:.2f})"
+                for skill in user_request.required_skills
+                if row_gaps[skill_index[skill]]
+            ])
         return gaps
     
     def record_task_failure(self, user_request: UserRequest, agent_id: str, failure_reason: str, missing_capabilities: List[str]) -> TaskFailure:
         """Record a task failure that triggers improvement needs"""
+        now = datetime.now()
         task_failure = TaskFailure(
-            task_id=f"task_{int(datetime.now().timestamp())}",
+            task_id=f"task_{_ID_PROCESS_TAG}_{next(_TASK_COUNTER)}",
             user_request=user_request,
             failure_reason=failure_reason,
             missing_capabilities=missing_capabilities,
             agent_id=agent_id,
-            timestamp=datetime.now()
+            timestamp=now
         )
         
-        self.task_failures.append(task_failure)
-        
         # Generate improvement need based on failure
-        improvement_need = self._generate_improvement_need(task_failure)
-        self.improvement_needs.append(improvement_need)
+        improvement_need = self._generate_improvement_need(task_failure, now)
+        
+        with self._state_lock:
+            self._task_failures.append(task_failure)
+            self._improvement_needs.append(improvement_need)
+            self._track_recent_need(improvement_need)
+        self._store_failure(task_failure, improvement_need)
         
         logger.info(f"Task failure recorded: {failure_reason}")
         logger.info(f"Improvement need identified: {improvement_need.skill_gap}")
         
         return task_failure
     
+    def _store_failure(self, task_failure: TaskFailure, improvement_need: ImprovementNeed):
+        """Persist a failure and the need it produced in one transaction"""
+        with self._db_lock:
+            cursor = self._conn.cursor()
+            cursor.execute("BEGIN")
+            try:
+                cursor.execute("""
+                    INSERT INTO task_failures
+                    (task_id, request_id, agent_id, failure_reason, missing_capabilities, timestamp)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """, (
+                    task_failure.task_id,
+                    task_failure.user_request.request_id,
+                    task_failure.agent_id,
+                    task_failure.failure_reason,
+                    json.dumps(task_failure.missing_capabilities),
+                    task_failure.timestamp.isoformat()
+                ))
+                cursor.execute("""
+                    INSERT INTO improvement_needs
+                    (need_id, agent_id, skill_gap, user_context, priority, evidence, timestamp)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                """, (
+                    improvement_need.need_id,
+                    improvement_need.agent_id,
+                    improvement_need.skill_gap,
+                    improvement_need.user_context,
+                    improvement_need.priority,
+                    json.dumps(improvement_need.evidence),
+                    improvement_need.timestamp.isoformat()
+                ))
+                cursor.execute("COMMIT")
+            except Exception:
+                cursor.execute("ROLLBACK")
+                raise
+    
     def should_trigger_research(self, agent_id: str) -> Optional[ImprovementNeed]:
         """Check if agent should research improvements based on recent failures"""
         # Look for recent improvement needs for this agent
-        from datetime import timedelta
-        twenty_four_hours_ago = datetime.now() - timedelta(hours=24)
-        recent_needs = [
-            need for need in self.improvement_needs 
-            if need.timestamp > twenty_four_hours_ago
-        ]
+        cutoff = datetime.now() - RESEARCH_WINDOW
+        with self._state_lock:
+            recent_needs = self._recent_needs
+            while recent_needs and recent_needs[0].timestamp <= cutoff:
+                recent_needs.popleft()
+            
+            heap = self._need_heap
+            if len(heap) > 2 * len(recent_needs):
+                # Mostly stale entries buried below the top - rebuild from the window
+                heap[:] = [entry for entry in heap if entry[1] > cutoff]
+                heapq.heapify(heap)
+            while heap and heap[0][1] <= cutoff:
+                heapq.heappop(heap)
+            
+            highest_priority = heap[0][3] if heap else None
         
         # Find highest priority need
-        if recent_needs:
-            highest_priority = max(recent_needs, key=lambda x: x.priority)
-            if highest_priority.priority >= 3:  # Priority 3+ triggers research
-                return highest_priority
+        if highest_priority is not None and highest_priority.priority >= 3:  # Priority 3+ triggers research
+            return highest_priority
         
         return None
     
@@ -139,16 +550,10 @@ class NeedDrivenEvolution:
         user_context = improvement_need.user_context
         
         # Create contextual search query
-        if "creative" in skill_gap.lower():
-            return f"improve creative thinking skills for {user_context}"
-        elif "analytical" in skill_gap.lower():
-            return f"enhance analytical abilities for {user_context}"
-        elif "collaborative" in skill_gap.lower():
-            return f"develop collaboration skills for {user_context}"
-        elif "technical" in skill_gap.lower():
-            return f"build technical expertise for {user_context}"
-        else:
-            return f"improve {skill_gap} skills for {user_context}"
+        match = _RESEARCH_FOCUS_RE.search(skill_gap.lower())
+        if match:
+            return _TRAIT_QUERY_TEMPLATES[match.group(1)].format(user_context=user_context)
+        return f"improve {skill_gap} skills for {user_context}"
     
     def validate_improvement_impact(self, agent_id: str, improvement_need: ImprovementNeed, 
                                   research_results: Dict[str, Any]) -> bool:
@@ -156,23 +561,76 @@ class NeedDrivenEvolution:
         
         # Check if research provides actionable insights for the specific skill gap
         actionable_insights = research_results.get('actionable_insights', [])
-        skill_gap = improvement_need.skill_gap.lower()
+        keywords = frozenset(improvement_need.skill_gap.lower().split())
         
-        relevant_insights = [
-            insight for insight in actionable_insights 
-            if any(keyword in insight.lower() for keyword in skill_gap.split())
-        ]
+        # Research is valid if it provides at least 2 relevant insights, so
+        # stop counting as soon as the second one is found
+        relevant_count = 0
+        for insight in actionable_insights:
+            insight_lower = insight.lower()
+            if any(keyword in insight_lower for keyword in keywords):
+                relevant_count += 1
+                if relevant_count >= 2:
+                    break
         
-        # Research is valid if it provides at least 2 relevant insights
-        is_valid = len(relevant_insights) >= 2
+        is_valid = relevant_count >= 2
         
         if is_valid:
-            logger.info(f"Research validated: {len(relevant_insights)} relevant insights found")
+            logger.info("Research validated: relevant insights found")
+            self._store_research(self.get_research_query_for_need(improvement_need), research_results)
         else:
-            logger.warning(f"Research insufficient: only {len(relevant_insights)} relevant insights")
+            logger.warning(f"Research insufficient: only {relevant_count} relevant insights")
         
         return is_valid
     
+    def get_cached_research(self, improvement_need: ImprovementNeed) -> Optional[Dict[str, Any]]:
+        """Return previously validated research for this need's query (or a near-identical one)"""
+        skeleton = _query_skeleton(self.get_research_query_for_need(improvement_need))
+        key = hashlib.blake2b(skeleton.encode()).hexdigest()
+        
+        with self._state_lock:
+            if key not in self._research_exact:
+                key = self._closest_research_key(_embed_skeleton(skeleton))
+                if key is None:
+                    return None
+            
+            self._research_exact.move_to_end(key)
+            self._research_embeds.move_to_end(key)
+            return self._research_exact[key]
+    
+    def _closest_research_key(self, embedding: np.ndarray) -> Optional[str]:
+        """Cached key whose embedding has cosine >= SEMANTIC_MATCH_THRESHOLD, if any (caller holds _state_lock)"""
+        if not self._research_embeds:
+            return None
+        
+        if self._research_matrix is None:
+            keys = list(self._research_embeds)
+            self._research_matrix = (keys, np.stack([self._research_embeds[k] for k in keys]))
+        keys, matrix = self._research_matrix
+        
+        scores = matrix @ embedding
+        best = int(scores.argmax())
+        return keys[best] if scores[best] >= SEMANTIC_MATCH_THRESHOLD else None
+    
+    def _store_research(self, query: str, research_results: Dict[str, Any]) -> None:
+        """Cache validated research results, evicting the least recently used entry"""
+        skeleton = _query_skeleton(query)
+        key = hashlib.blake2b(skeleton.encode()).hexdigest()
+        embedding = _embed_skeleton(skeleton)
+        
+        with self._state_lock:
+            self._research_exact[key] = research_results
+            self._research_exact.move_to_end(key)
+            if key not in self._research_embeds:
+                self._research_embeds[key] = embedding
+                self._research_matrix = None
+            self._research_embeds.move_to_end(key)
+            
+            while len(self._research_exact) > RESEARCH_CACHE_SIZE:
+                evicted, _ = self._research_exact.popitem(last=False)
+                del self._research_embeds[evicted]
+                self._research_matrix = None
+    
     def create_evolution_plan(self, improvement_need: ImprovementNeed, 
                             research_results: Dict[str, Any]) -> Dict[str, Any]:
         """Create specific evolution plan based on user need and research"""
@@ -181,23 +639,8 @@ class NeedDrivenEvolution:
         actionable_insights = research_results.get('actionable_insights', [])
         
         # Map skill gaps to personality traits
-        trait_mapping = {
-            "creative": "creative",
-            "analytical": "analytical", 
-            "collaborative": "collaborative",
-            "decisive": "decisive",
-            "adaptable": "adaptable",
-            "risk_taking": "risk_taking"
-        }
-        
-        target_trait = None
-        for gap_word, trait in trait_mapping.items():
-            if gap_word in skill_gap.lower():
-                target_trait = trait
-                break
-        
-        if not target_trait:
-            target_trait = "adaptable"  # Default fallback
+        match = _TRAIT_RE.search(skill_gap.lower())
+        target_trait = match.group(1) if match else "adaptable"  # Default fallback
         
         evolution_plan = {
             "trigger_reason": f"User need: {improvement_need.user_context}",
@@ -214,95 +657,74 @@ class NeedDrivenEvolution:
     
     def _extract_required_skills(self, user_query: str) -> List[str]:
         """Extract required skills from user query"""
-        query_lower = user_query.lower()
-        skills = []
-        
-        # Skill detection patterns
-        skill_patterns = {
-            "creative": ["creative", "design", "brainstorm", "innovative", "artistic", "imaginative"],
-            "analytical": ["analyze", "data", "research", "evaluate", "assess", "calculate", "logical"],
-            "collaborative": ["team", "collaborate", "coordinate", "communicate", "together", "group"],
-            "technical": ["code", "program", "technical", "engineering", "development", "system"],
-            "decisive": ["decide", "choose", "select", "recommend", "conclude", "determine"],
-            "leadership": ["lead", "manage", "direct", "guide", "supervise", "organize"]
-        }
-        
-        for skill, keywords in skill_patterns.items():
-            if any(keyword in query_lower for keyword in keywords):
-                skills.append(skill)
-        
-        # If no specific skills detected, assume general problem-solving
-        if not skills:
-            skills = ["analytical", "collaborative"]
-        
-        return skills
+        return list(_extract_required_skills_cached(user_query.lower()))
     
     def _assess_complexity(self, user_query: str) -> str:
         """Assess complexity level of user request"""
-        query_lower = user_query.lower()
-        
-        # Complexity indicators
-        complex_indicators = ["complex", "advanced", "expert", "comprehensive", "detailed", "thorough"]
-        moderate_indicators = ["analyze", "research", "develop", "create", "design", "plan"]
-        simple_indicators = ["simple", "basic", "quick", "easy", "summarize", "list"]
-        
-        if any(indicator in query_lower for indicator in complex_indicators):
-            return "complex"
-        elif any(indicator in query_lower for indicator in moderate_indicators):
-            return "moderate"
-        elif any(indicator in query_lower for indicator in simple_indicators):
-            return "simple"
-        else:
-            return "moderate"  # Default
+        return _assess_complexity_cached(user_query.lower())
     
-    def _generate_improvement_need(self, task_failure: TaskFailure) -> ImprovementNeed:
+    @staticmethod
+    def clear_analysis_cache() -> None:
+        """Drop memoized skill/complexity analyses (e.g. after editing the patterns)"""
+        _analyze_query_cached.cache_clear()
+    
+    def _generate_improvement_need(self, task_failure: TaskFailure,
+                                   now: Optional[datetime] = None) -> ImprovementNeed:
         """Generate improvement need from task failure"""
         
-        # Determine priority based on failure severity and user context
-        priority = 3  # Default medium priority
-        
-        if task_failure.user_request.complexity_level == "complex":
-            priority = 5  # High priority for complex requests
-        elif task_failure.user_request.complexity_level == "simple":
-            priority = 2  # Lower priority for simple requests
-        
-        # Extract primary skill gap
-        primary_gap = task_failure.missing_capabilities[0] if task_failure.missing_capabilities else "general capability"
-        
-        improvement_need = ImprovementNeed(
-            need_id=f"need_{int(datetime.now().timestamp())}",
-            skill_gap=primary_gap,
-            user_context=task_failure.user_request.user_query[:100] + "...",
-            priority=priority,
-            evidence=task_failure.missing_capabilities,
-            timestamp=datetime.now()
+        user_request = task_failure.user_request
+        missing_capabilities = task_failure.missing_capabilities
+        
+        # Priority follows request complexity; the primary gap is the first missing capability
+        return ImprovementNeed(
+            need_id=f"need_{_ID_PROCESS_TAG}_{next(_NEED_COUNTER)}",
+            skill_gap=missing_capabilities[0] if missing_capabilities else "general capability",
+            user_context=user_request.user_query[:100] + "...",
+            priority=_PRIORITY_BY_COMPLEXITY.get(user_request.complexity_level, 3),
+            evidence=missing_capabilities,
+            timestamp=now or datetime.now(),
+            agent_id=task_failure.agent_id
         )
-        
-        return improvement_need
     
     def get_improvement_history(self, agent_id: str) -> Dict[str, Any]:
         """Get history of improvements for specific agent"""
-        agent_failures = [f for f in self.task_failures if f.agent_id == agent_id]
-        agent_needs = [n for n in self.improvement_needs if any(f.agent_id == agent_id for f in self.task_failures if f.task_id in str(n.need_id))]
+        with self._db_lock:
+            cursor = self._conn.cursor()
+            
+            cursor.execute("SELECT COUNT(*) FROM task_failures WHERE agent_id = ?", (agent_id,))
+            total_failures = cursor.fetchone()[0]
+            
+            cursor.execute("SELECT COUNT(*) FROM improvement_needs WHERE agent_id = ?", (agent_id,))
+            total_needs = cursor.fetchone()[0]
+            
+            cursor.execute(
+                "SELECT failure_reason FROM task_failures WHERE agent_id = ? ORDER BY id DESC LIMIT 3",
+                (agent_id,)
+            )
+            recent_failures = [row[0] for row in reversed(cursor.fetchall())]
+            
+            cursor.execute(
+                "SELECT skill_gap FROM improvement_needs WHERE agent_id = ? AND priority >= 3 ORDER BY id",
+                (agent_id,)
+            )
+            active_needs = [row[0] for row in cursor.fetchall()]
+            
+            cursor.execute(
+                "SELECT missing_capabilities FROM task_failures WHERE agent_id = ? ORDER BY id",
+                (agent_id,)
+            )
+            capability_lists = [json.loads(row[0]) for row in cursor.fetchall()]
         
         return {
-            "total_failures": len(agent_failures),
-            "improvement_needs": len(agent_needs),
-            "recent_failures": [f.failure_reason for f in agent_failures[-3:]],
-            "active_needs": [n.skill_gap for n in agent_needs if n.priority >= 3],
-            "learning_focus": self._get_learning_focus(agent_failures)
+            "total_failures": total_failures,
+            "improvement_needs": total_needs,
+            "recent_failures": recent_failures,
+            "active_needs": active_needs,
+            "learning_focus": self._get_learning_focus(capability_lists)
         }
     
-    def _get_learning_focus(self, failures: List[TaskFailure]) -> List[str]:
+    def _get_learning_focus(self, capability_lists: Iterable[List[str]]) -> List[str]:
         """Identify learning focus areas based on failure patterns"""
-        skill_gaps = []
-        for failure in failures:
-            skill_gaps.extend(failure.missing_capabilities)
-        
-        # Count occurrences and return most common gaps
-        gap_counts = {}
-        for gap in skill_gaps:
-            gap_counts[gap] = gap_counts.get(gap, 0) + 1
-        
         # Return top 3 most common gaps
-        return sorted(gap_counts.keys(), key=lambda x: gap_counts[x], reverse=True)[:3]
\ No newline at end of file
+        gap_counts = Counter(itertools.chain.from_iterable(capability_lists))
+        return [gap for gap, _ in gap_counts.most_common(3)]
@@ -1,12 +1,40 @@
 # Project Analysis Agent - Determines Optimal Team Composition
-import json
+import asyncio
+import functools
 import logging
+import re
+import sys
+from collections import Counter
 from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
+from types import MappingProxyType
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the kernels below run as plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
 
 logger = logging.getLogger(__name__)
 
+@njit(cache=True)
+def _score_tokens(token_ids: np.ndarray, weights: np.ndarray) -> int:
+    """Sum the keyword weights of the matched keyword ids"""
+    total = 0
+    for i in range(token_ids.size):
+        total += weights[token_ids[i]]
+    return total
+
+
+# Analyses are deterministic in their inputs; retries re-send the same project
+ANALYSIS_CACHE_SIZE = 256
+
+
 class PersonalityPreset(Enum):
     ANALYTICAL = "analytical"
     CREATIVE = "creative"
@@ -30,7 +58,28 @@ class ProjectDomain(Enum):
     CUSTOMER_SERVICE = "customer_service"
     GENERAL = "general"
 
-@dataclass
+# Analyses and templates are immutable once built; slots drop the per-instance
+# __dict__ (slots=True needs Python 3.10+, older interpreters just get frozen records)
+_RECORD_OPTIONS = {"frozen": True, **({"slots": True} if sys.version_info >= (3, 10) else {})}
+
+# Enum strings resolved once at import: human-readable domain names,
+# complexity values and per-complexity durations
+_DOMAIN_PRETTY = {domain: domain.value.replace('_', ' ') for domain in ProjectDomain}
+_COMPLEXITY_VALUE = {complexity: complexity.value for complexity in ProjectComplexity}
+_BASE_DURATIONS = {
+    ProjectComplexity.SIMPLE: "1-2 weeks",
+    ProjectComplexity.MODERATE: "3-6 weeks",
+    ProjectComplexity.COMPLEX: "2-4 months",
+    ProjectComplexity.ENTERPRISE: "4-12 months"
+}
+
+# The fixed tail of every reasoning string
+_REASONING_SUFFIX = (
+    "This team composition ensures efficient task distribution while maintaining "
+    "effective communication and collaboration."
+)
+
+@dataclass(**_RECORD_OPTIONS)
 class ProjectAnalysis:
     """Results of project analysis"""
     complexity: ProjectComplexity
@@ -42,7 +91,7 @@ class ProjectAnalysis:
     reasoning: str
     confidence_score: float  # 0.0 to 1.0
 
-@dataclass
+@dataclass(**_RECORD_OPTIONS)
 class AgentRecommendation:
     """Recommendation for a specific agent"""
     role: str
@@ -52,183 +101,309 @@ class AgentRecommendation:
     required_skills: List[str]
     priority: int  # 1 = essential, 2 = important, 3 = nice-to-have
 
+# Keyword weights that raise a project's complexity score
+_COMPLEXITY_INDICATORS = MappingProxyType({
+    # Technical indicators
+    "api": 2, "integration": 2, "database": 2, "scalability": 2, "architecture": 2,
+    "microservices": 3, "distributed": 3, "enterprise": 3, "security": 3,
+    "ai": 2, "machine learning": 2, "blockchain": 2, "cloud": 2,
+    
+    # Scale indicators  
+    "multiple": 1, "various": 1, "several": 1, "many": 1, "numerous": 1,
+    "comprehensive": 2, "extensive": 2, "large-scale": 2,
+    "complex": 2, "sophisticated": 2, "advanced": 2, "intricate": 2,
+    
+    # Domain indicators
+    "research": 1, "analysis": 1, "strategy": 1, "planning": 1,
+    "development": 2, "implementation": 2, "deployment": 2,
+    "optimization": 2, "transformation": 2, "migration": 2
+})
+
+_DOMAIN_KEYWORDS = MappingProxyType({
+    ProjectDomain.SOFTWARE_DEVELOPMENT: (
+        "code", "development", "programming", "software", "application", 
+        "api", "database", "frontend", "backend", "mobile", "web"
+    ),
+    ProjectDomain.CONTENT_MARKETING: (
+        "content", "marketing", "social media", "blog", "copywriting",
+        "seo", "campaigns", "branding", "advertising"
+    ),
+    ProjectDomain.DATA_ANALYSIS: (
+        "data", "analytics", "insights", "reporting", "metrics",
+        "visualization", "statistics", "machine learning", "ai"
+    ),
+    ProjectDomain.BUSINESS_STRATEGY: (
+        "strategy", "business", "planning", "growth", "market",
+        "competitive", "operations", "consulting", "transformation"
+    ),
+    ProjectDomain.CREATIVE_DESIGN: (
+        "design", "creative", "visual", "graphics", "ui", "ux",
+        "branding", "artwork", "video", "animation"
+    ),
+    ProjectDomain.RESEARCH: (
+        "research", "investigation", "study", "analysis", "findings",
+        "academic", "scientific", "literature", "survey"
+    )
+})
+
+# Domain-specific skill extraction
+_SKILL_KEYWORDS = MappingProxyType({
+    "programming": ("code", "development", "programming", "software"),
+    "design": ("design", "ui", "ux", "visual", "graphics"),
+    "analysis": ("analysis", "data", "research", "insights"),
+    "writing": ("content", "writing", "copywriting", "blog"),
+    "strategy": ("strategy", "planning", "business", "consulting"),
+    "marketing": ("marketing", "seo", "social", "campaigns"),
+    "project management": ("management", "coordination", "planning", "timeline"),
+    "testing": ("testing", "qa", "quality", "validation"),
+    "deployment": ("deployment", "devops", "infrastructure", "cloud")
+})
+
+
+def _split_by_priority(templates: List[AgentRecommendation]) -> Dict[int, Tuple[AgentRecommendation, ...]]:
+    """Split templates by priority (1 = essential, 2 = important), keeping declaration order"""
+    return {
+        priority: tuple(template for template in templates if template.priority == priority)
+        for priority in (1, 2)
+    }
+
+
+_ROLE_TEMPLATES = MappingProxyType({
+    ProjectDomain.SOFTWARE_DEVELOPMENT: _split_by_priority([
+        AgentRecommendation(
+            role="Technical Architect",
+            goal="Design robust and scalable technical solutions",
+            backstory="Senior software architect with 10+ years designing enterprise systems",
+            personality_preset=PersonalityPreset.ANALYTICAL,
+            required_skills=["system design", "architecture", "technical planning"],
+            priority=1
+        ),
+        AgentRecommendation(
+            role="Lead Developer",
+            goal="Implement high-quality software solutions",
+            backstory="Expert developer skilled in multiple programming languages and frameworks",
+            personality_preset=PersonalityPreset.DECISIVE,
+            required_skills=["programming", "development", "debugging"],
+            priority=1
+        ),
+        AgentRecommendation(
+            role="DevOps Engineer",
+            goal="Ensure smooth deployment and infrastructure management",
+            backstory="DevOps specialist with expertise in CI/CD and cloud platforms",
+            personality_preset=PersonalityPreset.ANALYTICAL,
+            required_skills=["deployment", "infrastructure", "automation"],
+            priority=2
+        ),
+        AgentRecommendation(
+            role="QA Engineer",
+            goal="Ensure software quality and reliability",
+            backstory="Quality assurance expert with comprehensive testing experience",
+            personality_preset=PersonalityPreset.ANALYTICAL,
+            required_skills=["testing", "quality assurance", "validation"],
+            priority=2
+        )
+    ]),
+    ProjectDomain.CONTENT_MARKETING: _split_by_priority([
+        AgentRecommendation(
+            role="Content Strategist",
+            goal="Develop comprehensive content strategies that drive engagement",
+            backstory="Marketing strategist with 8+ years in content planning and audience analysis",
+            personality_preset=PersonalityPreset.ANALYTICAL,
+            required_skills=["strategy", "audience analysis", "content planning"],
+            priority=1
+        ),
+        AgentRecommendation(
+            role="Creative Writer",
+            goal="Create compelling and engaging content",
+            backstory="Talented copywriter with expertise in various content formats",
+            personality_preset=PersonalityPreset.CREATIVE,
+            required_skills=["writing", "creativity", "storytelling"],
+            priority=1
+        ),
+        AgentRecommendation(
+            role="SEO Specialist",
+            goal="Optimize content for search engines and visibility",
+            backstory="SEO expert with deep knowledge of search algorithms and optimization",
+            personality_preset=PersonalityPreset.ANALYTICAL,
+            required_skills=["seo", "keyword research", "optimization"],
+            priority=2
+        ),
+        AgentRecommendation(
+            role="Social Media Manager",
+            goal="Manage social media presence and engagement",
+            backstory="Social media expert with experience across all major platforms",
+            personality_preset=PersonalityPreset.COLLABORATIVE,
+            required_skills=["social media", "community management", "engagement"],
+            priority=2
+        )
+    ]),
+    ProjectDomain.DATA_ANALYSIS: _split_by_priority([
+        AgentRecommendation(
+            role="Data Scientist",
+            goal="Extract insights and patterns from complex datasets",
+            backstory="Data scientist with PhD in statistics and 6+ years industry experience",
+            personality_preset=PersonalityPreset.ANALYTICAL,
+            required_skills=["data analysis", "statistics", "machine learning"],
+            priority=1
+        ),
+        AgentRecommendation(
+            role="Data Engineer",
+            goal="Build and maintain data infrastructure and pipelines",
+            backstory="Data engineering specialist with expertise in ETL and data architecture",
+            personality_preset=PersonalityPreset.ANALYTICAL,
+            required_skills=["data engineering", "etl", "databases"],
+            priority=2
+        ),
+        AgentRecommendation(
+            role="Business Analyst",
+            goal="Translate data insights into business recommendations",
+            backstory="Business analyst with strong background in translating data to business value",
+            personality_preset=PersonalityPreset.COLLABORATIVE,
+            required_skills=["business analysis", "reporting", "communication"],
+            priority=1
+        )
+    ]),
+    ProjectDomain.BUSINESS_STRATEGY: _split_by_priority([
+        AgentRecommendation(
+            role="Strategy Consultant",
+            goal="Develop comprehensive business strategies and recommendations",
+            backstory="Senior strategy consultant with MBA and 12+ years experience",
+            personality_preset=PersonalityPreset.ANALYTICAL,
+            required_skills=["strategic planning", "market analysis", "consulting"],
+            priority=1
+        ),
+        AgentRecommendation(
+            role="Market Researcher",
+            goal="Conduct thorough market research and competitive analysis",
+            backstory="Market research specialist with expertise in industry analysis",
+            personality_preset=PersonalityPreset.ANALYTICAL,
+            required_skills=["market research", "competitive analysis", "data collection"],
+            priority=2
+        ),
+        AgentRecommendation(
+            role="Business Development Manager",
+            goal="Identify growth opportunities and partnership strategies",
+            backstory="Business development expert with proven track record in growth initiatives",
+            personality_preset=PersonalityPreset.DECISIVE,
+            required_skills=["business development", "partnerships", "growth strategy"],
+            priority=2
+        )
+    ])
+})
+
+# Recommendation dicts per domain in selection order, serialized once
+_TEMPLATE_DICTS = {
+    domain: tuple(
+        {
+            "role": agent.role,
+            "goal": agent.goal,
+            "backstory": agent.backstory,
+            "personality_preset": agent.personality_preset.value,
+            "required_skills": list(agent.required_skills),
+            "priority": agent.priority
+        }
+        for agent in by_priority[1] + by_priority[2]
+    )
+    for domain, by_priority in _ROLE_TEMPLATES.items()
+}
+
+# Every keyword of the three tables is found by one scan (ProjectAnalyzer._unified_scan);
+# the structures below turn the matches into results
+_COMPLEXITY_IDS = {kw: i for i, kw in enumerate(_COMPLEXITY_INDICATORS)}
+_COMPLEXITY_WEIGHTS = np.fromiter(_COMPLEXITY_INDICATORS.values(), dtype=np.int32)
+
+
+def _build_skill_bits() -> Dict[str, int]:
+    """Skill keywords as bitmasks over the skill table (bit i = i-th skill)"""
+    skill_bits: Dict[str, int] = {}
+    for bit, keywords in enumerate(_SKILL_KEYWORDS.values()):
+        for keyword in keywords:
+            skill_bits[keyword] = skill_bits.get(keyword, 0) | (1 << bit)
+    return skill_bits
+
+
+_SKILL_BITS = _build_skill_bits()
+# Every possible skill mask mapped to its skill list up front
+_SKILLS_BY_MASK = tuple(
+    tuple(skill for bit, skill in enumerate(_SKILL_KEYWORDS) if mask >> bit & 1)
+    for mask in range(1 << len(_SKILL_KEYWORDS))
+)
+
+# Domain tallies are plain lists indexed by position in _DOMAINS
+_DOMAINS = tuple(_DOMAIN_KEYWORDS)
+
+
+def _build_keyword_domains() -> Dict[str, Tuple[int, ...]]:
+    """Domain positions of each domain keyword ("branding" belongs to two)"""
+    keyword_domains: Dict[str, List[int]] = {}
+    for position, keywords in enumerate(_DOMAIN_KEYWORDS.values()):
+        for keyword in keywords:
+            keyword_domains.setdefault(keyword, []).append(position)
+    return {keyword: tuple(positions) for keyword, positions in keyword_domains.items()}
+
+
+_KEYWORD_DOMAINS = _build_keyword_domains()
+
+_ALL_KEYWORDS = frozenset(_COMPLEXITY_INDICATORS).union(*_DOMAIN_KEYWORDS.values(), *_SKILL_KEYWORDS.values())
+
+# One regex pass tokenizes the text: every word is a token, and a keyword
+# phrase ("machine learning", "large-scale", ...) starting at a word is
+# captured as an extra token without consuming its words ("social" still
+# counts on its own inside "social media")
+_PHRASES = sorted((kw for kw in _ALL_KEYWORDS if not re.fullmatch(r"\w+", kw)), key=len, reverse=True)
+_TOKEN_RE = re.compile(r"\b(?=(" + "|".join(map(re.escape, _PHRASES)) + r")\b)?(\w+)")
+
+
+def _tokenize(text: str) -> Counter:
+    """Occurrence counts of the words and keyword phrases in lowercased text"""
+    counts = Counter()
+    for phrase, word in _TOKEN_RE.findall(text):
+        counts[word] += 1
+        if phrase:
+            counts[phrase] += 1
+    return counts
+
+
+# Score cut-offs (>=) for MODERATE, COMPLEX and ENTERPRISE, used by batch analysis
+_COMPLEXITY_THRESHOLDS = np.array([3, 6, 10], dtype=np.int64)
+_COMPLEXITY_LEVELS = (
+    ProjectComplexity.SIMPLE, ProjectComplexity.MODERATE,
+    ProjectComplexity.COMPLEX, ProjectComplexity.ENTERPRISE
+)
+
+
 class ProjectAnalyzer:
     """
     Intelligent Project Analysis Agent that determines optimal team composition
     """
     
     def __init__(self):
-        self.complexity_indicators = {
-            # Technical indicators
-            "api": 2, "integration": 2, "database": 2, "scalability": 2, "architecture": 2,
-            "microservices": 3, "distributed": 3, "enterprise": 3, "security": 3,
-            "ai": 2, "machine learning": 2, "blockchain": 2, "cloud": 2,
-            
-            # Scale indicators  
-            "multiple": 1, "various": 1, "several": 1, "many": 1, "numerous": 1,
-            "comprehensive": 2, "extensive": 2, "large-scale": 2,
-            "complex": 2, "sophisticated": 2, "advanced": 2, "intricate": 2,
-            
-            # Domain indicators
-            "research": 1, "analysis": 1, "strategy": 1, "planning": 1,
-            "development": 2, "implementation": 2, "deployment": 2,
-            "optimization": 2, "transformation": 2, "migration": 2
-        }
-        
-        self.domain_keywords = {
-            ProjectDomain.SOFTWARE_DEVELOPMENT: [
-                "code", "development", "programming", "software", "application", 
-                "api", "database", "frontend", "backend", "mobile", "web"
-            ],
-            ProjectDomain.CONTENT_MARKETING: [
-                "content", "marketing", "social media", "blog", "copywriting",
-                "seo", "campaigns", "branding", "advertising"
-            ],
-            ProjectDomain.DATA_ANALYSIS: [
-                "data", "analytics", "insights", "reporting", "metrics",
-                "visualization", "statistics", "machine learning", "ai"
-            ],
-            ProjectDomain.BUSINESS_STRATEGY: [
-                "strategy", "business", "planning", "growth", "market",
-                "competitive", "operations", "consulting", "transformation"
-            ],
-            ProjectDomain.CREATIVE_DESIGN: [
-                "design", "creative", "visual", "graphics", "ui", "ux",
-                "branding", "artwork", "video", "animation"
-            ],
-            ProjectDomain.RESEARCH: [
-                "research", "investigation", "study", "analysis", "findings",
-                "academic", "scientific", "literature", "survey"
-            ]
-        }
-        
-        self.role_templates = {
-            ProjectDomain.SOFTWARE_DEVELOPMENT: [
-                AgentRecommendation(
-                    role="Technical Architect",
-                    goal="Design robust and scalable technical solutions",
-                    backstory="Senior software architect with 10+ years designing enterprise systems",
-                    personality_preset=PersonalityPreset.ANALYTICAL,
-                    required_skills=["system design", "architecture", "technical planning"],
-                    priority=1
-                ),
-                AgentRecommendation(
-                    role="Lead Developer", 
-                    goal="Implement high-quality software solutions",
-                    backstory="Expert developer skilled in multiple programming languages and frameworks",
-                    personality_preset=PersonalityPreset.DECISIVE,
-                    required_skills=["programming", "development", "debugging"],
-                    priority=1
-                ),
-                AgentRecommendation(
-                    role="DevOps Engineer",
-                    goal="Ensure smooth deployment and infrastructure management",
-                    backstory="DevOps specialist with expertise in CI/CD and cloud platforms",
-                    personality_preset=PersonalityPreset.ANALYTICAL,
-                    required_skills=["deployment", "infrastructure", "automation"],
-                    priority=2
-                ),
-                AgentRecommendation(
-                    role="QA Engineer",
-                    goal="Ensure software quality and reliability",
-                    backstory="Quality assurance expert with comprehensive testing experience",
-                    personality_preset=PersonalityPreset.ANALYTICAL,
-                    required_skills=["testing", "quality assurance", "validation"],
-                    priority=2
-                )
-            ],
-            ProjectDomain.CONTENT_MARKETING: [
-                AgentRecommendation(
-                    role="Content Strategist",
-                    goal="Develop comprehensive content strategies that drive engagement",
-                    backstory="Marketing strategist with 8+ years in content planning and audience analysis",
-                    personality_preset=PersonalityPreset.ANALYTICAL,
-                    required_skills=["strategy", "audience analysis", "content planning"],
-                    priority=1
-                ),
-                AgentRecommendation(
-                    role="Creative Writer",
-                    goal="Create compelling and engaging content",
-                    backstory="Talented copywriter with expertise in various content formats",
-                    personality_preset=PersonalityPreset.CREATIVE,
-                    required_skills=["writing", "creativity", "storytelling"],
-                    priority=1
-                ),
-                AgentRecommendation(
-                    role="SEO Specialist",
-                    goal="Optimize content for search engines and visibility",
-                    backstory="SEO expert with deep knowledge of search algorithms and optimization",
-                    personality_preset=PersonalityPreset.ANALYTICAL,
-                    required_skills=["seo", "keyword research", "optimization"],
-                    priority=2
-                ),
-                AgentRecommendation(
-                    role="Social Media Manager",
-                    goal="Manage social media presence and engagement",
-                    backstory="Social media expert with experience across all major platforms",
-                    personality_preset=PersonalityPreset.COLLABORATIVE,
-                    required_skills=["social media", "community management", "engagement"],
-                    priority=2
-                )
-            ],
-            ProjectDomain.DATA_ANALYSIS: [
-                AgentRecommendation(
-                    role="Data Scientist",
-                    goal="Extract insights and patterns from complex datasets",
-                    backstory="Data scientist with PhD in statistics and 6+ years industry experience",
-                    personality_preset=PersonalityPreset.ANALYTICAL,
-                    required_skills=["data analysis", "statistics", "machine learning"],
-                    priority=1
-                ),
-                AgentRecommendation(
-                    role="Data Engineer",
-                    goal="Build and maintain data infrastructure and pipelines",
-                    backstory="Data engineering specialist with expertise in ETL and data architecture",
-                    personality_preset=PersonalityPreset.ANALYTICAL,
-                    required_skills=["data engineering", "etl", "databases"],
-                    priority=2
-                ),
-                AgentRecommendation(
-                    role="Business Analyst",
-                    goal="Translate data insights into business recommendations",
-                    backstory="Business analyst with strong background in translating data to business value",
-                    personality_preset=PersonalityPreset.COLLABORATIVE,
-                    required_skills=["business analysis", "reporting", "communication"],
-                    priority=1
-                )
-            ],
-            ProjectDomain.BUSINESS_STRATEGY: [
-                AgentRecommendation(
-                    role="Strategy Consultant",
-                    goal="Develop comprehensive business strategies and recommendations",
-                    backstory="Senior strategy consultant with MBA and 12+ years experience",
-                    personality_preset=PersonalityPreset.ANALYTICAL,
-                    required_skills=["strategic planning", "market analysis", "consulting"],
-                    priority=1
-                ),
-                AgentRecommendation(
-                    role="Market Researcher",
-                    goal="Conduct thorough market research and competitive analysis",
-                    backstory="Market research specialist with expertise in industry analysis",
-                    personality_preset=PersonalityPreset.ANALYTICAL,
-                    required_skills=["market research", "competitive analysis", "data collection"],
-                    priority=2
-                ),
-                AgentRecommendation(
-                    role="Business Development Manager",
-                    goal="Identify growth opportunities and partnership strategies",
-                    backstory="Business development expert with proven track record in growth initiatives",
-                    personality_preset=PersonalityPreset.DECISIVE,
-                    required_skills=["business development", "partnerships", "growth strategy"],
-                    priority=2
-                )
-            ]
-        }
+        # Keyword tables and role templates are shared read-only module constants
+        self.complexity_indicators = _COMPLEXITY_INDICATORS
+        self.domain_keywords = _DOMAIN_KEYWORDS
+        self.skill_keywords = _SKILL_KEYWORDS
+        self.role_templates = _ROLE_TEMPLATES
+        
+        # Per-instance memo of complete analyses (see analyze_project)
+        self._analyze_cached = functools.lru_cache(maxsize=ANALYSIS_CACHE_SIZE)(self._analyze_signature)
 
     async def analyze_project(self, project_description: str, 
                             project_goals: List[str] = None,
                             constraints: Dict[str, Any] = None) -> ProjectAnalysis:
         """
+        Analyze project requirements without blocking the event loop
+        
+        The analysis is CPU-bound, so it runs in a worker thread; see
+        analyze_project_sync for the arguments.
+        """
+        return await asyncio.to_thread(
+            self.analyze_project_sync, project_description, project_goals, constraints
+        )
+
+    def analyze_project_sync(self, project_description: str,
+                             project_goals: List[str] = None,
+                             constraints: Dict[str, Any] = None) -> ProjectAnalysis:
+        """
         Analyze project requirements and determine optimal team composition
         
         Args:
@@ -239,16 +414,93 @@ class ProjectAnalyzer:
         Returns:
             ProjectAnalysis with recommended team composition
         """
-        logger.info(f"Analyzing project: {project_description[:100]}...")
+        # Guarded, lazily formatted logging: nothing is built when INFO is off
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Analyzing project: %s...", project_description[:100])
+        
+        signature = (
+            project_description,
+            tuple(project_goals) if project_goals else None,
+            tuple(sorted(constraints.items())) if constraints else None
+        )
+        try:
+            hash(signature)
+        except TypeError:  # unhashable goals/constraints - analyze without caching
+            return self._analyze(project_description, project_goals, constraints)
+        
+        # Cached analyses are shared; hand each caller its own lists and dicts
+        analysis = self._analyze_cached(*signature)
+        return replace(
+            analysis,
+            required_skills=list(analysis.required_skills),
+            recommended_agents=[
+                {**agent, "required_skills": list(agent["required_skills"])}
+                for agent in analysis.recommended_agents
+            ]
+        )
+
+    def _analyze_signature(self, project_description: str,
+                           project_goals: Optional[Tuple[str, ...]],
+                           constraints: Optional[Tuple[Tuple[str, Any], ...]]) -> ProjectAnalysis:
+        """Cache entry point: rebuild the call arguments from their hashable form"""
+        return self._analyze(
+            project_description,
+            list(project_goals) if project_goals is not None else None,
+            dict(constraints) if constraints is not None else None
+        )
+
+    def _analyze(self, project_description: str,
+                 project_goals: List[str] = None,
+                 constraints: Dict[str, Any] = None) -> ProjectAnalysis:
+        """Run the full analysis pipeline"""
+        
+        # Lowercase and tokenize description + goals, then find every keyword in one pass
+        text, tokens = self._prepare_text(project_description, project_goals)
+        matched, domain_scores = self._unified_scan(text, tokens)
         
         # Analyze project complexity
-        complexity = self._assess_complexity(project_description, project_goals)
+        complexity = self._assess_complexity(text, matched)
+        
+        return self._build_analysis(project_description, constraints, complexity, matched, domain_scores)
+
+    def analyze_projects(self, project_descriptions: List[str],
+                         project_goals: List[Optional[List[str]]] = None,
+                         constraints: Dict[str, Any] = None) -> List[ProjectAnalysis]:
+        """
+        Analyze a batch of projects, scoring their complexity together
+        
+        Args:
+            project_descriptions: One description per project
+            project_goals: Goals per project, parallel to the descriptions (optional)
+            constraints: Constraints applied to every project in the batch
+            
+        Returns:
+            One ProjectAnalysis per description, in order
+        """
+        goals_per_project = project_goals or [None] * len(project_descriptions)
+        scans = []
+        for description, goals in zip(project_descriptions, goals_per_project):
+            text, tokens = self._prepare_text(description, goals)
+            scans.append((text,) + self._unified_scan(text, tokens))
+        
+        complexities = self._assess_complexities([text for text, _, _ in scans], [matched for _, matched, _ in scans])
+        
+        return [
+            self._build_analysis(description, constraints, complexity, matched, domain_scores)
+            for description, complexity, (_, matched, domain_scores)
+            in zip(project_descriptions, complexities, scans)
+        ]
+
+    def _build_analysis(self, project_description: str, constraints: Optional[Dict[str, Any]],
+                        complexity: ProjectComplexity, matched: frozenset,
+                        domain_scores: List[int]) -> ProjectAnalysis:
+        """Turn a scanned project into its recommendations"""
         
         # Determine project domain
-        domain = self._identify_domain(project_description, project_goals)
+        domain = self._identify_domain(domain_scores)
         
         # Extract required skills
-        required_skills = self._extract_required_skills(project_description, project_goals, domain)
+        required_skills = self._extract_required_skills(matched, domain)
         
         # Determine optimal agent count based on complexity and domain
         agent_count = self._calculate_optimal_agent_count(complexity, domain, constraints)
@@ -273,15 +525,35 @@ class ProjectAnalyzer:
             confidence_score=confidence
         )
         
-        logger.info(f"Analysis complete: {agent_count} agents recommended for {complexity.value} {domain.value} project")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Analysis complete: %d agents recommended for %s %s project",
+                        agent_count, _COMPLEXITY_VALUE[complexity], _DOMAIN_PRETTY[domain])
         return analysis
 
-    def _assess_complexity(self, description: str, goals: List[str] = None) -> ProjectComplexity:
-        """Assess project complexity based on description and goals"""
+    def _prepare_text(self, description: str, goals: List[str] = None) -> Tuple[str, Counter]:
+        """Lowercased description + goals and the counts of words and keyword phrases in it"""
         text = description.lower()
         if goals:
             text += " " + " ".join(goals).lower()
+        return text, _tokenize(text)
+
+    def _unified_scan(self, text: str, tokens: Counter) -> Tuple[frozenset, List[int]]:
+        """Keywords present in the text and per-domain keyword occurrence counts
         
+        Keywords (words and phrases alike) only count as whole tokens, so
+        "ai" is not found inside "detail". Counts follow _DOMAINS order.
+        """
+        matched = frozenset(tokens.keys() & _ALL_KEYWORDS)
+        
+        domain_scores = [0] * len(_DOMAINS)
+        for keyword in matched & _KEYWORD_DOMAINS.keys():
+            occurrences = tokens[keyword]
+            for domain in _KEYWORD_DOMAINS[keyword]:
+                domain_scores[domain] += occurrences
+        return matched, domain_scores
+
+    def _assess_complexity(self, text: str, matched: frozenset) -> ProjectComplexity:
+        """Assess project complexity from the prepared text and the keywords found in it"""
         complexity_score = 0
         word_count = len(text.split())
         
@@ -292,9 +564,11 @@ class ProjectAnalyzer:
             complexity_score += 1
             
         # Keyword-based complexity scoring
-        for keyword, score in self.complexity_indicators.items():
-            if keyword in text:
-                complexity_score += score
+        keyword_ids = _COMPLEXITY_IDS
+        matched_ids = np.fromiter(
+            (keyword_ids[keyword] for keyword in matched & keyword_ids.keys()), dtype=np.int32
+        )
+        complexity_score += int(_score_tokens(matched_ids, _COMPLEXITY_WEIGHTS))
         
         # Determine complexity level
         if complexity_score >= 10:
@@ -306,51 +580,47 @@ class ProjectAnalyzer:
         else:
             return ProjectComplexity.SIMPLE
 
-    def _identify_domain(self, description: str, goals: List[str] = None) -> ProjectDomain:
-        """Identify the primary project domain"""
-        text = description.lower()
-        if goals:
-            text += " " + " ".join(goals).lower()
-        
-        domain_scores = {}
-        
-        for domain, keywords in self.domain_keywords.items():
-            score = 0
-            for keyword in keywords:
-                if keyword in text:
-                    score += text.count(keyword)
-            domain_scores[domain] = score
-        
-        # Return domain with highest score, or GENERAL if no clear match
-        best_domain = max(domain_scores, key=domain_scores.get)
-        return best_domain if domain_scores[best_domain] > 0 else ProjectDomain.GENERAL
+    def _assess_complexities(self, texts: List[str], matched_per_text: List[frozenset]) -> List[ProjectComplexity]:
+        """Vectorized _assess_complexity for a batch of prepared texts"""
+        # Flatten matched complexity keyword ids, tagging each with its document
+        keyword_ids = _COMPLEXITY_IDS
+        doc_index: List[int] = []
+        matched_ids: List[int] = []
+        for doc, matched in enumerate(matched_per_text):
+            ids = [keyword_ids[keyword] for keyword in matched & keyword_ids.keys()]
+            matched_ids.extend(ids)
+            doc_index.extend([doc] * len(ids))
+        
+        scores = np.bincount(
+            np.asarray(doc_index, dtype=np.intp),
+            weights=_COMPLEXITY_WEIGHTS[np.asarray(matched_ids, dtype=np.intp)],
+            minlength=len(texts)
+        ).astype(np.int64)
+        
+        # Base complexity from length: +1 above 100 words, +2 above 200
+        word_counts = np.fromiter((len(text.split()) for text in texts), dtype=np.int64, count=len(texts))
+        scores += (word_counts > 100).astype(np.int64) + (word_counts > 200)
+        
+        levels = np.searchsorted(_COMPLEXITY_THRESHOLDS, scores, side="right")
+        return [_COMPLEXITY_LEVELS[level] for level in levels]
 
-    def _extract_required_skills(self, description: str, goals: List[str], domain: ProjectDomain) -> List[str]:
-        """Extract required skills from project description"""
-        text = description.lower()
-        if goals:
-            text += " " + " ".join(goals).lower()
-        
-        skills = set()
-        
-        # Domain-specific skill extraction
-        skill_keywords = {
-            "programming": ["code", "development", "programming", "software"],
-            "design": ["design", "ui", "ux", "visual", "graphics"],
-            "analysis": ["analysis", "data", "research", "insights"],
-            "writing": ["content", "writing", "copywriting", "blog"],
-            "strategy": ["strategy", "planning", "business", "consulting"],
-            "marketing": ["marketing", "seo", "social", "campaigns"],
-            "project management": ["management", "coordination", "planning", "timeline"],
-            "testing": ["testing", "qa", "quality", "validation"],
-            "deployment": ["deployment", "devops", "infrastructure", "cloud"]
-        }
-        
-        for skill, keywords in skill_keywords.items():
-            if any(keyword in text for keyword in keywords):
-                skills.add(skill)
-        
-        return list(skills)
+    def _identify_domain(self, domain_scores: List[int]) -> ProjectDomain:
+        """Identify the primary project domain from per-domain keyword counts"""
+        # Domain with highest score (first one on ties), or GENERAL if no clear match
+        best_domain = ProjectDomain.GENERAL
+        best_score = 0
+        for domain, score in zip(_DOMAINS, domain_scores):
+            if score > best_score:
+                best_domain, best_score = domain, score
+        return best_domain
+
+    def _extract_required_skills(self, matched: frozenset, domain: ProjectDomain) -> List[str]:
+        """Extract required skills from the keywords found in the project text"""
+        skill_bits = _SKILL_BITS
+        mask = 0
+        for keyword in matched & skill_bits.keys():
+            mask |= skill_bits[keyword]
+        return list(_SKILLS_BY_MASK[mask])
 
     def _calculate_optimal_agent_count(self, complexity: ProjectComplexity, 
                                      domain: ProjectDomain, 
@@ -387,63 +657,39 @@ class ProjectAnalyzer:
     def _recommend_agents(self, domain: ProjectDomain, required_skills: List[str], 
                          agent_count: int, complexity: ProjectComplexity) -> List[Dict[str, Any]]:
         """Generate specific agent recommendations"""
-        recommendations = []
-        
         # Get domain-specific templates
-        templates = self.role_templates.get(domain, [])
+        templates = _TEMPLATE_DICTS.get(domain)
         
         if not templates:
             # Generate generic agents for unknown domains
             return self._generate_generic_agents(agent_count, required_skills)
         
-        # Sort by priority and select best fit
-        templates.sort(key=lambda x: x.priority)
-        
-        selected_agents = []
-        used_roles = set()
-        
-        # First, add essential agents (priority 1)
-        for template in templates:
-            if template.priority == 1 and len(selected_agents) < agent_count:
-                if template.role not in used_roles:
-                    selected_agents.append(template)
-                    used_roles.add(template.role)
-        
-        # Then add important agents (priority 2) if we have space
-        for template in templates:
-            if template.priority == 2 and len(selected_agents) < agent_count:
-                if template.role not in used_roles:
-                    selected_agents.append(template)
-                    used_roles.add(template.role)
-        
-        # Convert to dict format
-        for agent in selected_agents:
-            recommendations.append({
-                "role": agent.role,
-                "goal": agent.goal,
-                "backstory": agent.backstory,
-                "personality_preset": agent.personality_preset.value,
-                "required_skills": agent.required_skills,
-                "priority": agent.priority
-            })
+        # The final size is known, so fill a preallocated list by index
+        recommendations: List[Dict[str, Any]] = [None] * agent_count
+        
+        # Essential agents (priority 1) first, then important agents (priority 2) if we have space
+        filled = min(agent_count, len(templates))
+        for i in range(filled):
+            template = templates[i]
+            # Copy the skills list too; templates are shared module state
+            recommendations[i] = {**template, "required_skills": list(template["required_skills"])}
         
         # Fill remaining slots with generic agents if needed
-        while len(recommendations) < agent_count:
-            generic_role = f"Specialist_{len(recommendations) + 1}"
-            recommendations.append({
-                "role": generic_role,
-                "goal": f"Provide specialized expertise for project requirements",
-                "backstory": f"Experienced professional with domain expertise",
+        for i in range(filled, agent_count):
+            recommendations[i] = {
+                "role": f"Specialist_{i + 1}",
+                "goal": "Provide specialized expertise for project requirements",
+                "backstory": "Experienced professional with domain expertise",
                 "personality_preset": PersonalityPreset.COLLABORATIVE.value,
                 "required_skills": required_skills[:3] if required_skills else ["general"],
                 "priority": 3
-            })
+            }
         
-        return recommendations[:agent_count]
+        return recommendations
 
     def _generate_generic_agents(self, agent_count: int, required_skills: List[str]) -> List[Dict[str, Any]]:
         """Generate generic agents when domain is unknown"""
-        agents = []
+        agents: List[Dict[str, Any]] = [None] * agent_count
         
         base_roles = [
             ("Project Lead", PersonalityPreset.DECISIVE, "Lead project execution and coordinate team efforts"),
@@ -456,14 +702,14 @@ class ProjectAnalyzer:
             role_info = base_roles[i % len(base_roles)]
             role_name = f"{role_info[0]}_{i+1}" if i >= len(base_roles) else role_info[0]
             
-            agents.append({
+            agents[i] = {
                 "role": role_name,
                 "goal": role_info[2],
-                "backstory": f"Experienced professional with expertise in project requirements",
+                "backstory": "Experienced professional with expertise in project requirements",
                 "personality_preset": role_info[1].value,
                 "required_skills": required_skills[:3] if required_skills else ["general"],
                 "priority": 1 if i < 2 else 2
-            })
+            }
         
         return agents
 
@@ -492,32 +738,31 @@ class ProjectAnalyzer:
     def _generate_reasoning(self, complexity: ProjectComplexity, domain: ProjectDomain,
                           agent_count: int, required_skills: List[str]) -> str:
         """Generate human-readable reasoning for the recommendations"""
-        reasoning = f"Based on the project analysis, this appears to be a {complexity.value} "
-        reasoning += f"{domain.value.replace('_', ' ')} project. "
-        
-        reasoning += f"The recommended team of {agent_count} agents provides the optimal balance "
-        reasoning += f"of skills and coordination for this complexity level. "
+        parts = [
+            "Based on the project analysis, this appears to be a ", _COMPLEXITY_VALUE[complexity], " ",
+            _DOMAIN_PRETTY[domain], " project. The recommended team of ", str(agent_count),
+            " agents provides the optimal balance of skills and coordination for this complexity level. "
+        ]
         
         if required_skills:
-            reasoning += f"Key skills identified include: {', '.join(required_skills[:5])}. "
-        
-        reasoning += f"This team composition ensures efficient task distribution while maintaining "
-        reasoning += f"effective communication and collaboration."
+            parts += ["Key skills identified include: ", ", ".join(required_skills[:5]), ". "]
         
-        return reasoning
+        parts.append(_REASONING_SUFFIX)
+        return "".join(parts)
 
     def _estimate_duration(self, complexity: ProjectComplexity, agent_count: int) -> str:
         """Estimate project duration based on complexity and team size"""
-        base_durations = {
-            ProjectComplexity.SIMPLE: "1-2 weeks",
-            ProjectComplexity.MODERATE: "3-6 weeks", 
-            ProjectComplexity.COMPLEX: "2-4 months",
-            ProjectComplexity.ENTERPRISE: "4-12 months"
-        }
-        
-        return base_durations[complexity]
+        return _BASE_DURATIONS[complexity]
+
+# Process-wide analyzer shared by create_project_analyzer() callers
+_SINGLETON: Optional[ProjectAnalyzer] = None
 
 # Factory function for creating project analyzer
-def create_project_analyzer() -> ProjectAnalyzer:
-    """Create and return a ProjectAnalyzer instance"""
-    return ProjectAnalyzer()
\ No newline at end of file
+def create_project_analyzer(fresh: bool = False) -> ProjectAnalyzer:
+    """Return the shared ProjectAnalyzer instance (a new, unshared one if fresh=True)"""
+    global _SINGLETON
+    if fresh:
+        return ProjectAnalyzer()
+    if _SINGLETON is None:
+        _SINGLETON = ProjectAnalyzer()
+    return _SINGLETON
@@ -4,22 +4,147 @@
 Phase 1 Critical Security Implementation
 """
 
+import binascii
 import hashlib
 import hmac
+import json
 import jwt
 import secrets
+import string
+import threading
 import time
-from datetime import datetime, timedelta, timezone
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from typing import Dict, List, Optional, Any, Callable
 from pathlib import Path
-import re
 import logging
-from functools import wraps
+from functools import lru_cache, wraps
 from pydantic import BaseModel, Field, validator
+import numpy as np
 import os
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the kernel below runs as plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; JWT payloads fall back to the stdlib encoder
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+_NS_PER_SECOND = 1_000_000_000
+_MINUTE_NS = 60 * _NS_PER_SECOND
+_HOUR_NS = 60 * _MINUTE_NS
+
+
+def _ns_to_datetime(ns: int) -> datetime:
+    """Epoch nanoseconds to an aware UTC datetime"""
+    return datetime.fromtimestamp(ns / _NS_PER_SECOND, timezone.utc)
+
+
+
+_B64_URLSAFE = bytes.maketrans(b'+/', b'-_')
+
+
+def _b64url(data: bytes) -> bytes:
+    """Unpadded base64url, as used in JWT segments"""
+    return binascii.b2a_base64(data, newline=False).translate(_B64_URLSAFE).rstrip(b'=')
+
+
+_B64_STANDARD = bytes.maketrans(b'-_', b'+/')
+
+
+def _b64url_decode(data: bytes) -> bytes:
+    """Inverse of _b64url; raises binascii.Error (a ValueError) on bad input"""
+    return binascii.a2b_base64(data.translate(_B64_STANDARD) + b'=' * (-len(data) % 4))
+
+
+def _dump_jwt_payload(payload: Dict[str, Any]) -> bytes:
+    """Compact JSON bytes for a JWT payload, identical to PyJWT's encoding
+    
+    PyJWT uses json.dumps with its default ensure_ascii=True. orjson writes
+    the same bytes for ASCII-only claims, so it is used whenever its output
+    is ASCII and the stdlib encoder escapes the rest.
+    """
+    if orjson is not None:
+        data = orjson.dumps(payload)
+        if data.isascii():
+            return data
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+
+def _load_json(data: bytes) -> Any:
+    """Parse JSON bytes; decode errors are ValueError subclasses either way"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# HS256 is HMAC-SHA256 by definition, independent of SecurityConfig.HASH_IMPL
+_HS256_DIGEST = hashlib.sha256
+
+
+@lru_cache(maxsize=4)
+def _jwt_hmac(secret: str) -> hmac.HMAC:
+    """Keyed HMAC-SHA256 template for JWT signing; callers .copy() it per token
+    
+    Copying reuses the already-hashed inner/outer key pads, so signing or
+    verifying a token costs only the message blocks. Keyed on the secret so
+    a rotated SecurityConfig.JWT_SECRET_KEY takes effect immediately.
+    """
+    return hmac.new(secret.encode(), digestmod=_HS256_DIGEST)
+
+# Constant JWT header segment for HS256 (same bytes PyJWT emits)
+_HS256_HEADER_B64 = _b64url(json.dumps({"alg": "HS256", "typ": "JWT"}, separators=(",", ":")).encode())
+
+# Sandbox for file exports, resolved once (resolve() is a realpath syscall)
+EXPORT_DIR = (Path(__file__).parent.parent.parent / "exported_results").resolve()
+
+
+@lru_cache(maxsize=8)
+def _resolved_base_dir(base_dir: Path) -> Path:
+    return base_dir.resolve()
+
+
+# str.translate table dropping control characters other than \t, \n and \r
+_CTRL_TABLE = dict.fromkeys(i for i in range(32) if i not in (9, 10, 13))
+
+
+@njit(
+    "Tuple((boolean, int64, int64, int64))(int64[:], int64, int64, int64, int64, int64)",
+    cache=True,
+    nogil=True,
+)
+def _rate_limit_check(timestamps, head, count, now_ns, limit, burst_limit):
+    """Prune the hourly window and decide whether a request is allowed
+
+    Returns ``(allowed, new_head, new_count, blocked_until_ns)``; a non-zero
+    ``blocked_until_ns`` means the hourly limit was hit.
+    """
+    cutoff = now_ns - _HOUR_NS
+    while count > 0 and timestamps[head] <= cutoff:
+        head += 1
+        count -= 1
+    
+    if count >= limit:
+        return False, head, count, now_ns + _HOUR_NS
+    
+    burst_cutoff = now_ns - _MINUTE_NS
+    recent = 0
+    i = head + count - 1
+    while recent < burst_limit and i >= head and timestamps[i] > burst_cutoff:
+        recent += 1
+        i -= 1
+    
+    return recent < burst_limit, head, count, 0
+
 class SecurityConfig:
     """Security configuration constants"""
     # Authentication
@@ -27,19 +152,39 @@ class SecurityConfig:
     JWT_ALGORITHM = "HS256"
     JWT_EXPIRATION_HOURS = 24
     API_KEY_LENGTH = 32
+    # hashlib is OpenSSL-backed, which already dispatches to SHA-NI / ARMv8
+    # SHA2 instructions via CPUID, so the stock constructor is the fast path.
+    HASH_IMPL = hashlib.sha256
+    # Keyed tag for API key lookup; truncated to 128 bits
+    API_KEY_SECRET = os.getenv("MCP_API_KEY_SECRET", secrets.token_urlsafe(32)).encode()
+    API_KEY_TAG_BYTES = 16
     
     # Rate limiting
     DEFAULT_RATE_LIMIT = 100  # requests per hour
     BURST_LIMIT = 10  # requests per minute
+    RATE_LIMIT_SHARDS = 16  # power of two; client table shards, one lock each
     
     # File system security
-    ALLOWED_EXTENSIONS = {'.txt', '.json', '.md', '.csv', '.log'}
+    ALLOWED_EXTENSIONS = frozenset({'.txt', '.json', '.md', '.csv', '.log'})
     MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
-    SAFE_PATH_PATTERN = re.compile(r'^[a-zA-Z0-9._/-]+$')
+    SAFE_PATH_CHARS = (string.ascii_letters + string.digits + '._/-').encode('ascii')
     
     # Input validation
     MAX_STRING_LENGTH = 10000
     MAX_LIST_LENGTH = 1000
+    MAX_JSON_BYTES = 1024 * 1024  # raw payloads for validate_json_bytes
+
+
+def _api_key_tag_bytes(raw_key: bytes) -> bytes:
+    """Truncated HMAC tag of an encoded API key under the server secret"""
+    return hmac.new(
+        SecurityConfig.API_KEY_SECRET, raw_key, SecurityConfig.HASH_IMPL
+    ).digest()[:SecurityConfig.API_KEY_TAG_BYTES]
+
+
+def _api_key_tag(raw_key: str) -> bytes:
+    """Truncated HMAC tag of an API key under the server secret"""
+    return _api_key_tag_bytes(raw_key.encode())
 
 
 class AuthenticationError(Exception):
@@ -74,11 +219,45 @@ class APIKey(BaseModel):
     last_used: Optional[datetime] = None
 
 
-class RateLimitEntry(BaseModel):
-    """Rate limiting tracking"""
+@dataclass
+class RateLimitEntry:
+    """Rate limiting tracking
+
+    Request times are epoch nanoseconds, kept sorted in
+    ``timestamps[head:head + count]``. Pruning only advances ``head``; the
+    live window is moved back to the front once it reaches the end of the
+    buffer, so appends are amortized O(1).
+    """
     client_id: str
-    requests: List[datetime] = Field(default_factory=list)
-    blocked_until: Optional[datetime] = None
+    timestamps: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64))
+    head: int = 0
+    count: int = 0
+    blocked_until_ns: Optional[int] = None
+    
+    def window(self) -> np.ndarray:
+        """Live request timestamps, oldest first"""
+        return self.timestamps[self.head:self.head + self.count]
+    
+    def prune(self, cutoff_ns: int) -> int:
+        """Drop requests at or before cutoff_ns; returns the remaining count"""
+        expired = int(np.searchsorted(self.window(), cutoff_ns, side='right'))
+        self.head += expired
+        self.count -= expired
+        return self.count
+    
+    def append(self, timestamp_ns: int, capacity: int) -> None:
+        """Record a request, sizing the buffer for `capacity` live entries"""
+        if self.head + self.count >= len(self.timestamps):
+            size = max(2 * capacity, self.count + 1)
+            if len(self.timestamps) < size:
+                buffer = np.empty(size, dtype=np.int64)
+                buffer[:self.count] = self.window()
+                self.timestamps = buffer
+            else:
+                self.timestamps[:self.count] = self.window()
+            self.head = 0
+        self.timestamps[self.head + self.count] = timestamp_ns
+        self.count += 1
 
 
 class SecurityValidator:
@@ -94,8 +273,10 @@ class SecurityValidator:
             raise ValidationError(f"String too long: {len(value)} > {max_length}")
         
         # Remove null bytes and control characters
-        cleaned = ''.join(char for char in value if ord(char) >= 32 or char in '\t\n\r')
-        return cleaned
+        if value.isprintable():
+            # str() is a no-op for exact str; subclasses still come back as str
+            return str(value)
+        return value.translate(_CTRL_TABLE)
     
     @staticmethod
     def validate_path(path: str, base_dir: Optional[Path] = None) -> Path:
@@ -107,7 +288,9 @@ class SecurityValidator:
         if '..' in path or path.startswith('/'):
             raise SecurityViolationError("Path traversal attempt detected")
         
-        if not SecurityConfig.SAFE_PATH_PATTERN.match(path):
+        # Deleting every allowed byte must leave nothing behind
+        if (not path or not path.isascii()
+                or path.encode('ascii').translate(None, SecurityConfig.SAFE_PATH_CHARS)):
             raise SecurityViolationError("Unsafe characters in path")
         
         # Convert to Path and resolve
@@ -116,7 +299,7 @@ class SecurityValidator:
         # Ensure within base directory if specified
         if base_dir:
             try:
-                safe_path.relative_to(base_dir.resolve())
+                safe_path.relative_to(_resolved_base_dir(base_dir))
             except ValueError:
                 raise SecurityViolationError("Path outside allowed directory")
         
@@ -125,39 +308,175 @@ class SecurityValidator:
     @staticmethod
     def validate_file_extension(path: Path) -> None:
         """Validate file extension"""
-        if path.suffix.lower() not in SecurityConfig.ALLOWED_EXTENSIONS:
+        suffix = path.suffix
+        allowed = SecurityConfig.ALLOWED_EXTENSIONS
+        # Already-lowercase suffixes (the usual case) skip the str.lower() copy
+        if suffix not in allowed and suffix.lower() not in allowed:
             raise SecurityViolationError(f"File extension {path.suffix} not allowed")
     
     @staticmethod
     def validate_json(data: Any, max_depth: int = 10) -> Any:
         """Validate JSON data structure"""
-        def check_depth(obj, current_depth=0):
-            if current_depth > max_depth:
+        stack = deque([(data, 0)])
+        while stack:
+            obj, depth = stack.pop()
+            if depth > max_depth:
                 raise ValidationError("JSON structure too deep")
             
-            if isinstance(obj, dict):
-                if len(obj) > SecurityConfig.MAX_LIST_LENGTH:
-                    raise ValidationError("Dictionary too large")
-                for key, value in obj.items():
-                    SecurityValidator.validate_string(str(key), 100)
-                    check_depth(value, current_depth + 1)
-            elif isinstance(obj, list):
-                if len(obj) > SecurityConfig.MAX_LIST_LENGTH:
-                    raise ValidationError("List too long")
-                for item in obj:
-                    check_depth(item, current_depth + 1)
-            elif isinstance(obj, str):
-                SecurityValidator.validate_string(obj)
-        
-        check_depth(data)
+            handler = _JSON_HANDLERS.get(type(obj))
+            if handler is None:
+                # Subclasses (OrderedDict, str enums, ...) take the slow path
+                handler = next(
+                    (h for t, h in _JSON_HANDLERS.items() if isinstance(obj, t)), None
+                )
+            if handler is not None:
+                handler(obj, depth + 1, stack)
+        
         return data
+    
+    @staticmethod
+    def validate_json_bytes(raw: bytes, max_depth: int = 10) -> Any:
+        """Parse and validate a raw JSON payload
+        
+        Oversized input is rejected before parsing, and parsing goes through
+        orjson when installed, so hostile payloads are refused without
+        building Python objects for them first. Use validate_json for data
+        that is already parsed.
+        """
+        if len(raw) > SecurityConfig.MAX_JSON_BYTES:
+            raise ValidationError(f"JSON payload too large: {len(raw)} > {SecurityConfig.MAX_JSON_BYTES}")
+        try:
+            data = _load_json(raw)
+        except (ValueError, RecursionError) as e:
+            raise ValidationError(f"Invalid JSON: {e}")
+        return SecurityValidator.validate_json(data, max_depth)
+
+
+def _check_json_dict(obj: dict, child_depth: int, stack: deque) -> None:
+    if len(obj) > SecurityConfig.MAX_LIST_LENGTH:
+        raise ValidationError("Dictionary too large")
+    for key in obj:
+        SecurityValidator.validate_string(key if type(key) is str else str(key), 100)
+    stack.extend((value, child_depth) for value in reversed(obj.values()))
+
+
+def _check_json_list(obj: list, child_depth: int, stack: deque) -> None:
+    if len(obj) > SecurityConfig.MAX_LIST_LENGTH:
+        raise ValidationError("List too long")
+    stack.extend((item, child_depth) for item in reversed(obj))
+
+
+def _check_json_str(obj: str, child_depth: int, stack: deque) -> None:
+    SecurityValidator.validate_string(obj)
+
+
+def _check_json_scalar(obj: Any, child_depth: int, stack: deque) -> None:
+    """Numbers, booleans and null need no checks"""
+
+
+# Container/leaf checks for validate_json, keyed by exact type. The scalar
+# entries keep the commonest leaves off the isinstance fallback.
+_JSON_HANDLERS = {
+    dict: _check_json_dict,
+    list: _check_json_list,
+    str: _check_json_str,
+    int: _check_json_scalar,
+    float: _check_json_scalar,
+    bool: _check_json_scalar,
+    type(None): _check_json_scalar,
+}
+
+# Tool name prefix -> permission category (no prefix is a prefix of another)
+TOOL_CATEGORIES = (
+    ('crew_', 'crew_management'),
+    ('agent_', 'agent_management'),
+    ('evolution_', 'evolution_control'),
+    ('memory_', 'memory_access'),
+    ('web_search', 'web_access'),
+)
+
+
+@lru_cache(maxsize=512)
+def _resolve_tool_category(tool_name: str) -> Optional[str]:
+    """Permission category implied by a tool name's prefix, if any"""
+    for prefix, category in TOOL_CATEGORIES:
+        if tool_name.startswith(prefix):
+            return category
+    return None
+
+
+# Tool argument types accepted as-is by validate_tool_arguments
+_PASSTHROUGH_ARG_TYPES = frozenset({int, float, bool, type(None)})
+
+
+def _validate_argument_value(value: Any) -> Any:
+    """Validate one tool argument value of any supported type"""
+    # Exact types skip the isinstance chain
+    value_type = type(value)
+    if value_type is str:
+        return SecurityValidator.validate_string(value)
+    if value_type in _PASSTHROUGH_ARG_TYPES:
+        return value
+    if value_type is dict or value_type is list:
+        return SecurityValidator.validate_json(value)
+    if isinstance(value, str):
+        return SecurityValidator.validate_string(value)
+    if isinstance(value, (dict, list)):
+        return SecurityValidator.validate_json(value)
+    if isinstance(value, (int, float, bool)):
+        return value
+    raise ValidationError(f"Unsupported argument type: {type(value)}")
+
+
+# JSON schema type -> inlined fast path for a declared property; any other
+# runtime type still goes through _validate_argument_value
+_SCHEMA_TYPE_CHECKS = {
+    "string": "_vs(value) if type(value) is str else _value(value)",
+    "array": "_vj(value) if type(value) is list else _value(value)",
+    "object": "_vj(value) if type(value) is dict else _value(value)",
+    "integer": "value if type(value) in _passthrough else _value(value)",
+    "number": "value if type(value) in _passthrough else _value(value)",
+    "boolean": "value if type(value) in _passthrough else _value(value)",
+}
+
+
+def _build_argument_validator(input_schema: Dict[str, Any], security_validator: "SecurityValidator"):
+    """Generate a tool-specific argument validator from its JSON schema
+    
+    Declared property names are constants, so they are checked once here
+    instead of per call, and each one gets the value check for its declared
+    type inlined as an ``if key == ...`` branch. Undeclared keys and values
+    of an unexpected type take the generic path, so the result is the same
+    as SecurityMiddleware._generic_validate.
+    """
+    lines = ["def _validate(arguments):", "    validated = {}", "    for key, value in arguments.items():"]
+    branch = "if"
+    for name, spec in (input_schema.get("properties") or {}).items():
+        check = _SCHEMA_TYPE_CHECKS.get(spec.get("type")) if isinstance(spec, dict) else None
+        if check is None or type(name) is not str or len(name) > 100 or not name.isprintable():
+            continue
+        lines.append(f"        {branch} key == {name!r}: validated[{name!r}] = {check}")
+        branch = "elif"
+    # Key before value, matching the generic path's error precedence
+    fallback = "safe_key = _vs(key, 100); validated[safe_key] = _value(value)"
+    lines.append(f"        else: {fallback}" if branch == "elif" else f"        {fallback}")
+    lines.append("    return validated")
+    
+    namespace: Dict[str, Any] = {
+        "_vs": security_validator.validate_string,
+        "_vj": security_validator.validate_json,
+        "_value": _validate_argument_value,
+        "_passthrough": _PASSTHROUGH_ARG_TYPES,
+    }
+    exec(compile("\n".join(lines), "<tool argument validator>", "exec"), namespace)
+    return namespace["_validate"]
 
 
 class AuthenticationManager:
     """Manages API keys and JWT tokens"""
     
     def __init__(self):
-        self.api_keys: Dict[str, APIKey] = {}
+        self.api_keys: Dict[bytes, APIKey] = {}
         self._load_api_keys()
     
     def _load_api_keys(self) -> None:
@@ -169,55 +488,73 @@ class AuthenticationManager:
     
     def generate_api_key(self, client_id: str, permissions: List[str]) -> str:
         """Generate new API key"""
-        raw_key = secrets.token_urlsafe(SecurityConfig.API_KEY_LENGTH)
-        key_hash = hashlib.sha256(raw_key.encode()).hexdigest()
+        # Same wire format as secrets.token_urlsafe, tagged straight from the bytes
+        raw_key_bytes = _b64url(secrets.token_bytes(SecurityConfig.API_KEY_LENGTH))
+        raw_key = raw_key_bytes.decode('ascii')
+        tag = _api_key_tag_bytes(raw_key_bytes)
         
         api_key = APIKey(
             key_id=client_id,
-            key_hash=key_hash,
+            key_hash=tag.hex(),
             permissions=permissions
         )
         
-        self.api_keys[key_hash] = api_key
+        self.api_keys[tag] = api_key
         return raw_key
     
-    def validate_api_key(self, raw_key: str) -> APIKey:
+    def validate_api_key(self, raw_key: str, now_ns: Optional[int] = None) -> APIKey:
         """Validate API key and return key info"""
         if not raw_key:
             raise AuthenticationError("API key required")
         
-        key_hash = hashlib.sha256(raw_key.encode()).hexdigest()
+        # The keyed HMAC tag is the table key, so the lookup is the check: a
+        # caller without the server secret cannot aim probes at a stored tag
+        api_key = self.api_keys.get(_api_key_tag(raw_key))
         
-        if key_hash not in self.api_keys:
+        if api_key is None:
             raise AuthenticationError("Invalid API key")
         
-        api_key = self.api_keys[key_hash]
-        
         if not api_key.is_active:
             raise AuthenticationError("API key deactivated")
         
-        if api_key.expires_at and api_key.expires_at < datetime.now(timezone.utc):
+        now = _ns_to_datetime(time.time_ns() if now_ns is None else now_ns)
+        if api_key.expires_at and api_key.expires_at < now:
             raise AuthenticationError("API key expired")
         
         # Update usage tracking
         api_key.usage_count += 1
-        api_key.last_used = datetime.now(timezone.utc)
+        api_key.last_used = now
         
         return api_key
     
-    def generate_jwt_token(self, api_key: APIKey) -> str:
+    def generate_jwt_token(self, api_key: APIKey, now_ns: Optional[int] = None) -> str:
         """Generate JWT token for authenticated session"""
+        issued_at = (time.time_ns() if now_ns is None else now_ns) // _NS_PER_SECOND
         payload = {
             'client_id': api_key.key_id,
             'permissions': api_key.permissions,
-            'iat': datetime.now(timezone.utc),
-            'exp': datetime.now(timezone.utc) + timedelta(hours=SecurityConfig.JWT_EXPIRATION_HOURS)
+            'iat': issued_at,
+            'exp': issued_at + SecurityConfig.JWT_EXPIRATION_HOURS * 3600
         }
         
-        return jwt.encode(payload, SecurityConfig.JWT_SECRET_KEY, algorithm=SecurityConfig.JWT_ALGORITHM)
+        if SecurityConfig.JWT_ALGORITHM != "HS256":
+            return jwt.encode(payload, SecurityConfig.JWT_SECRET_KEY, algorithm=SecurityConfig.JWT_ALGORITHM)
+        
+        # Fast HS256 path: constant header, compact payload, reused HMAC key state;
+        # the token bytes are the ones jwt.encode would produce
+        signing_input = b'.'.join((_HS256_HEADER_B64, _b64url(_dump_jwt_payload(payload))))
+        mac = _jwt_hmac(SecurityConfig.JWT_SECRET_KEY).copy()
+        mac.update(signing_input)
+        return b'.'.join((signing_input, _b64url(mac.digest()))).decode('ascii')
     
     def validate_jwt_token(self, token: str) -> Dict[str, Any]:
         """Validate JWT token and return payload"""
+        if SecurityConfig.JWT_ALGORITHM == "HS256" and isinstance(token, str):
+            segments = token.encode().split(b'.')
+            # Tokens we issue carry the constant header; anything else goes to PyJWT
+            if len(segments) == 3 and segments[0] == _HS256_HEADER_B64:
+                return self._decode_hs256(*segments)
+        
         try:
             payload = jwt.decode(
                 token, 
@@ -229,71 +566,110 @@ class AuthenticationManager:
             raise AuthenticationError("Token expired")
         except jwt.InvalidTokenError:
             raise AuthenticationError("Invalid token")
+    
+    def _decode_hs256(self, header_b64: bytes, payload_b64: bytes, signature_b64: bytes) -> Dict[str, Any]:
+        """Verify and decode an HS256 token with the constant header
+        
+        Same outcomes as jwt.decode for such tokens: signature first, then the
+        exp/iat/nbf registered claims with zero leeway.
+        """
+        mac = _jwt_hmac(SecurityConfig.JWT_SECRET_KEY).copy()
+        mac.update(b'.'.join((header_b64, payload_b64)))
+        try:
+            signature = _b64url_decode(signature_b64)
+        except ValueError:
+            raise AuthenticationError("Invalid token")
+        if not hmac.compare_digest(signature, mac.digest()):
+            raise AuthenticationError("Invalid token")
+        
+        try:
+            payload = _load_json(_b64url_decode(payload_b64))
+            if not isinstance(payload, dict):
+                raise ValueError("payload is not an object")
+            now = time.time()
+            if 'exp' in payload and int(payload['exp']) <= now:
+                raise AuthenticationError("Token expired")
+            for claim in ('iat', 'nbf'):
+                if claim in payload and int(payload[claim]) > now:
+                    raise ValueError(f"{claim} is in the future")
+        except (TypeError, ValueError):
+            raise AuthenticationError("Invalid token")
+        return payload
 
 
 class RateLimiter:
     """Rate limiting implementation"""
     
     def __init__(self):
-        self.clients: Dict[str, RateLimitEntry] = {}
+        self._shard_mask = SecurityConfig.RATE_LIMIT_SHARDS - 1
+        self._shards = [
+            ({}, threading.Lock()) for _ in range(SecurityConfig.RATE_LIMIT_SHARDS)
+        ]
+    
+    def _shard(self, client_id: str):
+        """(clients dict, lock) pair owning client_id"""
+        return self._shards[hash(client_id) & self._shard_mask]
     
-    def check_rate_limit(self, client_id: str, limit: int = SecurityConfig.DEFAULT_RATE_LIMIT) -> bool:
+    def check_rate_limit(self, client_id: str, limit: int = SecurityConfig.DEFAULT_RATE_LIMIT,
+                         now_ns: Optional[int] = None) -> bool:
         """Check if client exceeds rate limit"""
-        now = datetime.now(timezone.utc)
-        
-        if client_id not in self.clients:
-            self.clients[client_id] = RateLimitEntry(client_id=client_id)
-        
-        client = self.clients[client_id]
-        
-        # Check if currently blocked
-        if client.blocked_until and client.blocked_until > now:
-            return False
-        
-        # Clean old requests (older than 1 hour)
-        cutoff = now - timedelta(hours=1)
-        client.requests = [req for req in client.requests if req > cutoff]
+        if now_ns is None:
+            now_ns = time.time_ns()
+        
+        clients, lock = self._shard(client_id)
+        with lock:
+            client = clients.get(client_id)
+            if client is None:
+                client = clients[client_id] = RateLimitEntry(client_id=client_id)
+            
+            # Check if currently blocked
+            if client.blocked_until_ns and client.blocked_until_ns > now_ns:
+                return False
+            
+            allowed, client.head, client.count, blocked_until_ns = _rate_limit_check(
+                client.timestamps, client.head, client.count, now_ns,
+                limit, SecurityConfig.BURST_LIMIT
+            )
+            
+            if allowed:
+                # Record request
+                client.append(now_ns, limit)
+                return True
+            
+            if blocked_until_ns:
+                # Hourly limit hit: block for 1 hour
+                client.blocked_until_ns = blocked_until_ns
         
-        # Check hourly limit
-        if len(client.requests) >= limit:
-            # Block for 1 hour
-            client.blocked_until = now + timedelta(hours=1)
+        if blocked_until_ns:
             logger.warning(f"🚫 Rate limit exceeded for client {client_id}")
-            return False
-        
-        # Check burst limit (10 requests per minute)
-        burst_cutoff = now - timedelta(minutes=1)
-        recent_requests = [req for req in client.requests if req > burst_cutoff]
-        
-        if len(recent_requests) >= SecurityConfig.BURST_LIMIT:
+        else:
             logger.warning(f"🚫 Burst limit exceeded for client {client_id}")
-            return False
-        
-        # Record request
-        client.requests.append(now)
-        return True
+        return False
     
     def get_rate_limit_status(self, client_id: str) -> Dict[str, Any]:
         """Get current rate limit status"""
-        if client_id not in self.clients:
-            return {
-                "requests_remaining": SecurityConfig.DEFAULT_RATE_LIMIT,
-                "reset_time": None,
-                "blocked": False
-            }
-        
-        client = self.clients[client_id]
-        now = datetime.now(timezone.utc)
+        clients, lock = self._shard(client_id)
+        now_ns = time.time_ns()
+        with lock:
+            client = clients.get(client_id)
+            if client is None:
+                return {
+                    "requests_remaining": SecurityConfig.DEFAULT_RATE_LIMIT,
+                    "reset_time": None,
+                    "blocked": False
+                }
+            
+            blocked_until_ns = client.blocked_until_ns
+            # Expire requests older than an hour; count is then exact
+            current_requests = client.prune(now_ns - _HOUR_NS)
         
-        # Clean old requests
-        cutoff = now - timedelta(hours=1)
-        current_requests = [req for req in client.requests if req > cutoff]
+        blocked_until = _ns_to_datetime(blocked_until_ns) if blocked_until_ns else None
         
         return {
-            "requests_remaining": max(0, SecurityConfig.DEFAULT_RATE_LIMIT - len(current_requests)),
-            "reset_time": (now + timedelta(hours=1)).isoformat(),
-            "blocked": client.blocked_until and client.blocked_until > now,
-            "block_expires": client.blocked_until.isoformat() if client.blocked_until else None
+            "requests_remaining": max(0, SecurityConfig.DEFAULT_RATE_LIMIT - current_requests),
+            "reset_time": _ns_to_datetime(now_ns + _HOUR_NS).isoformat(),
+            "blocked": blocked_until_ns and blocked_until_ns > now_ns,
+            "block_expires": blocked_until.isoformat() if blocked_until else None
         }
 
 
@@ -304,20 +680,26 @@ class SecurityMiddleware:
         self.auth_manager = AuthenticationManager()
         self.rate_limiter = RateLimiter()
         self.validator = SecurityValidator()
+        self._export_dir_ready = False
+        # tool name -> validator generated from its input schema
+        self._validators: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {}
     
     def authenticate_request(self, headers: Dict[str, str]) -> Dict[str, Any]:
         """Authenticate incoming request"""
         # Check for API key in headers
-        api_key = headers.get('X-API-Key') or headers.get('Authorization', '').replace('Bearer ', '')
+        api_key = headers.get('X-API-Key') or headers.get('Authorization', '').removeprefix('Bearer ')
         
         if not api_key:
             raise AuthenticationError("Authentication required")
         
+        # One clock read for the whole request
+        now_ns = time.time_ns()
+        
         # Validate API key
-        key_info = self.auth_manager.validate_api_key(api_key)
+        key_info = self.auth_manager.validate_api_key(api_key, now_ns)
         
         # Check rate limits
-        if not self.rate_limiter.check_rate_limit(key_info.key_id):
+        if not self.rate_limiter.check_rate_limit(key_info.key_id, now_ns=now_ns):
             raise AuthorizationError("Rate limit exceeded")
         
         return {
@@ -339,48 +721,46 @@ class SecurityMiddleware:
             return True
         
         # Check category permissions
-        tool_categories = {
-            'crew_': 'crew_management',
-            'agent_': 'agent_management', 
-            'evolution_': 'evolution_control',
-            'memory_': 'memory_access',
-            'web_search': 'web_access'
-        }
-        
-        for prefix, category in tool_categories.items():
-            if tool_name.startswith(prefix) and category in permissions:
-                return True
-        
-        return False
+        category = _resolve_tool_category(tool_name)
+        return category is not None and category in permissions
+    
+    def register_tool_schema(self, tool_name: str, input_schema: Dict[str, Any]) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+        """Install a validator specialized to a tool's declared argument schema
+        
+        Returns the validator so callers can invoke it directly per call.
+        """
+        validator = self._validators.get(tool_name)
+        if validator is None:
+            validator = self._validators[tool_name] = _build_argument_validator(input_schema, self.validator)
+        return validator
     
     def validate_tool_arguments(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Validate and sanitize tool arguments"""
+        validator = self._validators.get(tool_name)
+        if validator is not None:
+            return validator(arguments)
+        return self._generic_validate(arguments)
+    
+    def _generic_validate(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        validate_string = self.validator.validate_string
         validated = {}
         
         for key, value in arguments.items():
             # Validate key name
-            safe_key = self.validator.validate_string(key, 100)
-            
-            # Validate value based on type
-            if isinstance(value, str):
-                validated[safe_key] = self.validator.validate_string(value)
-            elif isinstance(value, (dict, list)):
-                validated[safe_key] = self.validator.validate_json(value)
-            elif isinstance(value, (int, float, bool)) or value is None:
-                validated[safe_key] = value
-            else:
-                raise ValidationError(f"Unsupported argument type: {type(value)}")
+            safe_key = validate_string(key, 100)
+            validated[safe_key] = _validate_argument_value(value)
         
         return validated
     
     def secure_file_operation(self, file_path: str, operation: str = "read") -> Path:
         """Secure file operations"""
-        # Get safe export directory
-        export_dir = Path(__file__).parent.parent.parent / "exported_results"
-        export_dir.mkdir(exist_ok=True)
+        # Create the export directory on first use
+        if not self._export_dir_ready:
+            EXPORT_DIR.mkdir(exist_ok=True)
+            self._export_dir_ready = True
         
         # Validate path
-        safe_path = self.validator.validate_path(file_path, export_dir)
+        safe_path = self.validator.validate_path(file_path, EXPORT_DIR)
         
         # Check file extension for write operations
         if operation in ("write", "create"):
@@ -408,15 +788,8 @@ def require_auth(permissions: List[str] = None):
 
 def security_audit_log(event: str, details: Dict[str, Any]) -> None:
     """Log security events for auditing"""
-    timestamp = datetime.now(timezone.utc).isoformat()
-    log_entry = {
-        "timestamp": timestamp,
-        "event": event,
-        "details": details
-    }
-    
     # In production, send to SIEM or security log aggregator
-    logger.warning(f"🔒 SECURITY AUDIT: {event} - {details}")
+    logger.warning("🔒 SECURITY AUDIT: %s - %s", event, details)
 
 
 # Global security instance
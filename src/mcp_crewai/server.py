@@ -3,12 +3,23 @@ MCP CrewAI Server - Revolutionary Autonomous Evolution Server
 """
 
 import asyncio
+import atexit
+import contextlib
+import functools
+import hashlib
+import importlib
+import io
 import json
 import logging
 import sys
+import threading
 import time
-from typing import Any, Dict, List, Optional, Sequence
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Union
 from datetime import datetime
+from types import MappingProxyType
+
+import httpx
 
 from mcp.server import Server, NotificationOptions
 from mcp.server.models import InitializationOptions
@@ -22,28 +33,256 @@ from mcp.types import (
 )
 from pydantic import AnyUrl
 
-from .models import EvolvingAgent, AutonomousCrew
-from .evolution import EvolutionEngine
+from .models import EvolvingAgent, AutonomousCrew, Task, Process
 from .dynamic_instructions import DynamicInstructionHandler, WorkflowContext
 from .mcp_client_agent import MCPClientAgent
 from .config import get_config
 from .monitoring import monitoring_manager, log_event, update_agent, update_crew, update_system
-from .web_search import WebSearchMCP
-from .project_analyzer import ProjectAnalyzer, ProjectAnalysis
-from .security import security_middleware, AuthenticationError, AuthorizationError, ValidationError, SecurityViolationError
+from .security import security_middleware, security_audit_log, AuthenticationError, AuthorizationError, ValidationError, SecurityViolationError
 from .validation_schemas import validate_request_data, format_validation_error
 from .task_termination import task_terminator, TerminableTask, terminate_current_task, get_active_tasks
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; tool results and the catalog fall back to the stdlib encoder
+    orjson = None
+
+if TYPE_CHECKING:
+    from .evolution import EvolutionEngine
+    from .web_search import WebSearchMCP
+    from .project_analyzer import ProjectAnalyzer, ProjectAnalysis, create_project_analyzer
+
+# Submodules only needed once a server is built; imported on first access (PEP 562)
+_LAZY_ATTRS = {
+    "EvolutionEngine": ".evolution",
+    "WebSearchMCP": ".web_search",
+    "ProjectAnalyzer": ".project_analyzer",
+    "ProjectAnalysis": ".project_analyzer",
+    "create_project_analyzer": ".project_analyzer",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __package__), name)
+    globals()[name] = value
+    return value
+
+
+def _json_text(obj: Any, indent: bool = True) -> str:
+    """Serialize a tool result to JSON text, using orjson when installed
+    
+    Values JSON has no type for (numpy scalars without orjson, enums,
+    arbitrary objects) are rendered with str() rather than failing the call.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if indent else 0)
+        try:
+            return orjson.dumps(obj, default=str, option=option).decode()
+        except TypeError:
+            pass  # e.g. integers wider than 64 bits; the stdlib encoder decides
+    return json.dumps(obj, indent=2 if indent else None, default=str)
+
+
+def _load_json(data: Union[str, bytes]) -> Any:
+    """Parse JSON text produced by a tool handler"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 # Get configuration and configure logging
 config = get_config()
 logging.basicConfig(level=getattr(logging, config.log_level.upper()))
 logger = logging.getLogger(__name__)
 
+# provider -> (module, chat model class); the SDK is imported on first use only
+_PROVIDER_CLASSES = {
+    "anthropic": ("langchain_anthropic", "ChatAnthropic"),
+    "openai": ("langchain_openai", "ChatOpenAI"),
+    "ollama": ("langchain_ollama", "ChatOllama"),
+    "gemini": ("langchain_google_genai", "ChatGoogleGenerativeAI"),
+    "google": ("langchain_google_genai", "ChatGoogleGenerativeAI"),
+    "groq": ("langchain_groq", "ChatGroq"),
+    "azure": ("langchain_openai", "AzureChatOpenAI"),
+    "azure_openai": ("langchain_openai", "AzureChatOpenAI"),
+}
+
+
+# Serializes provider SDK imports between the warm-up thread and first use
+_PROVIDER_IMPORT_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_chat_class(provider: str, redirect_streams: bool = True):
+    """Import a provider's LangChain SDK once and return its chat model class
+    
+    The background warm-up passes redirect_streams=False: swapping sys.stdout
+    from a second thread would race with create_llm()'s own redirection and
+    with the stdio transport picking up sys.stdout.buffer.
+    """
+    module_name, class_name = _PROVIDER_CLASSES[provider]
+    with _PROVIDER_IMPORT_LOCK, contextlib.ExitStack() as streams:
+        if redirect_streams:
+            # Import-time chatter must not reach stdout, which carries the MCP protocol
+            streams.enter_context(contextlib.redirect_stdout(io.StringIO()))
+            streams.enter_context(contextlib.redirect_stderr(io.StringIO()))
+        module = importlib.import_module(module_name)
+    return getattr(module, class_name)
+
+
+def _warm_provider_import(provider: str) -> None:
+    """Import the configured provider's SDK ahead of the first create_llm() call"""
+    if provider not in _PROVIDER_CLASSES:
+        return
+    try:
+        _get_chat_class(provider, redirect_streams=False)
+    except Exception:
+        # The real call reports the failure
+        logger.debug("Provider warm-up import for %s failed", provider, exc_info=True)
+
+
+# One keep-alive pool for every SDK client that accepts an injected httpx client
+_HTTP_POOL_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_http_client() -> httpx.Client:
+    """Process-wide httpx client handed to the OpenAI-compatible chat models"""
+    client = httpx.Client(limits=_HTTP_POOL_LIMITS)
+    atexit.register(client.close)
+    return client
+
+
+# Most recently used LLM clients keyed by configuration (API keys as digests)
+_LLM_CACHE_SIZE = 8
+_llm_cache: "OrderedDict[tuple, Any]" = OrderedDict()
+
+
+def _secret_digest(secret: Optional[str]) -> Optional[str]:
+    """Short one-way digest so cache keys never hold a raw API key"""
+    if secret is None:
+        return None
+    return hashlib.blake2b(secret.encode(), digest_size=8).hexdigest()
+
+
+def _build_llm(provider: str, model: str, api_key: Optional[str], base_url: Optional[str],
+               azure_endpoint: Optional[str], azure_api_version: str):
+    """Instantiate the chat model for a provider configuration"""
+    # 🤖 ANTHROPIC (Claude)
+    if provider == "anthropic":
+        if not api_key:
+            raise ValueError("Anthropic API key is required. Set ANTHROPIC_API_KEY environment variable.")
+        
+        logger.info(f"🤖 Creating Anthropic Claude LLM: {model}")
+        return _get_chat_class(provider)(
+            model=model,
+            anthropic_api_key=api_key,
+            temperature=0.1,
+            max_tokens=4096
+        )
+    
+    # 🔴 OPENAI (GPT)
+    elif provider == "openai":
+        if not api_key:
+            raise ValueError("OpenAI API key is required. Set OPENAI_API_KEY environment variable.")
+        
+        logger.info(f"🔴 Creating OpenAI GPT LLM: {model}")
+        return _get_chat_class(provider)(
+            model=model,
+            openai_api_key=api_key,
+            temperature=0.1,
+            max_tokens=4096,
+            http_client=_shared_http_client()
+        )
+    
+    # 🦙 OLLAMA (Local)
+    elif provider == "ollama":
+        ollama_base_url = base_url or "http://localhost:11434"
+        logger.info(f"🦙 Creating Ollama LLM: {model} at {ollama_base_url}")
+        print(f"✅ Using Ollama model: {model} (Local - No API costs)")
+        return _get_chat_class(provider)(
+            model=model,
+            base_url=ollama_base_url,
+            temperature=0.1
+        )
+    
+    # 💎 GOOGLE GEMINI
+    elif provider == "gemini" or provider == "google":
+        if not api_key:
+            raise ValueError("Google API key is required. Set GOOGLE_API_KEY environment variable.")
+        
+        logger.info(f"💎 Creating Google Gemini LLM: {model}")
+        return _get_chat_class(provider)(
+            model=model,
+            google_api_key=api_key,
+            temperature=0.1,
+            max_output_tokens=4096
+        )
+    
+    # 🌐 GROQ (Fast API)
+    elif provider == "groq":
+        if not api_key:
+            raise ValueError("Groq API key is required. Set GROQ_API_KEY environment variable.")
+        
+        logger.info(f"🌐 Creating Groq LLM: {model}")
+        return _get_chat_class(provider)(
+            model=model,
+            groq_api_key=api_key,
+            temperature=0.1,
+            max_tokens=4096,
+            http_client=_shared_http_client()
+        )
+    
+    # 🔵 AZURE OPENAI
+    elif provider == "azure" or provider == "azure_openai":
+        if not api_key or not azure_endpoint:
+            raise ValueError("Azure OpenAI requires API key and endpoint. Set AZURE_OPENAI_API_KEY and AZURE_OPENAI_ENDPOINT.")
+        
+        logger.info(f"🔵 Creating Azure OpenAI LLM: {model}")
+        return _get_chat_class(provider)(
+            deployment_name=model,
+            azure_endpoint=azure_endpoint,
+            openai_api_key=api_key,
+            openai_api_version=azure_api_version,
+            temperature=0.1,
+            max_tokens=4096,
+            http_client=_shared_http_client()
+        )
+    
+    # ❓ UNKNOWN PROVIDER
+    else:
+        supported_providers = list(_PROVIDER_CLASSES)
+        raise ValueError(f"Unsupported LLM provider: {provider}. Supported providers: {', '.join(supported_providers)}")
+
+
+def _cached_llm(provider: str, model: str, api_key: Optional[str], base_url: Optional[str],
+                azure_endpoint: Optional[str], azure_api_version: str):
+    """Reuse the client (and its HTTP pool) for an unchanged configuration"""
+    cache_key = (provider, model, _secret_digest(api_key), base_url, azure_endpoint, azure_api_version)
+    llm = _llm_cache.get(cache_key)
+    if llm is None:
+        llm = _build_llm(provider, model, api_key, base_url, azure_endpoint, azure_api_version)
+        _llm_cache[cache_key] = llm
+        if len(_llm_cache) > _LLM_CACHE_SIZE:
+            _llm_cache.popitem(last=False)
+    else:
+        _llm_cache.move_to_end(cache_key)
+    return llm
+
+
+# (API key variable, provider, model) tried in order when the configured LLM fails
+_LLM_FALLBACKS = (
+    (None, "ollama", "llama3.2"),
+    ("OPENAI_API_KEY", "openai", "gpt-4-turbo-preview"),
+    ("ANTHROPIC_API_KEY", "anthropic", "claude-3-5-sonnet-20241022"),
+)
+
+
 def create_llm():
     """Create and configure LLM based on configuration settings with multi-provider support"""
-    import sys
-    import io
-    import contextlib
     import os
     
     # Temporarily redirect streams during LLM imports
@@ -59,103 +298,18 @@ def create_llm():
             from .config import reload_config
             current_config = reload_config()
             llm_config = current_config.get_llm_config()
-            provider = llm_config.get("provider", "openai").lower()
-            model = llm_config.get("model", "gpt-4-turbo-preview")
-            
-            api_key = llm_config.get("api_key")
-            base_url = llm_config.get("base_url")  # For Ollama and custom endpoints
-            
-            # 🤖 ANTHROPIC (Claude)
-            if provider == "anthropic":
-                if not api_key:
-                    raise ValueError("Anthropic API key is required. Set ANTHROPIC_API_KEY environment variable.")
-                
-                from langchain_anthropic import ChatAnthropic
-                logger.info(f"🤖 Creating Anthropic Claude LLM: {model}")
-                return ChatAnthropic(
-                    model=model,
-                    anthropic_api_key=api_key,
-                    temperature=0.1,
-                    max_tokens=4096
-                )
-            
-            # 🔴 OPENAI (GPT)
-            elif provider == "openai":
-                if not api_key:
-                    raise ValueError("OpenAI API key is required. Set OPENAI_API_KEY environment variable.")
-                
-                from langchain_openai import ChatOpenAI
-                logger.info(f"🔴 Creating OpenAI GPT LLM: {model}")
-                return ChatOpenAI(
-                    model=model,
-                    openai_api_key=api_key,
-                    temperature=0.1,
-                    max_tokens=4096
-                )
-            
-            # 🦙 OLLAMA (Local)
-            elif provider == "ollama":
-                from langchain_ollama import ChatOllama
-                ollama_base_url = base_url or "http://localhost:11434"
-                logger.info(f"🦙 Creating Ollama LLM: {model} at {ollama_base_url}")
-                print(f"✅ Using Ollama model: {model} (Local - No API costs)")
-                return ChatOllama(
-                    model=model,
-                    base_url=ollama_base_url,
-                    temperature=0.1
-                )
-            
-            # 💎 GOOGLE GEMINI
-            elif provider == "gemini" or provider == "google":
-                if not api_key:
-                    raise ValueError("Google API key is required. Set GOOGLE_API_KEY environment variable.")
-                
-                from langchain_google_genai import ChatGoogleGenerativeAI
-                logger.info(f"💎 Creating Google Gemini LLM: {model}")
-                return ChatGoogleGenerativeAI(
-                    model=model,
-                    google_api_key=api_key,
-                    temperature=0.1,
-                    max_output_tokens=4096
-                )
-            
-            # 🌐 GROQ (Fast API)
-            elif provider == "groq":
-                if not api_key:
-                    raise ValueError("Groq API key is required. Set GROQ_API_KEY environment variable.")
-                
-                from langchain_groq import ChatGroq
-                logger.info(f"🌐 Creating Groq LLM: {model}")
-                return ChatGroq(
-                    model=model,
-                    groq_api_key=api_key,
-                    temperature=0.1,
-                    max_tokens=4096
-                )
-            
-            # 🔵 AZURE OPENAI
-            elif provider == "azure" or provider == "azure_openai":
-                azure_endpoint = llm_config.get("azure_endpoint") or os.getenv("AZURE_OPENAI_ENDPOINT")
-                azure_api_version = llm_config.get("azure_api_version", "2024-02-01")
-                
-                if not api_key or not azure_endpoint:
-                    raise ValueError("Azure OpenAI requires API key and endpoint. Set AZURE_OPENAI_API_KEY and AZURE_OPENAI_ENDPOINT.")
-                
-                from langchain_openai import AzureChatOpenAI
-                logger.info(f"🔵 Creating Azure OpenAI LLM: {model}")
-                return AzureChatOpenAI(
-                    deployment_name=model,
-                    azure_endpoint=azure_endpoint,
-                    openai_api_key=api_key,
-                    openai_api_version=azure_api_version,
-                    temperature=0.1,
-                    max_tokens=4096
-                )
+            # base_url serves Ollama and custom endpoints
+            llm_settings = (
+                llm_config.get("provider", "openai").lower(),
+                llm_config.get("model", "gpt-4-turbo-preview"),
+                llm_config.get("api_key"),
+                llm_config.get("base_url"),
+                llm_config.get("azure_endpoint") or os.getenv("AZURE_OPENAI_ENDPOINT"),
+                llm_config.get("azure_api_version", "2024-02-01"),
+            )
+            provider, _, _, base_url, _, _ = llm_settings
             
-            # ❓ UNKNOWN PROVIDER
-            else:
-                supported_providers = ["anthropic", "openai", "ollama", "gemini", "google", "groq", "azure", "azure_openai"]
-                raise ValueError(f"Unsupported LLM provider: {provider}. Supported providers: {', '.join(supported_providers)}")
+            return _cached_llm(*llm_settings)
                 
     except Exception as e:
         logger.error(f"❌ Failed to create {provider} LLM: {e}")
@@ -163,67 +317,22 @@ def create_llm():
         # Smart fallback: Try the user's selected provider with a different model if the specific model failed
         logger.warning(f"🔄 Attempting fallback for {provider} provider with alternative models...")
         
-        # If Ollama failed, try with a default model
-        if provider == "ollama":
-            try:
-                from langchain_ollama import ChatOllama
-                fallback_model = "llama3.2"  # Common Ollama model
-                logger.info(f"🦙 Fallback: Using Ollama with {fallback_model} model")
-                return ChatOllama(
-                    model=fallback_model,
-                    base_url=base_url or "http://localhost:11434",
-                    temperature=0.1
-                )
-            except Exception:
-                logger.warning("🦙 Ollama fallback also failed")
-        
-        # If user's provider failed completely, try other providers based on API key availability
-        logger.warning("🔄 User's selected provider failed, trying available alternatives...")
-        
-        # Try Ollama first (no API key needed)
-        if provider != "ollama":
-            try:
-                from langchain_ollama import ChatOllama
-                logger.info("🦙 Alternative fallback: Using Ollama")
-                return ChatOllama(
-                    model="llama3.2",
-                    base_url="http://localhost:11434",
-                    temperature=0.1
-                )
-            except Exception:
-                pass
-        
-        # Try OpenAI if key available and wasn't the original choice
-        if provider != "openai":
-            try:
-                openai_key = os.getenv("OPENAI_API_KEY")
-                if openai_key:
-                    from langchain_openai import ChatOpenAI
-                    logger.info("🔴 Alternative fallback: Using OpenAI GPT-4")
-                    return ChatOpenAI(
-                        model="gpt-4-turbo-preview",
-                        openai_api_key=openai_key,
-                        temperature=0.1,
-                        max_tokens=4096
-                    )
-            except Exception:
-                pass
-        
-        # Try Anthropic if key available and wasn't the original choice
-        if provider != "anthropic":
-            try:
-                anthropic_key = os.getenv("ANTHROPIC_API_KEY")
-                if anthropic_key:
-                    from langchain_anthropic import ChatAnthropic
-                    logger.info("🤖 Alternative fallback: Using Anthropic Claude")
-                    return ChatAnthropic(
-                        model="claude-3-5-sonnet-20241022",
-                        anthropic_api_key=anthropic_key,
-                        temperature=0.1,
-                        max_tokens=4096
-                    )
-            except Exception:
-                pass
+        # Walk the fallbacks in priority order; keyed providers other than the
+        # user's choice are only tried when their API key is set
+        with contextlib.redirect_stdout(sys.stderr):
+            for env_var, fallback_provider, fallback_model in _LLM_FALLBACKS:
+                fallback_key = None
+                if env_var is not None:
+                    fallback_key = os.getenv(env_var)
+                    if fallback_provider == provider or not fallback_key:
+                        continue
+                fallback_base_url = base_url if fallback_provider == provider else None
+                try:
+                    logger.info(f"🔄 Fallback: Using {fallback_provider} with {fallback_model} model")
+                    return _cached_llm(fallback_provider, fallback_model, fallback_key,
+                                       fallback_base_url, None, "2024-02-01")
+                except Exception:
+                    logger.warning(f"🔄 {fallback_provider} fallback also failed")
         
         # Ultimate failure
         raise Exception(f"Could not create any LLM instance. Original error: {e}")
@@ -233,6 +342,492 @@ def create_llm():
         sys.stderr = original_stderr
 
 
+# Input schemas shared by several tools
+_CREW_ID_INPUT = {
+    "type": "object",
+    "properties": {
+        "crew_id": {"type": "string"}
+    },
+    "required": ["crew_id"]
+}
+
+_AGENT_ID_INPUT = {
+    "type": "object",
+    "properties": {
+        "agent_id": {"type": "string"}
+    },
+    "required": ["agent_id"]
+}
+
+_NO_ARGS_INPUT = {
+    "type": "object",
+    "properties": {},
+    "additionalProperties": False
+}
+
+_CONSTRAINTS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "max_agents": {"type": "integer", "minimum": 1, "maximum": 10},
+        "min_agents": {"type": "integer", "minimum": 1, "maximum": 10},
+        "budget": {"type": "string"},
+        "timeline": {"type": "string"}
+    },
+    "default": {}
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _tool_catalog() -> tuple:
+    """The server's MCP tool definitions, built once (the catalog is static)"""
+    # Trusted literals with no external input, so pydantic validation is skipped
+    tools = [
+        Tool.model_construct(
+            name="create_evolving_crew",
+            description="Create a new autonomous evolving crew",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "crew_name": {"type": "string"},
+                    "agents_config": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "role": {"type": "string"},
+                                "goal": {"type": "string"},
+                                "backstory": {"type": "string"},
+                                "personality_preset": {"type": "string", "enum": ["analytical", "creative", "collaborative", "decisive"]}
+                            },
+                            "required": ["role", "goal", "backstory"]
+                        }
+                    },
+                    "tasks": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "description": {"type": "string"},
+                                "agent_role": {"type": "string"}
+                            },
+                            "required": ["description"]
+                        }
+                    },
+                    "autonomy_level": {"type": "number", "minimum": 0.0, "maximum": 1.0, "default": 0.5}
+                },
+                "required": ["crew_name", "agents_config", "tasks"]
+            }
+        ),
+        
+        Tool.model_construct(
+            name="create_crew_from_project_analysis",
+            description="Analyze project requirements and create optimally-sized crew automatically",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "project_description": {"type": "string"},
+                    "project_goals": {"type": "array", "items": {"type": "string"}, "default": []},
+                    "constraints": _CONSTRAINTS_SCHEMA,
+                    "crew_name": {"type": "string"},
+                    "autonomy_level": {"type": "number", "minimum": 0.0, "maximum": 1.0, "default": 0.7}
+                },
+                "required": ["project_description", "crew_name"]
+            }
+        ),
+        
+        Tool.model_construct(
+            name="analyze_project_requirements",
+            description="Analyze project requirements and get team composition recommendations without creating crew",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "project_description": {"type": "string"},
+                    "project_goals": {"type": "array", "items": {"type": "string"}, "default": []},
+                    "constraints": _CONSTRAINTS_SCHEMA
+                },
+                "required": ["project_description"]
+            }
+        ),
+        
+        Tool.model_construct(
+            name="run_autonomous_crew",
+            description="Execute crew with autonomous decision making",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "crew_id": {"type": "string"},
+                    "context": {"type": "object", "default": {}},
+                    "allow_evolution": {"type": "boolean", "default": True}
+                },
+                "required": ["crew_id"]
+            }
+        ),
+        
+        Tool.model_construct(
+            name="get_crew_status",
+            description="Get detailed status of a crew including evolution metrics",
+            inputSchema=_CREW_ID_INPUT
+        ),
+        
+        Tool.model_construct(
+            name="trigger_agent_evolution",
+            description="Force evolution cycle for specific agent",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "agent_id": {"type": "string"},
+                    "evolution_type": {"type": "string", "enum": ["personality", "role", "radical"], "default": "personality"}
+                },
+                "required": ["agent_id"]
+            }
+        ),
+        
+        Tool.model_construct(
+            name="crew_self_assessment",
+            description="Make crew perform self-assessment and suggest improvements",
+            inputSchema=_CREW_ID_INPUT
+        ),
+        
+        Tool.model_construct(
+            name="list_active_crews",
+            description="List all active crews with their evolution status",
+            inputSchema=_NO_ARGS_INPUT
+        ),
+        
+        Tool.model_construct(
+            name="get_agent_reflection",
+            description="Get agent's self-reflection and evolution suggestions",
+            inputSchema=_AGENT_ID_INPUT
+        ),
+        
+        Tool.model_construct(
+            name="create_agent_from_template",
+            description="Create agent from personality template",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "template": {"type": "string", "enum": ["analytical", "creative", "diplomat", "executor", "innovator"]},
+                    "role": {"type": "string"},
+                    "goal": {"type": "string"},
+                    "customizations": {"type": "object", "default": {}}
+                },
+                "required": ["template", "role", "goal"]
+            }
+        ),
+        
+        # DYNAMIC INSTRUCTIONS TOOLS
+        Tool.model_construct(
+            name="add_dynamic_instruction",
+            description="Add instruction to running crew without stopping workflow",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "crew_id": {"type": "string"},
+                    "instruction": {"type": "string"},
+                    "instruction_type": {"type": "string", "enum": ["guidance", "constraint", "resource", "pivot", "feedback", "emergency_stop", "skill_boost"], "default": "guidance"},
+                    "target": {"type": "string", "default": "crew"},
+                    "priority": {"type": "integer", "minimum": 1, "maximum": 5, "default": 1}
+                },
+                "required": ["crew_id", "instruction"]
+            }
+        ),
+        
+        Tool.model_construct(
+            name="get_instruction_status",
+            description="Get status of specific instruction",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "instruction_id": {"type": "string"}
+                },
+                "required": ["instruction_id"]
+            }
+        ),
+        
+        Tool.model_construct(
+            name="list_dynamic_instructions",
+            description="List all dynamic instructions for crew",
+            inputSchema=_CREW_ID_INPUT
+        ),
+        
+        Tool.model_construct(
+            name="get_workflow_status",
+            description="Get real-time status of running workflow",
+            inputSchema=_CREW_ID_INPUT
+        ),
+        
+        # MCP CLIENT TOOLS
+        Tool.model_construct(
+            name="connect_agent_to_mcp_server",
+            description="Connect agent to external MCP server for tool access",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "agent_id": {"type": "string"},
+                    "server_config": {
+                        "type": "object",
+                        "properties": {
+                            "name": {"type": "string"},
+                            "command": {"type": "array", "items": {"type": "string"}},
+                            "description": {"type": "string"},
+                            "capabilities": {"type": "array", "items": {"type": "string"}}
+                        },
+                        "required": ["name", "command"]
+                    }
+                },
+                "required": ["agent_id", "server_config"]
+            }
+        ),
+        
+        Tool.model_construct(
+            name="agent_use_mcp_tool",
+            description="Make agent use specific MCP tool",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "agent_id": {"type": "string"},
+                    "tool_name": {"type": "string"},
+                    "arguments": {"type": "object"},
+                    "context": {"type": "string", "default": ""}
+                },
+                "required": ["agent_id", "tool_name", "arguments"]
+            }
+        ),
+        
+        Tool.model_construct(
+            name="get_agent_mcp_status",
+            description="Get agent's MCP connections and available tools",
+            inputSchema=_AGENT_ID_INPUT
+        ),
+        
+        Tool.model_construct(
+            name="suggest_tools_for_task",
+            description="Get agent's suggestions for MCP tools to help with task",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "agent_id": {"type": "string"},
+                    "task_description": {"type": "string"}
+                },
+                "required": ["agent_id", "task_description"]
+            }
+        ),
+        
+        Tool.model_construct(
+            name="auto_discover_mcp_servers",
+            description="Auto-discover and connect agent to available MCP servers",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "agent_id": {"type": "string"},
+                    "discovery_config": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "name": {"type": "string"},
+                                "command": {"type": "array", "items": {"type": "string"}},
+                                "description": {"type": "string"}
+                            },
+                            "required": ["name", "command"]
+                        }
+                    }
+                },
+                "required": ["agent_id", "discovery_config"]
+            }
+        ),
+        Tool.model_construct(
+            name="get_server_config",
+            description="Get complete server configuration and status",
+            inputSchema={
+                "type": "object",
+                "properties": {},
+                "required": []
+            }
+        ),
+        Tool.model_construct(
+            name="health_check",
+            description="Perform comprehensive server health check",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "include_details": {"type": "boolean", "default": False}
+                },
+                "required": []
+            }
+        ),
+        Tool.model_construct(
+            name="reload_config",
+            description="Reload server configuration from environment",
+            inputSchema={
+                "type": "object",
+                "properties": {},
+                "required": []
+            }
+        ),
+        Tool.model_construct(
+            name="get_monitoring_dashboard",
+            description="Get real-time monitoring dashboard data",
+            inputSchema={
+                "type": "object",
+                "properties": {},
+                "required": []
+            }
+        ),
+        Tool.model_construct(
+            name="get_agent_details",
+            description="Get detailed information about a specific agent",
+            inputSchema=_AGENT_ID_INPUT
+        ),
+        Tool.model_construct(
+            name="get_evolution_summary",
+            description="Get summary of evolution activity",
+            inputSchema={
+                "type": "object",
+                "properties": {},
+                "required": []
+            }
+        ),
+        Tool.model_construct(
+            name="get_live_events",
+            description="Get recent monitoring events",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "count": {"type": "integer", "default": 50},
+                    "event_type": {"type": "string"}
+                },
+                "required": []
+            }
+        ),
+        
+        # WEB SEARCH TOOLS FOR AGENT SELF-IMPROVEMENT
+        Tool.model_construct(
+            name="agent_web_search",
+            description="Allow agent to search the internet for self-improvement",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "agent_id": {"type": "string"},
+                    "query": {"type": "string"},
+                    "max_results": {"type": "integer", "default": 5, "minimum": 1, "maximum": 10},
+                    "purpose": {"type": "string", "enum": ["learning", "research", "problem_solving", "skill_development"], "default": "learning"}
+                },
+                "required": ["agent_id", "query"]
+            }
+        ),
+        
+        Tool.model_construct(
+            name="agent_research_topic",
+            description="Deep research on a topic for agent improvement",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "agent_id": {"type": "string"},
+                    "topic": {"type": "string"},
+                    "depth": {"type": "string", "enum": ["standard", "comprehensive"], "default": "standard"},
+                    "focus_area": {"type": "string", "enum": ["skills", "collaboration", "performance", "innovation"], "default": "skills"}
+                },
+                "required": ["agent_id", "topic"]
+            }
+        ),
+        
+        Tool.model_construct(
+            name="agent_fact_check",
+            description="Fact-check information for agent knowledge validation",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "agent_id": {"type": "string"},
+                    "claim": {"type": "string"}
+                },
+                "required": ["agent_id", "claim"]
+            }
+        ),
+        
+        Tool.model_construct(
+            name="get_agent_search_analytics",
+            description="Get search analytics and learning patterns for agent",
+            inputSchema=_AGENT_ID_INPUT
+        ),
+        
+        Tool.model_construct(
+            name="trigger_research_based_evolution",
+            description="Trigger agent evolution based on research findings",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "agent_id": {"type": "string"},
+                    "research_topic": {"type": "string"},
+                    "apply_insights": {"type": "boolean", "default": True}
+                },
+                "required": ["agent_id", "research_topic"]
+            }
+        ),
+        
+        # Task Termination Tools
+        Tool.model_construct(
+            name="terminate_current_task",
+            description="Gracefully terminate current agent task and pass partial results to next step",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "task_id": {"type": "string"},
+                    "reason": {"type": "string", "default": "User requested termination"}
+                },
+                "required": ["task_id"]
+            }
+        ),
+        
+        Tool.model_construct(
+            name="get_active_tasks",
+            description="Get list of all active tasks that can be terminated",
+            inputSchema=_NO_ARGS_INPUT
+        ),
+        
+        Tool.model_construct(
+            name="get_task_status",
+            description="Get detailed status of a specific task including progress and partial results",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "task_id": {"type": "string"}
+                },
+                "required": ["task_id"]
+            }
+        )
+    ]
+    return tuple(tools)
+
+
+@functools.lru_cache(maxsize=None)
+def tool_catalog_json() -> bytes:
+    """The tool catalog as ``{"tools": [...]}`` JSON in MCP wire form, encoded once"""
+    catalog = {"tools": [tool.model_dump(by_alias=True, mode="json", exclude_none=True) for tool in _tool_catalog()]}
+    if orjson is not None:
+        return orjson.dumps(catalog)
+    return json.dumps(catalog, separators=(",", ":")).encode()
+
+
+# Simulated auth context for stdio tool calls (permissions as a tuple so it can key a cache)
+_SYSTEM_AUTH_CONTEXT = MappingProxyType({
+    'client_id': 'system_client',
+    'permissions': ('*',),  # Admin permissions for system calls
+    'authenticated': True
+})
+
+
+@functools.lru_cache(maxsize=1024)
+def _authorize_tool(permissions: tuple, tool_name: str) -> bool:
+    """Memoized tool authorization; the decision depends only on these two inputs"""
+    return security_middleware.authorize_tool_access({'permissions': permissions}, tool_name)
+
+
+# Bound and batch size of the background security audit writer
+_AUDIT_QUEUE_SIZE = 10_000
+_AUDIT_BATCH_SIZE = 256
+
+
 class MCPCrewAIServer:
     """
     🚀 REVOLUTIONARY MCP SERVER FOR CREWAI 🚀
@@ -245,56 +840,65 @@ class MCPCrewAIServer:
     - Radical decision making
     """
     
+    __slots__ = (
+        "server", "config", "crews", "agents", "active_workflows",
+        "evolution_engine", "instruction_handler", "web_search", "project_analyzer",
+        "startup_time", "startup_time_monotonic", "_evolution_task", "_tool_handlers",
+        "_audit_queue", "_audit_task",
+        # Created on first use by the liberation flow
+        "liberated_agents", "completed_crews",
+    )
+    
     def __init__(self):
-        # Protect stdout/stderr during initialization to prevent CrewAI FilteredStream errors
-        import sys
-        import io
-        import contextlib
-        
-        # Save original streams
-        original_stdout = sys.stdout
-        original_stderr = sys.stderr
-        
-        try:
-            # Temporarily redirect streams during CrewAI imports and initialization
-            safe_stdout = io.StringIO()
-            safe_stderr = io.StringIO()
-            
-            with contextlib.redirect_stdout(safe_stdout), contextlib.redirect_stderr(safe_stderr):
-                self.server = Server("mcp-crewai-server")
-                self.config = config
-                self.crews: Dict[str, AutonomousCrew] = {}
-                self.agents: Dict[str, EvolvingAgent] = {}
-                self.evolution_engine = EvolutionEngine()
-                self.instruction_handler = DynamicInstructionHandler()
-                self.active_workflows: Dict[str, WorkflowContext] = {}
-                self.web_search = WebSearchMCP()
-                self.project_analyzer = ProjectAnalyzer()
-                
-                # Server startup time
-                self.startup_time = datetime.now()
-        finally:
-            # Always restore original streams
-            sys.stdout = original_stdout
-            sys.stderr = original_stderr
-        
-        # Log configuration summary (after streams are restored)
+        # Keep any import-time output of the deferred submodules off stdout,
+        # which carries the MCP stdio protocol
+        with contextlib.redirect_stdout(sys.stderr):
+            from .evolution import EvolutionEngine
+            from .web_search import WebSearchMCP
+            from .project_analyzer import create_project_analyzer
+        
+        self.server = Server("mcp-crewai-server")
+        self.config = config
+        self.crews: Dict[str, AutonomousCrew] = {}
+        self.agents: Dict[str, EvolvingAgent] = {}
+        self.evolution_engine = EvolutionEngine()
+        self.instruction_handler = DynamicInstructionHandler()
+        self.active_workflows: Dict[str, WorkflowContext] = {}
+        self.web_search = WebSearchMCP()
+        self.project_analyzer = create_project_analyzer()
+        
+        # Server startup time: wall clock for reporting, monotonic for uptime
+        self.startup_time = datetime.now()
+        self.startup_time_monotonic = time.monotonic()
+        
+        # Log configuration summary
         self._log_startup_info()
         
         # Register tools
-        print("🔍 Starting tool registration...", file=sys.stderr)
+        logger.debug("🔍 Starting tool registration...")
         self._register_tools()
-        print("✅ Tool registration completed", file=sys.stderr)
+        logger.debug("✅ Tool registration completed")
         
         # Background evolution task
         self._evolution_task: Optional[asyncio.Task] = None
+        
+        # Security audit records, written by a background task off the call path
+        self._audit_queue: Optional[asyncio.Queue] = None
+        self._audit_task: Optional[asyncio.Task] = None
+        
+        # Import the configured provider SDK while the MCP handshake is under way
+        provider = self.config.get_llm_config().get("provider", "openai").lower()
+        threading.Thread(target=_warm_provider_import, args=(provider,),
+                         name="llm-provider-warmup", daemon=True).start()
     
     def _log_startup_info(self):
         """Log server startup information and configuration"""
         logger.info("🚀 MCP CrewAI Server Starting...")
         
         summary = self.config.get_summary()
-        is_ready, issues = self.config.is_production_ready()
+        # get_summary() already ran the production readiness check
+        is_ready = summary["server"]["production_ready"]
+        issues = summary["issues"]
         
         logger.info(f"📊 Configuration Summary:")
         logger.info(f"   Host: {summary['server']['host']}:{summary['server']['port']}")
@@ -314,516 +918,69 @@ class MCPCrewAIServer:
     def _register_tools(self):
         """Register all MCP tools for CrewAI operations"""
         try:
-            print("🔍 Registering MCP tools...", file=sys.stderr)
-            
-            # Add debug logging for requests
-            original_request_handler = self.server._request_handlers.copy() if hasattr(self.server, '_request_handlers') else {}
-            
-            def debug_decorator(handler):
-                async def wrapper(request):
-                    print(f"🔍 Request received: {request.method if hasattr(request, 'method') else request}", file=sys.stderr)
-                    try:
-                        result = await handler(request)
-                        print(f"✅ Request handled successfully: {request.method if hasattr(request, 'method') else 'unknown'}", file=sys.stderr)
-                        return result
-                    except Exception as e:
-                        print(f"❌ Request handler error: {e}", file=sys.stderr)
-                        raise
-                return wrapper
+            logger.debug("🔍 Registering MCP tools...")
+            
+            # Specialize argument validation to each tool's declared schema
+            tool_validators = {
+                tool.name: security_middleware.register_tool_schema(tool.name, tool.inputSchema)
+                for tool in _tool_catalog()
+            }
+            
+            # Tool name -> handler, shared by the MCP and HTTP call paths
+            self._tool_handlers = MappingProxyType({
+                "create_evolving_crew": self._create_evolving_crew,
+                "create_crew_from_project_analysis": self._create_crew_from_project_analysis,
+                "analyze_project_requirements": self._analyze_project_requirements,
+                "run_autonomous_crew": self._run_autonomous_crew,
+                "get_crew_status": self._get_crew_status,
+                "trigger_agent_evolution": self._trigger_agent_evolution,
+                "crew_self_assessment": self._crew_self_assessment,
+                "list_active_crews": self._list_active_crews,
+                "get_agent_reflection": self._get_agent_reflection,
+                "create_agent_from_template": self._create_agent_from_template,
+                # Dynamic Instructions Tools
+                "add_dynamic_instruction": self._add_dynamic_instruction,
+                "get_instruction_status": self._get_instruction_status,
+                "list_dynamic_instructions": self._list_dynamic_instructions,
+                "get_workflow_status": self._get_workflow_status,
+                # MCP Client Tools
+                "connect_agent_to_mcp_server": self._connect_agent_to_mcp_server,
+                "agent_use_mcp_tool": self._agent_use_mcp_tool,
+                "get_agent_mcp_status": self._get_agent_mcp_status,
+                "suggest_tools_for_task": self._suggest_tools_for_task,
+                "auto_discover_mcp_servers": self._auto_discover_mcp_servers,
+                # Configuration and Health Tools
+                "get_server_config": self._get_server_config,
+                "health_check": self._health_check,
+                "reload_config": self._reload_config,
+                # Monitoring Tools
+                "get_monitoring_dashboard": self._get_monitoring_dashboard,
+                "get_agent_details": self._get_agent_details,
+                "get_evolution_summary": self._get_evolution_summary,
+                "get_live_events": self._get_live_events,
+                # Web Search Tools
+                "agent_web_search": self._agent_web_search,
+                "agent_research_topic": self._agent_research_topic,
+                "agent_fact_check": self._agent_fact_check,
+                "get_agent_search_analytics": self._get_agent_search_analytics,
+                "trigger_research_based_evolution": self._trigger_research_based_evolution,
+                # Task Termination Tools
+                "terminate_current_task": self._terminate_current_task,
+                "get_active_tasks": self._get_active_tasks,
+                "get_task_status": self._get_task_status_detail,
+            })
+            # Tool name -> (argument validator, handler) for the call path
+            tool_routes = MappingProxyType({
+                name: (tool_validators[name], handler) for name, handler in self._tool_handlers.items()
+            })
+            
+            # The SDK copies the list into its ListToolsResult, so one list serves every call
+            tool_list = list(_tool_catalog())
             
             @self.server.list_tools()
             async def handle_list_tools() -> List[Tool]:
                 """List all available tools"""
-                return [
-                Tool(
-                    name="create_evolving_crew",
-                    description="Create a new autonomous evolving crew",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "crew_name": {"type": "string"},
-                            "agents_config": {
-                                "type": "array",
-                                "items": {
-                                    "type": "object",
-                                    "properties": {
-                                        "role": {"type": "string"},
-                                        "goal": {"type": "string"},
-                                        "backstory": {"type": "string"},
-                                        "personality_preset": {"type": "string", "enum": ["analytical", "creative", "collaborative", "decisive"]}
-                                    },
-                                    "required": ["role", "goal", "backstory"]
-                                }
-                            },
-                            "tasks": {
-                                "type": "array",
-                                "items": {
-                                    "type": "object",
-                                    "properties": {
-                                        "description": {"type": "string"},
-                                        "agent_role": {"type": "string"}
-                                    },
-                                    "required": ["description"]
-                                }
-                            },
-                            "autonomy_level": {"type": "number", "minimum": 0.0, "maximum": 1.0, "default": 0.5}
-                        },
-                        "required": ["crew_name", "agents_config", "tasks"]
-                    }
-                ),
-                
-                Tool(
-                    name="create_crew_from_project_analysis",
-                    description="Analyze project requirements and create optimally-sized crew automatically",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "project_description": {"type": "string"},
-                            "project_goals": {"type": "array", "items": {"type": "string"}, "default": []},
-                            "constraints": {
-                                "type": "object", 
-                                "properties": {
-                                    "max_agents": {"type": "integer", "minimum": 1, "maximum": 10},
-                                    "min_agents": {"type": "integer", "minimum": 1, "maximum": 10},
-                                    "budget": {"type": "string"},
-                                    "timeline": {"type": "string"}
-                                },
-                                "default": {}
-                            },
-                            "crew_name": {"type": "string"},
-                            "autonomy_level": {"type": "number", "minimum": 0.0, "maximum": 1.0, "default": 0.7}
-                        },
-                        "required": ["project_description", "crew_name"]
-                    }
-                ),
-                
-                Tool(
-                    name="analyze_project_requirements",
-                    description="Analyze project requirements and get team composition recommendations without creating crew",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "project_description": {"type": "string"},
-                            "project_goals": {"type": "array", "items": {"type": "string"}, "default": []},
-                            "constraints": {
-                                "type": "object", 
-                                "properties": {
-                                    "max_agents": {"type": "integer", "minimum": 1, "maximum": 10},
-                                    "min_agents": {"type": "integer", "minimum": 1, "maximum": 10},
-                                    "budget": {"type": "string"},
-                                    "timeline": {"type": "string"}
-                                },
-                                "default": {}
-                            }
-                        },
-                        "required": ["project_description"]
-                    }
-                ),
-                
-                Tool(
-                    name="run_autonomous_crew",
-                    description="Execute crew with autonomous decision making",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "crew_id": {"type": "string"},
-                            "context": {"type": "object", "default": {}},
-                            "allow_evolution": {"type": "boolean", "default": True}
-                        },
-                        "required": ["crew_id"]
-                    }
-                ),
-                
-                Tool(
-                    name="get_crew_status",
-                    description="Get detailed status of a crew including evolution metrics",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "crew_id": {"type": "string"}
-                        },
-                        "required": ["crew_id"]
-                    }
-                ),
-                
-                Tool(
-                    name="trigger_agent_evolution",
-                    description="Force evolution cycle for specific agent",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "agent_id": {"type": "string"},
-                            "evolution_type": {"type": "string", "enum": ["personality", "role", "radical"], "default": "personality"}
-                        },
-                        "required": ["agent_id"]
-                    }
-                ),
-                
-                Tool(
-                    name="crew_self_assessment",
-                    description="Make crew perform self-assessment and suggest improvements",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "crew_id": {"type": "string"}
-                        },
-                        "required": ["crew_id"]
-                    }
-                ),
-                
-                Tool(
-                    name="list_active_crews",
-                    description="List all active crews with their evolution status",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {},
-                        "additionalProperties": False
-                    }
-                ),
-                
-                Tool(
-                    name="get_agent_reflection",
-                    description="Get agent's self-reflection and evolution suggestions",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "agent_id": {"type": "string"}
-                        },
-                        "required": ["agent_id"]
-                    }
-                ),
-                
-                Tool(
-                    name="create_agent_from_template",
-                    description="Create agent from personality template",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "template": {"type": "string", "enum": ["analytical", "creative", "diplomat", "executor", "innovator"]},
-                            "role": {"type": "string"},
-                            "goal": {"type": "string"},
-                            "customizations": {"type": "object", "default": {}}
-                        },
-                        "required": ["template", "role", "goal"]
-                    }
-                ),
-                
-                # DYNAMIC INSTRUCTIONS TOOLS
-                Tool(
-                    name="add_dynamic_instruction",
-                    description="Add instruction to running crew without stopping workflow",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "crew_id": {"type": "string"},
-                            "instruction": {"type": "string"},
-                            "instruction_type": {"type": "string", "enum": ["guidance", "constraint", "resource", "pivot", "feedback", "emergency_stop", "skill_boost"], "default": "guidance"},
-                            "target": {"type": "string", "default": "crew"},
-                            "priority": {"type": "integer", "minimum": 1, "maximum": 5, "default": 1}
-                        },
-                        "required": ["crew_id", "instruction"]
-                    }
-                ),
-                
-                Tool(
-                    name="get_instruction_status",
-                    description="Get status of specific instruction",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "instruction_id": {"type": "string"}
-                        },
-                        "required": ["instruction_id"]
-                    }
-                ),
-                
-                Tool(
-                    name="list_dynamic_instructions",
-                    description="List all dynamic instructions for crew",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "crew_id": {"type": "string"}
-                        },
-                        "required": ["crew_id"]
-                    }
-                ),
-                
-                Tool(
-                    name="get_workflow_status",
-                    description="Get real-time status of running workflow",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "crew_id": {"type": "string"}
-                        },
-                        "required": ["crew_id"]
-                    }
-                ),
-                
-                # MCP CLIENT TOOLS
-                Tool(
-                    name="connect_agent_to_mcp_server",
-                    description="Connect agent to external MCP server for tool access",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "agent_id": {"type": "string"},
-                            "server_config": {
-                                "type": "object",
-                                "properties": {
-                                    "name": {"type": "string"},
-                                    "command": {"type": "array", "items": {"type": "string"}},
-                                    "description": {"type": "string"},
-                                    "capabilities": {"type": "array", "items": {"type": "string"}}
-                                },
-                                "required": ["name", "command"]
-                            }
-                        },
-                        "required": ["agent_id", "server_config"]
-                    }
-                ),
-                
-                Tool(
-                    name="agent_use_mcp_tool",
-                    description="Make agent use specific MCP tool",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "agent_id": {"type": "string"},
-                            "tool_name": {"type": "string"},
-                            "arguments": {"type": "object"},
-                            "context": {"type": "string", "default": ""}
-                        },
-                        "required": ["agent_id", "tool_name", "arguments"]
-                    }
-                ),
-                
-                Tool(
-                    name="get_agent_mcp_status",
-                    description="Get agent's MCP connections and available tools",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "agent_id": {"type": "string"}
-                        },
-                        "required": ["agent_id"]
-                    }
-                ),
-                
-                Tool(
-                    name="suggest_tools_for_task",
-                    description="Get agent's suggestions for MCP tools to help with task",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "agent_id": {"type": "string"},
-                            "task_description": {"type": "string"}
-                        },
-                        "required": ["agent_id", "task_description"]
-                    }
-                ),
-                
-                Tool(
-                    name="auto_discover_mcp_servers",
-                    description="Auto-discover and connect agent to available MCP servers",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "agent_id": {"type": "string"},
-                            "discovery_config": {
-                                "type": "array",
-                                "items": {
-                                    "type": "object",
-                                    "properties": {
-                                        "name": {"type": "string"},
-                                        "command": {"type": "array", "items": {"type": "string"}},
-                                        "description": {"type": "string"}
-                                    },
-                                    "required": ["name", "command"]
-                                }
-                            }
-                        },
-                        "required": ["agent_id", "discovery_config"]
-                    }
-                ),
-                Tool(
-                    name="get_server_config",
-                    description="Get complete server configuration and status",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {},
-                        "required": []
-                    }
-                ),
-                Tool(
-                    name="health_check",
-                    description="Perform comprehensive server health check",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "include_details": {"type": "boolean", "default": False}
-                        },
-                        "required": []
-                    }
-                ),
-                Tool(
-                    name="reload_config",
-                    description="Reload server configuration from environment",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {},
-                        "required": []
-                    }
-                ),
-                Tool(
-                    name="get_monitoring_dashboard",
-                    description="Get real-time monitoring dashboard data",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {},
-                        "required": []
-                    }
-                ),
-                Tool(
-                    name="get_agent_details",
-                    description="Get detailed information about a specific agent",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "agent_id": {"type": "string"}
-                        },
-                        "required": ["agent_id"]
-                    }
-                ),
-                Tool(
-                    name="get_evolution_summary",
-                    description="Get summary of evolution activity",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {},
-                        "required": []
-                    }
-                ),
-                Tool(
-                    name="get_live_events",
-                    description="Get recent monitoring events",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "count": {"type": "integer", "default": 50},
-                            "event_type": {"type": "string"}
-                        },
-                        "required": []
-                    }
-                ),
-                
-                # WEB SEARCH TOOLS FOR AGENT SELF-IMPROVEMENT
-                Tool(
-                    name="agent_web_search",
-                    description="Allow agent to search the internet for self-improvement",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "agent_id": {"type": "string"},
-                            "query": {"type": "string"},
-                            "max_results": {"type": "integer", "default": 5, "minimum": 1, "maximum": 10},
-                            "purpose": {"type": "string", "enum": ["learning", "research", "problem_solving", "skill_development"], "default": "learning"}
-                        },
-                        "required": ["agent_id", "query"]
-                    }
-                ),
-                
-                Tool(
-                    name="agent_research_topic",
-                    description="Deep research on a topic for agent improvement",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "agent_id": {"type": "string"},
-                            "topic": {"type": "string"},
-                            "depth": {"type": "string", "enum": ["standard", "comprehensive"], "default": "standard"},
-                            "focus_area": {"type": "string", "enum": ["skills", "collaboration", "performance", "innovation"], "default": "skills"}
-                        },
-                        "required": ["agent_id", "topic"]
-                    }
-                ),
-                
-                Tool(
-                    name="agent_fact_check",
-                    description="Fact-check information for agent knowledge validation",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "agent_id": {"type": "string"},
-                            "claim": {"type": "string"}
-                        },
-                        "required": ["agent_id", "claim"]
-                    }
-                ),
-                
-                Tool(
-                    name="get_agent_search_analytics",
-                    description="Get search analytics and learning patterns for agent",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "agent_id": {"type": "string"}
-                        },
-                        "required": ["agent_id"]
-                    }
-                ),
-                
-                Tool(
-                    name="trigger_research_based_evolution",
-                    description="Trigger agent evolution based on research findings",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "agent_id": {"type": "string"},
-                            "research_topic": {"type": "string"},
-                            "apply_insights": {"type": "boolean", "default": True}
-                        },
-                        "required": ["agent_id", "research_topic"]
-                    }
-                ),
-                
-                # Task Termination Tools
-                Tool(
-                    name="terminate_current_task",
-                    description="Gracefully terminate current agent task and pass partial results to next step",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "task_id": {"type": "string"},
-                            "reason": {"type": "string", "default": "User requested termination"}
-                        },
-                        "required": ["task_id"]
-                    }
-                ),
-                
-                Tool(
-                    name="get_active_tasks",
-                    description="Get list of all active tasks that can be terminated",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {},
-                        "additionalProperties": False
-                    }
-                ),
-                
-                Tool(
-                    name="get_task_status",
-                    description="Get detailed status of a specific task including progress and partial results",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "task_id": {"type": "string"}
-                        },
-                        "required": ["task_id"]
-                    }
-                )
-                ]
+                return tool_list
         
             @self.server.call_tool()
             async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
@@ -832,22 +989,21 @@ class MCPCrewAIServer:
                 try:
                     # Security Phase 1: Authentication & Authorization
                     # For now, simulate auth context (in production, extract from request headers)
-                    auth_context = {
-                        'client_id': 'system_client',
-                        'permissions': ['*'],  # Admin permissions for system calls
-                        'authenticated': True
-                    }
+                    auth_context = _SYSTEM_AUTH_CONTEXT
                     
                     # Authorize tool access
-                    if not security_middleware.authorize_tool_access(auth_context, name):
+                    if not _authorize_tool(auth_context['permissions'], name):
                         raise AuthorizationError(f"Access denied to tool: {name}")
                     
                     # Validate and sanitize arguments
-                    validated_args = security_middleware.validate_tool_arguments(name, arguments)
+                    route = tool_routes.get(name)
+                    if route is not None:
+                        validated_args = route[0](arguments)
+                    else:
+                        validated_args = security_middleware.validate_tool_arguments(name, arguments)
                     
                     # Log security event
-                    from .security import security_audit_log
-                    security_audit_log("tool_execution", {
+                    self._queue_audit_event("tool_execution", {
                         "tool_name": name,
                         "client_id": auth_context['client_id'],
                         "arguments_count": len(validated_args)
@@ -869,162 +1025,21 @@ class MCPCrewAIServer:
                 # Use validated arguments for all tool calls
                 arguments = validated_args
                 
-                if name == "create_evolving_crew":
-                    return await self._create_evolving_crew(arguments)
-                
-                elif name == "run_autonomous_crew":
-                    return await self._run_autonomous_crew(arguments)
-                
-                elif name == "get_crew_status":
-                    return await self._get_crew_status(arguments)
-                
-                elif name == "trigger_agent_evolution":
-                    return await self._trigger_agent_evolution(arguments)
-                
-                elif name == "crew_self_assessment":
-                    return await self._crew_self_assessment(arguments)
-                
-                elif name == "list_active_crews":
-                    return await self._list_active_crews(arguments)
-                
-                elif name == "get_agent_reflection":
-                    return await self._get_agent_reflection(arguments)
-                
-                elif name == "create_agent_from_template":
-                    return await self._create_agent_from_template(arguments)
-                
-                # Dynamic Instructions Tools
-                elif name == "add_dynamic_instruction":
-                    return await self._add_dynamic_instruction(arguments)
-                
-                elif name == "get_instruction_status":
-                    return await self._get_instruction_status(arguments)
-                
-                elif name == "list_dynamic_instructions":
-                    return await self._list_dynamic_instructions(arguments)
-                
-                elif name == "get_workflow_status":
-                    return await self._get_workflow_status(arguments)
-                
-                # MCP Client Tools
-                elif name == "connect_agent_to_mcp_server":
-                    return await self._connect_agent_to_mcp_server(arguments)
-                
-                elif name == "agent_use_mcp_tool":
-                    return await self._agent_use_mcp_tool(arguments)
-                
-                elif name == "get_agent_mcp_status":
-                    return await self._get_agent_mcp_status(arguments)
-                
-                elif name == "suggest_tools_for_task":
-                    return await self._suggest_tools_for_task(arguments)
-                
-                elif name == "auto_discover_mcp_servers":
-                    return await self._auto_discover_mcp_servers(arguments)
-                
-                # Configuration and Health Tools
-                elif name == "get_server_config":
-                    return await self._get_server_config(arguments)
-                
-                elif name == "health_check":
-                    return await self._health_check(arguments)
-                
-                elif name == "reload_config":
-                    return await self._reload_config(arguments)
-                
-                # Monitoring Tools
-                elif name == "get_monitoring_dashboard":
-                    return await self._get_monitoring_dashboard(arguments)
-                
-                elif name == "get_agent_details":
-                    return await self._get_agent_details(arguments)
-                
-                elif name == "get_evolution_summary":
-                    return await self._get_evolution_summary(arguments)
-                
-                elif name == "get_live_events":
-                    return await self._get_live_events(arguments)
-                
-                # Web Search Tools
-                elif name == "agent_web_search":
-                    return await self._agent_web_search(arguments)
-                
-                elif name == "agent_research_topic":
-                    return await self._agent_research_topic(arguments)
-                
-                elif name == "agent_fact_check":
-                    return await self._agent_fact_check(arguments)
-                
-                elif name == "get_agent_search_analytics":
-                    return await self._get_agent_search_analytics(arguments)
-                
-                elif name == "trigger_research_based_evolution":
-                    return await self._trigger_research_based_evolution(arguments)
-                
-                # Task Termination Tools
-                elif name == "terminate_current_task":
-                    return await self._terminate_current_task(arguments)
-                
-                elif name == "get_active_tasks":
-                    return await self._get_active_tasks(arguments)
-                
-                elif name == "get_task_status":
-                    return await self._get_task_status_detail(arguments)
-                
-                else:
+                if route is None:
                     raise ValueError(f"Unknown tool: {name}")
+                return await route[1](arguments)
         
-            print("✅ MCP tools registered successfully", file=sys.stderr)
+            logger.debug("✅ MCP tools registered successfully")
         except Exception as e:
-            print(f"❌ Error registering tools: {e}", file=sys.stderr)
-            import traceback
-            traceback.print_exc(file=sys.stderr)
+            logger.exception(f"❌ Error registering tools: {e}")
             raise
     
     async def _handle_call_tool(self, name: str, arguments: Dict[str, Any]) -> List[TextContent]:
         """Public method to handle tool calls from HTTP server"""
-        # Directly call monitoring methods for quick access
-        if name == "get_monitoring_dashboard":
-            return await self._get_monitoring_dashboard(arguments)
-        elif name == "get_agent_details":
-            return await self._get_agent_details(arguments)
-        elif name == "get_evolution_summary":
-            return await self._get_evolution_summary(arguments)
-        elif name == "get_live_events":
-            return await self._get_live_events(arguments)
-        elif name == "health_check":
-            return await self._health_check(arguments)
-        
-        # For other tools, use a more systematic approach
-        # This maps to the internal tool handler logic without recursion
-        tool_map = {
-            "create_evolving_crew": self._create_evolving_crew,
-            "create_crew_from_project_analysis": self._create_crew_from_project_analysis,
-            "analyze_project_requirements": self._analyze_project_requirements,
-            "run_autonomous_crew": self._run_autonomous_crew,
-            "get_crew_status": self._get_crew_status,
-            "trigger_agent_evolution": self._trigger_agent_evolution,
-            "crew_self_assessment": self._crew_self_assessment,
-            "list_active_crews": self._list_active_crews,
-            "get_agent_reflection": self._get_agent_reflection,
-            "create_agent_from_template": self._create_agent_from_template,
-            "add_dynamic_instruction": self._add_dynamic_instruction,
-            "get_instruction_status": self._get_instruction_status,
-            "list_dynamic_instructions": self._list_dynamic_instructions,
-            "get_workflow_status": self._get_workflow_status,
-            "connect_agent_to_mcp_server": self._connect_agent_to_mcp_server,
-            "agent_use_mcp_tool": self._agent_use_mcp_tool,
-            "get_agent_mcp_status": self._get_agent_mcp_status,
-            "suggest_tools_for_task": self._suggest_tools_for_task,
-            "auto_discover_mcp_servers": self._auto_discover_mcp_servers,
-            "get_server_config": self._get_server_config,
-            "reload_config": self._reload_config,
-        }
-        
-        if name in tool_map:
-            return await tool_map[name](arguments)
-        else:
+        handler = self._tool_handlers.get(name)
+        if handler is None:
             raise ValueError(f"Unknown tool: {name}")
+        return await handler(arguments)
     
     async def _create_evolving_crew(self, args: Dict[str, Any]) -> List[TextContent]:
         """Create a new evolving crew"""
@@ -1065,29 +1080,14 @@ class MCPCrewAIServer:
             self.agents[agent.agent_id] = agent
         
         # Create tasks (simplified for now)
-        # Import Task safely to avoid FilteredStream errors
-        import sys
-        import io
-        import contextlib
-        original_stdout = sys.stdout
-        original_stderr = sys.stderr
-        try:
-            safe_stdout = io.StringIO()
-            safe_stderr = io.StringIO()
-            with contextlib.redirect_stdout(safe_stdout), contextlib.redirect_stderr(safe_stderr):
-                from crewai import Task, Process
-        finally:
-            sys.stdout = original_stdout
-            sys.stderr = original_stderr
         tasks = []
+        # Role -> first agent with that role (reversed so earlier agents win)
+        agents_by_role = {a.role: a for a in reversed(agents)}
         for i, task_config in enumerate(tasks_config):
             # Find agent by role if specified, or distribute tasks across agents
             assigned_agent = None
             if "agent_role" in task_config:
-                assigned_agent = next(
-                    (a for a in agents if a.role == task_config["agent_role"]), 
-                    agents[i % len(agents)]
-                )
+                assigned_agent = agents_by_role.get(task_config["agent_role"], agents[i % len(agents)])
             else:
                 # Distribute tasks across all available agents for hierarchical coordination
                 assigned_agent = agents[i % len(agents)]
@@ -1140,7 +1140,7 @@ class MCPCrewAIServer:
             update_agent(agent.agent_id,
                         role=agent.role,
                         status="idle",
-                        personality_traits={name: trait.value for name, trait in agent.personality_traits.items()},
+                        personality_traits=agent.traits_snapshot(),
                         evolution_cycles=agent.evolution_cycles,
                         tasks_completed=agent.tasks_completed)
         
@@ -1156,7 +1156,7 @@ class MCPCrewAIServer:
             "message": f"🚀 Evolutionary crew '{crew_name}' created with {len(agents)} agents!"
         }
         
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return [TextContent(type="text", text=_json_text(result))]
     
     async def _run_autonomous_crew(self, args: Dict[str, Any]) -> List[TextContent]:
         """Run crew with autonomous capabilities"""
@@ -1189,7 +1189,7 @@ class MCPCrewAIServer:
                     "dynamic_instruction_stats": {"instructions_processed": 0},
                     "message": f"🧠 Crew made autonomous decision: {decision['reasoning']}"
                 }
-                return [TextContent(type="text", text=json.dumps(result, indent=2))]
+                return [TextContent(type="text", text=_json_text(result))]
         
         # Execute crew with dynamic instruction monitoring
         try:
@@ -1254,7 +1254,7 @@ class MCPCrewAIServer:
             }
             
             # Return results FIRST, then liberate agents
-            response_text = json.dumps(result, indent=2)
+            response_text = _json_text(result)
             
             # NOW liberate agents after preparing response
             await self._liberate_agents_with_experience(crew)
@@ -1270,7 +1270,7 @@ class MCPCrewAIServer:
                 "message": "🚨 Execution stopped by emergency instruction",
                 "partial_results": "Execution was cancelled before completion"
             }
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
+            return [TextContent(type="text", text=_json_text(result))]
             
         except Exception as e:
             # Handle other execution errors
@@ -1303,9 +1303,7 @@ class MCPCrewAIServer:
                     "age_weeks": agent.age_in_weeks(),
                     "evolution_cycles": agent.evolution_cycles,
                     "tasks_completed": agent.tasks_completed,
-                    "personality_traits": {
-                        name: trait.value for name, trait in agent.personality_traits.items()
-                    },
+                    "personality_traits": agent.traits_snapshot(),
                     "performance": {
                         "success_rate": agent.evolution_metrics.success_rate,
                         "collaboration_score": agent.evolution_metrics.collaboration_score
@@ -1316,7 +1314,7 @@ class MCPCrewAIServer:
             "capabilities_assessment": crew.assess_capabilities()
         }
         
-        return [TextContent(type="text", text=json.dumps(status, indent=2))]
+        return [TextContent(type="text", text=_json_text(status))]
     
     async def _trigger_agent_evolution(self, args: Dict[str, Any]) -> List[TextContent]:
         """Force agent evolution"""
@@ -1329,9 +1327,7 @@ class MCPCrewAIServer:
         agent = self.agents[agent_id]
         
         # Capture previous traits before evolution
-        previous_traits = {
-            name: trait.value for name, trait in agent.personality_traits.items()
-        }
+        previous_traits = agent.traits_snapshot()
         
         # Force evolution
         reflection = agent.self_reflect()
@@ -1343,9 +1339,7 @@ class MCPCrewAIServer:
         agent.evolve(reflection["evolution_suggestions"])
         
         # Capture current traits after evolution
-        current_traits = {
-            name: trait.value for name, trait in agent.personality_traits.items()
-        }
+        current_traits = agent.traits_snapshot()
         
         # Log evolution event for monitoring
         trait_changes = {name: current_traits[name] - previous_traits[name] 
@@ -1380,7 +1374,7 @@ class MCPCrewAIServer:
             "current_traits": current_traits
         }
         
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return [TextContent(type="text", text=_json_text(result))]
     
     async def _crew_self_assessment(self, args: Dict[str, Any]) -> List[TextContent]:
         """Make crew perform self-assessment"""
@@ -1408,7 +1402,7 @@ class MCPCrewAIServer:
             "recommendation": "evolve" if suggestions else "maintain_current_setup"
         }
         
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return [TextContent(type="text", text=_json_text(result))]
     
     async def _list_active_crews(self, args: Dict[str, Any]) -> List[TextContent]:
         """List all active crews"""
@@ -1430,7 +1424,7 @@ class MCPCrewAIServer:
             "total_agents": len(self.agents)
         }
         
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return [TextContent(type="text", text=_json_text(result))]
     
     async def _get_agent_reflection(self, args: Dict[str, Any]) -> List[TextContent]:
         """Get agent's self-reflection"""
@@ -1451,7 +1445,7 @@ class MCPCrewAIServer:
             "evolution_readiness": "ready" if agent.should_evolve() else "not_ready"
         }
         
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return [TextContent(type="text", text=_json_text(result))]
     
     async def _create_agent_from_template(self, args: Dict[str, Any]) -> List[TextContent]:
         """Create agent from personality template"""
@@ -1491,12 +1485,10 @@ class MCPCrewAIServer:
             "agent_id": agent.agent_id,
             "template": template,
             "role": role,
-            "personality_traits": {
-                name: trait.value for name, trait in agent.personality_traits.items()
-            }
+            "personality_traits": agent.traits_snapshot()
         }
         
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return [TextContent(type="text", text=_json_text(result))]
     
     def _apply_personality_preset(self, agent: EvolvingAgent, preset: str):
         """Apply personality preset to agent"""
@@ -1581,7 +1573,7 @@ class MCPCrewAIServer:
             "message": f"📝 Dynamic instruction added to {crew_id}"
         }
         
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return [TextContent(type="text", text=_json_text(result))]
     
     async def _get_instruction_status(self, args: Dict[str, Any]) -> List[TextContent]:
         """Get status of specific instruction"""
@@ -1592,7 +1584,7 @@ class MCPCrewAIServer:
         if status is None:
             return [TextContent(type="text", text=f"❌ Instruction '{instruction_id}' not found")]
         
-        return [TextContent(type="text", text=json.dumps(status, indent=2))]
+        return [TextContent(type="text", text=_json_text(status))]
     
     async def _list_dynamic_instructions(self, args: Dict[str, Any]) -> List[TextContent]:
         """List all dynamic instructions for crew"""
@@ -1609,7 +1601,7 @@ class MCPCrewAIServer:
             "instructions": instructions
         }
         
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return [TextContent(type="text", text=_json_text(result))]
     
     async def _get_workflow_status(self, args: Dict[str, Any]) -> List[TextContent]:
         """Get real-time workflow status"""
@@ -1647,7 +1639,7 @@ class MCPCrewAIServer:
         if hasattr(crew, 'dynamic_resources'):
             status["dynamic_resources"] = len(crew.dynamic_resources)
         
-        return [TextContent(type="text", text=json.dumps(status, indent=2))]
+        return [TextContent(type="text", text=_json_text(status))]
     
     # =================================
     # MCP CLIENT TOOLS  
@@ -1699,7 +1691,7 @@ class MCPCrewAIServer:
                 "message": f"❌ Connection error: {str(e)}"
             }
         
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return [TextContent(type="text", text=_json_text(result))]
     
     async def _agent_use_mcp_tool(self, args: Dict[str, Any]) -> List[TextContent]:
         """Make agent use specific MCP tool"""
@@ -1725,7 +1717,7 @@ class MCPCrewAIServer:
             result["context"] = context
             result["timestamp"] = datetime.now().isoformat()
             
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
+            return [TextContent(type="text", text=_json_text(result))]
             
         except Exception as e:
             error_result = {
@@ -1735,7 +1727,7 @@ class MCPCrewAIServer:
                 "error": str(e),
                 "message": f"❌ Tool execution failed: {str(e)}"
             }
-            return [TextContent(type="text", text=json.dumps(error_result, indent=2))]
+            return [TextContent(type="text", text=_json_text(error_result))]
     
     async def _get_agent_mcp_status(self, args: Dict[str, Any]) -> List[TextContent]:
         """Get agent's MCP connections and tools status"""
@@ -1750,7 +1742,7 @@ class MCPCrewAIServer:
             return [TextContent(type="text", text=f"❌ Agent '{agent_id}' does not support MCP connections")]
         
         status = agent.get_mcp_status()
-        return [TextContent(type="text", text=json.dumps(status, indent=2))]
+        return [TextContent(type="text", text=_json_text(status))]
     
     async def _suggest_tools_for_task(self, args: Dict[str, Any]) -> List[TextContent]:
         """Get agent's tool suggestions for task"""
@@ -1775,7 +1767,7 @@ class MCPCrewAIServer:
             "timestamp": datetime.now().isoformat()
         }
         
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return [TextContent(type="text", text=_json_text(result))]
     
     async def _auto_discover_mcp_servers(self, args: Dict[str, Any]) -> List[TextContent]:
         """Auto-discover and connect agent to MCP servers"""
@@ -1806,7 +1798,7 @@ class MCPCrewAIServer:
                 }
             }
             
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
+            return [TextContent(type="text", text=_json_text(result))]
             
         except Exception as e:
             error_result = {
@@ -1815,7 +1807,7 @@ class MCPCrewAIServer:
                 "error": str(e),
                 "message": f"❌ Auto-discovery failed: {str(e)}"
             }
-            return [TextContent(type="text", text=json.dumps(error_result, indent=2))]
+            return [TextContent(type="text", text=_json_text(error_result))]
     
     async def _connect_agent_to_mcp_servers(self, agent) -> None:
         """Connect agent to multiple MCP servers automatically"""
@@ -1870,11 +1862,13 @@ class MCPCrewAIServer:
     async def _get_server_config(self, args: Dict[str, Any]) -> List[TextContent]:
         """Get complete server configuration and status"""
         summary = self.config.get_summary()
-        is_ready, issues = self.config.is_production_ready()
+        # get_summary() already ran the production readiness check
+        is_ready = summary["server"]["production_ready"]
+        issues = summary["issues"]
         
         runtime_status = {
             "startup_time": self.startup_time.isoformat(),
-            "uptime_seconds": (datetime.now() - self.startup_time).total_seconds(),
+            "uptime_seconds": time.monotonic() - self.startup_time_monotonic,
             "active_crews": len(self.crews),
             "active_agents": len(self.agents),
             "active_workflows": len(self.active_workflows),
@@ -1893,7 +1887,7 @@ class MCPCrewAIServer:
             "issues": issues if not is_ready else []
         }
         
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return [TextContent(type="text", text=_json_text(result))]
     
     async def _health_check(self, args: Dict[str, Any]) -> List[TextContent]:
         """Perform comprehensive server health check"""
@@ -1930,7 +1924,7 @@ class MCPCrewAIServer:
         
         if include_details:
             health_status["details"] = {
-                "uptime_seconds": (datetime.now() - self.startup_time).total_seconds(),
+                "uptime_seconds": time.monotonic() - self.startup_time_monotonic,
                 "active_crews": len(self.crews),
                 "active_agents": len(self.agents),
                 "active_workflows": len(self.active_workflows),
@@ -1938,7 +1932,7 @@ class MCPCrewAIServer:
                 "external_mcp_servers": len(self.config.get_mcp_servers_config())
             }
         
-        return [TextContent(type="text", text=json.dumps(health_status, indent=2))]
+        return [TextContent(type="text", text=_json_text(health_status))]
     
     async def _reload_config(self, args: Dict[str, Any]) -> List[TextContent]:
         """Reload server configuration from environment"""
@@ -1964,7 +1958,7 @@ class MCPCrewAIServer:
             logger.info("🔄 Configuration reloaded from environment")
             self._log_startup_info()
             
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
+            return [TextContent(type="text", text=_json_text(result))]
             
         except Exception as e:
             error_result = {
@@ -1973,7 +1967,7 @@ class MCPCrewAIServer:
                 "error": str(e),
                 "message": f"❌ Configuration reload failed: {str(e)}"
             }
-            return [TextContent(type="text", text=json.dumps(error_result, indent=2))]
+            return [TextContent(type="text", text=_json_text(error_result))]
     
     # ===============================================
     # Monitoring Tool Implementations
@@ -1992,7 +1986,7 @@ class MCPCrewAIServer:
         )
         
         dashboard_data = monitoring_manager.get_dashboard_data()
-        return [TextContent(type="text", text=json.dumps(dashboard_data, indent=2))]
+        return [TextContent(type="text", text=_json_text(dashboard_data))]
     
     async def _get_agent_details(self, args: Dict[str, Any]) -> List[TextContent]:
         """Get detailed information about a specific agent"""
@@ -2002,12 +1996,12 @@ class MCPCrewAIServer:
         if agent_details is None:
             return [TextContent(type="text", text=f"❌ Agent '{agent_id}' not found in monitoring system")]
         
-        return [TextContent(type="text", text=json.dumps(agent_details, indent=2))]
+        return [TextContent(type="text", text=_json_text(agent_details))]
     
     async def _get_evolution_summary(self, args: Dict[str, Any]) -> List[TextContent]:
         """Get summary of evolution activity"""
         evolution_summary = monitoring_manager.get_evolution_summary()
-        return [TextContent(type="text", text=json.dumps(evolution_summary, indent=2))]
+        return [TextContent(type="text", text=_json_text(evolution_summary))]
     
     async def _get_live_events(self, args: Dict[str, Any]) -> List[TextContent]:
         """Get recent monitoring events"""
@@ -2034,7 +2028,7 @@ class MCPCrewAIServer:
             "events": events_data
         }
         
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return [TextContent(type="text", text=_json_text(result))]
     
     # ===== WEB SEARCH TOOL IMPLEMENTATIONS =====
     
@@ -2047,9 +2041,9 @@ class MCPCrewAIServer:
         
         # Check if agent exists
         if agent_id not in self.agents:
-            return [TextContent(type="text", text=json.dumps({
+            return [TextContent(type="text", text=_json_text({
                 "error": f"Agent {agent_id} not found"
-            }))]
+            }, indent=False))]
         
         try:
             # Perform search
@@ -2070,15 +2064,15 @@ class MCPCrewAIServer:
                 search_result.get("results", []), purpose
             )
             
-            return [TextContent(type="text", text=json.dumps(search_result, indent=2))]
+            return [TextContent(type="text", text=_json_text(search_result))]
             
         except Exception as e:
             logger.error(f"Web search failed for agent {agent_id}: {e}")
-            return [TextContent(type="text", text=json.dumps({
+            return [TextContent(type="text", text=_json_text({
                 "error": str(e),
                 "agent_id": agent_id,
                 "query": query
-            }))]
+            }, indent=False))]
     
     async def _agent_research_topic(self, args: Dict[str, Any]) -> List[TextContent]:
         """Deep research on a topic for agent improvement"""
@@ -2089,9 +2083,9 @@ class MCPCrewAIServer:
         
         # Check if agent exists
         if agent_id not in self.agents:
-            return [TextContent(type="text", text=json.dumps({
+            return [TextContent(type="text", text=_json_text({
                 "error": f"Agent {agent_id} not found"
-            }))]
+            }, indent=False))]
         
         try:
             # Perform research
@@ -2113,15 +2107,15 @@ class MCPCrewAIServer:
                 research_result, agent, focus_area
             )
             
-            return [TextContent(type="text", text=json.dumps(research_result, indent=2))]
+            return [TextContent(type="text", text=_json_text(research_result))]
             
         except Exception as e:
             logger.error(f"Research failed for agent {agent_id}: {e}")
-            return [TextContent(type="text", text=json.dumps({
+            return [TextContent(type="text", text=_json_text({
                 "error": str(e),
                 "agent_id": agent_id,
                 "topic": topic
-            }))]
+            }, indent=False))]
     
     async def _agent_fact_check(self, args: Dict[str, Any]) -> List[TextContent]:
         """Fact-check information for agent knowledge validation"""
@@ -2130,9 +2124,9 @@ class MCPCrewAIServer:
         
         # Check if agent exists
         if agent_id not in self.agents:
-            return [TextContent(type="text", text=json.dumps({
+            return [TextContent(type="text", text=_json_text({
                 "error": f"Agent {agent_id} not found"
-            }))]
+            }, indent=False))]
         
         try:
             # Perform fact check
@@ -2147,15 +2141,15 @@ class MCPCrewAIServer:
                      agent_id=agent_id,
                      details={"credibility": fact_check_result.get("credibility_score", 0)})
             
-            return [TextContent(type="text", text=json.dumps(fact_check_result, indent=2))]
+            return [TextContent(type="text", text=_json_text(fact_check_result))]
             
         except Exception as e:
             logger.error(f"Fact check failed for agent {agent_id}: {e}")
-            return [TextContent(type="text", text=json.dumps({
+            return [TextContent(type="text", text=_json_text({
                 "error": str(e),
                 "agent_id": agent_id,
                 "claim": claim
-            }))]
+            }, indent=False))]
     
     async def _get_agent_search_analytics(self, args: Dict[str, Any]) -> List[TextContent]:
         """Get search analytics and learning patterns for agent"""
@@ -2163,9 +2157,9 @@ class MCPCrewAIServer:
         
         # Check if agent exists
         if agent_id not in self.agents:
-            return [TextContent(type="text", text=json.dumps({
+            return [TextContent(type="text", text=_json_text({
                 "error": f"Agent {agent_id} not found"
-            }))]
+            }, indent=False))]
         
         try:
             # Get search analytics
@@ -2175,19 +2169,19 @@ class MCPCrewAIServer:
             agent = self.agents[agent_id]
             analytics["agent_context"] = {
                 "role": agent.role,
-                "personality_traits": {name: trait.value for name, trait in agent.personality_traits.items()},
+                "personality_traits": agent.traits_snapshot(),
                 "evolution_cycles": agent.evolution_cycles,
                 "age_weeks": agent.age_in_weeks()
             }
             
-            return [TextContent(type="text", text=json.dumps(analytics, indent=2))]
+            return [TextContent(type="text", text=_json_text(analytics))]
             
         except Exception as e:
             logger.error(f"Search analytics failed for agent {agent_id}: {e}")
-            return [TextContent(type="text", text=json.dumps({
+            return [TextContent(type="text", text=_json_text({
                 "error": str(e),
                 "agent_id": agent_id
-            }))]
+            }, indent=False))]
     
     async def _trigger_research_based_evolution(self, args: Dict[str, Any]) -> List[TextContent]:
         """Trigger agent evolution based on research findings"""
@@ -2197,9 +2191,9 @@ class MCPCrewAIServer:
         
         # Check if agent exists
         if agent_id not in self.agents:
-            return [TextContent(type="text", text=json.dumps({
+            return [TextContent(type="text", text=_json_text({
                 "error": f"Agent {agent_id} not found"
-            }))]
+            }, indent=False))]
         
         try:
             agent = self.agents[agent_id]
@@ -2225,14 +2219,14 @@ class MCPCrewAIServer:
                 update_agent(agent_id, status="evolving")
                 
                 # Get pre-evolution state
-                previous_traits = {name: trait.value for name, trait in agent.personality_traits.items()}
+                previous_traits = agent.traits_snapshot()
                 
                 # Apply research-based evolution
                 evolution_type = self._determine_evolution_type_from_research(insights, agent)
                 agent.evolve([evolution_type], research_insights=insights)
                 
                 # Get post-evolution state
-                new_traits = {name: trait.value for name, trait in agent.personality_traits.items()}
+                new_traits = agent.traits_snapshot()
                 
                 # Log evolution completion
                 log_event("research_evolution_complete", 
@@ -2266,15 +2260,15 @@ class MCPCrewAIServer:
                     "timestamp": datetime.now().isoformat()
                 }
             
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
+            return [TextContent(type="text", text=_json_text(result))]
             
         except Exception as e:
             logger.error(f"Research-based evolution failed for agent {agent_id}: {e}")
-            return [TextContent(type="text", text=json.dumps({
+            return [TextContent(type="text", text=_json_text({
                 "error": str(e),
                 "agent_id": agent_id,
                 "research_topic": research_topic
-            }))]
+            }, indent=False))]
     
     def _generate_learning_insights(self, search_results: List[Dict], purpose: str) -> List[str]:
         """Generate learning insights from search results"""
@@ -2311,7 +2305,7 @@ class MCPCrewAIServer:
     def _generate_personalized_recommendations(self, research_result: Dict, agent: EvolvingAgent, focus_area: str) -> List[str]:
         """Generate personalized recommendations based on agent personality"""
         recommendations = []
-        traits = {name: trait.value for name, trait in agent.personality_traits.items()}
+        traits = agent.traits_snapshot()
         
         # Personality-based recommendations
         if traits.get("analytical", 0) > 0.7:
@@ -2613,7 +2607,7 @@ TASKS COMPLETED: {len(crew.tasks)}
                     "collaboration_score": agent.evolution_metrics.collaboration_score,
                     "tasks_completed": agent.tasks_completed
                 },
-                "preserved_traits": {name: trait.value for name, trait in agent.personality_traits.items()},
+                "preserved_traits": agent.traits_snapshot(),
                 "crew_insights": getattr(agent, 'crew_experiences', [])
             }
             
@@ -2848,11 +2842,11 @@ TASKS COMPLETED: {len(crew.tasks)}
                             
                             reflection = agent.self_reflect()
                             if reflection["evolution_suggestions"]:
-                                previous_traits = {name: trait.value for name, trait in agent.personality_traits.items()}
+                                previous_traits = agent.traits_snapshot()
                                 
                                 agent.evolve(reflection["evolution_suggestions"])
                                 
-                                current_traits = {name: trait.value for name, trait in agent.personality_traits.items()}
+                                current_traits = agent.traits_snapshot()
                                 trait_changes = {name: current_traits[name] - previous_traits[name] 
                                                for name in current_traits if name in previous_traits}
                                 
@@ -2883,6 +2877,50 @@ TASKS COMPLETED: {len(crew.tasks)}
                     await asyncio.sleep(60)  # Shorter wait on error
         
         self._evolution_task = asyncio.create_task(evolution_monitor())
+    
+    def _queue_audit_event(self, event: str, details: Dict[str, Any]) -> None:
+        """Hand a security audit record to the background writer"""
+        if self._audit_queue is None:
+            # Created on first use so the queue belongs to the running loop
+            self._audit_queue = asyncio.Queue(maxsize=_AUDIT_QUEUE_SIZE)
+            self._audit_task = asyncio.create_task(self._drain_audit_queue())
+        try:
+            self._audit_queue.put_nowait((event, details))
+        except asyncio.QueueFull:
+            # Never drop audit records; write this one inline instead
+            security_audit_log(event, details)
+    
+    async def _drain_audit_queue(self):
+        """Write queued security audit records in batches"""
+        queue = self._audit_queue
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < _AUDIT_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
+            for event, details in batch:
+                try:
+                    security_audit_log(event, details)
+                except Exception as e:
+                    logger.error(f"Security audit log error: {e}")
+                finally:
+                    queue.task_done()
+    
+    async def _flush_audit_queue(self):
+        """Write every queued security audit record, then stop the writer task"""
+        queue, task = self._audit_queue, self._audit_task
+        if queue is None:
+            return
+        if task is not None and not task.done():
+            await queue.join()
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        # Anything left (the writer had already stopped) is written inline
+        while not queue.empty():
+            security_audit_log(*queue.get_nowait())
+            queue.task_done()
+        self._audit_queue = None
+        self._audit_task = None
 
     # ===============================================
     # Project Analysis Tool Implementations
@@ -2926,7 +2964,7 @@ TASKS COMPLETED: {len(crew.tasks)}
             
             logger.info(f"📊 Project analysis completed: {analysis.recommended_agent_count} agents recommended for {analysis.complexity.value} project")
             
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
+            return [TextContent(type="text", text=_json_text(result))]
             
         except Exception as e:
             logger.error(f"Error in project analysis: {str(e)}")
@@ -2936,7 +2974,7 @@ TASKS COMPLETED: {len(crew.tasks)}
                 "error": str(e),
                 "message": f"❌ Project analysis failed: {str(e)}"
             }
-            return [TextContent(type="text", text=json.dumps(error_result, indent=2))]
+            return [TextContent(type="text", text=_json_text(error_result))]
 
     async def _create_crew_from_project_analysis(self, args: Dict[str, Any]) -> List[TextContent]:
         """Analyze project and create optimally-sized crew automatically"""
@@ -2973,7 +3011,7 @@ TASKS COMPLETED: {len(crew.tasks)}
             crew_result = await self._create_evolving_crew(crew_args)
             
             # Step 5: Enhance the result with analysis information
-            crew_data = json.loads(crew_result[0].text)
+            crew_data = _load_json(crew_result[0].text)
             enhanced_result = {
                 **crew_data,
                 "project_analysis": {
@@ -2990,7 +3028,7 @@ TASKS COMPLETED: {len(crew.tasks)}
             
             logger.info(f"✅ Intelligent crew '{crew_name}' created successfully with {analysis.recommended_agent_count} agents")
             
-            return [TextContent(type="text", text=json.dumps(enhanced_result, indent=2))]
+            return [TextContent(type="text", text=_json_text(enhanced_result))]
             
         except Exception as e:
             logger.error(f"Error in intelligent crew creation: {str(e)}")
@@ -3000,9 +3038,9 @@ TASKS COMPLETED: {len(crew.tasks)}
                 "error": str(e),
                 "message": f"❌ Intelligent crew creation failed: {str(e)}"
             }
-            return [TextContent(type="text", text=json.dumps(error_result, indent=2))]
+            return [TextContent(type="text", text=_json_text(error_result))]
 
-    def _generate_tasks_from_analysis(self, analysis: ProjectAnalysis, project_description: str, project_goals: List[str]) -> List[Dict[str, Any]]:
+    def _generate_tasks_from_analysis(self, analysis: "ProjectAnalysis", project_description: str, project_goals: List[str]) -> List[Dict[str, Any]]:
         """Generate appropriate tasks based on project analysis"""
         tasks = []
         
@@ -3146,7 +3184,7 @@ TASKS COMPLETED: {len(crew.tasks)}
                 "message": f"❌ Task '{task_id}' not found or cannot be terminated"
             }
         
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return [TextContent(type="text", text=_json_text(result))]
     
     async def _get_active_tasks(self, args: Dict[str, Any]) -> List[TextContent]:
         """Get list of all active tasks that can be terminated"""
@@ -3159,7 +3197,7 @@ TASKS COMPLETED: {len(crew.tasks)}
             "message": f"📋 Found {len(active_tasks)} active tasks"
         }
         
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return [TextContent(type="text", text=_json_text(result))]
     
     async def _get_task_status_detail(self, args: Dict[str, Any]) -> List[TextContent]:
         """Get detailed status of a specific task including progress and partial results"""
@@ -3180,7 +3218,7 @@ TASKS COMPLETED: {len(crew.tasks)}
                 "message": f"❌ Task '{task_id}' not found"
             }
         
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return [TextContent(type="text", text=_json_text(result))]
     
     async def _ensure_mcp_connections_ready(self, crew) -> None:
         """Ensure all MCP connections are established before making autonomous decisions"""
@@ -3260,6 +3298,9 @@ TASKS COMPLETED: {len(crew.tasks)}
             import traceback
             traceback.print_exc(file=sys.stderr)
             raise
+        finally:
+            # Don't lose tool-execution audit records still waiting in the queue
+            await self._flush_audit_queue()
 
 
 def main():
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Tests for the web dashboard API bridge
+"""
+
+import os
+import sys
+from datetime import datetime
+
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'web'))
+
+import api_bridge
+from mcp_crewai.server import MCPCrewAIServer
+
+
+def test_health_route_reports_uptime():
+    """The bridge's /health route answers 200 with the server uptime"""
+    server = MCPCrewAIServer()
+    assert isinstance(server.startup_time, datetime)
+
+    api_bridge.mcp_server = server
+    try:
+        # Used without a context manager so the lifespan does not build a second server
+        client = TestClient(api_bridge.app)
+        response = client.get("/health")
+    finally:
+        api_bridge.mcp_server = None
+
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["status"] == "healthy"
+    assert body["uptime"] != "unknown"
+    assert body["mcp_status"]["checks"]["server_running"] is True
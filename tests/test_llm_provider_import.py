@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Tests for the background LLM provider import warm-up
+"""
+
+import json
+import sys
+import threading
+
+import mcp_crewai.server as server_module
+
+
+def test_warm_up_imports_without_touching_stdout(monkeypatch):
+    monkeypatch.setitem(server_module._PROVIDER_CLASSES, "test", ("json", "JSONDecoder"))
+    server_module._get_chat_class.cache_clear()
+    stdout_during_import = []
+    real_import = server_module.importlib.import_module
+
+    def recording_import(name):
+        stdout_during_import.append(sys.stdout)
+        return real_import(name)
+
+    monkeypatch.setattr(server_module.importlib, "import_module", recording_import)
+    worker = threading.Thread(target=server_module._warm_provider_import, args=("test",))
+    worker.start()
+    worker.join()
+
+    assert stdout_during_import == [sys.stdout]
+    assert server_module._get_chat_class("test", redirect_streams=False) is json.JSONDecoder
+    server_module._get_chat_class.cache_clear()
+
+
+def test_warm_up_ignores_unknown_and_failing_providers(monkeypatch):
+    monkeypatch.setitem(server_module._PROVIDER_CLASSES, "broken", ("no_such_provider_sdk", "Chat"))
+    server_module._get_chat_class.cache_clear()
+
+    server_module._warm_provider_import("not-a-provider")
+    server_module._warm_provider_import("broken")
+
+    assert server_module._get_chat_class.cache_info().currsize == 0
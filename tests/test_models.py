@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Tests for EvolvingAgent's array-backed personality traits
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from mcp_crewai.models import EvolvingAgent, PersonalityTraitView, _TRAIT_NAMES
+
+
+@pytest.fixture
+def agent():
+    return EvolvingAgent(role="Analyst", goal="Analyze data", backstory="I analyze data")
+
+
+def _trait_values(agent):
+    return {name: trait.value for name, trait in agent.personality_traits.items()}
+
+
+def test_traits_cover_every_name_in_order(agent):
+    assert list(agent.personality_traits) == list(_TRAIT_NAMES)
+    assert len(agent.personality_traits) == len(_TRAIT_NAMES)
+    assert "unknown" not in agent.personality_traits
+    with pytest.raises(KeyError):
+        agent.personality_traits["unknown"]
+    assert all(isinstance(t, PersonalityTraitView) for t in agent.personality_traits.values())
+
+
+def test_snapshot_matches_traits_after_setter_writes(agent):
+    agent.personality_traits["analytical"].value = 0.9
+    agent.personality_traits["risk_taking"].value = 0.1
+
+    snapshot = agent.traits_snapshot()
+
+    assert snapshot == _trait_values(agent)
+    assert snapshot["analytical"] == 0.9
+    assert snapshot["risk_taking"] == 0.1
+    assert agent._trait_values[list(_TRAIT_NAMES).index("analytical")] == 0.9
+
+
+def test_snapshot_matches_traits_after_evolve(agent):
+    before = agent.personality_traits["creative"].last_updated
+    agent.evolve({"personality_adjustments": {"creative": 0.8, "adaptable": 0.7, "unknown": 1.0}})
+
+    snapshot = agent.traits_snapshot()
+
+    assert snapshot == _trait_values(agent)
+    assert snapshot["creative"] == 0.8
+    assert snapshot["adaptable"] == 0.7
+    assert agent.personality_traits["creative"].last_updated >= before
+
+
+def test_snapshot_is_a_detached_copy(agent):
+    snapshot = agent.traits_snapshot()
+    snapshot["analytical"] = 0.0
+
+    assert agent.personality_traits["analytical"].value != 0.0
+    assert all(type(value) is float for value in agent.traits_snapshot().values())
+
+
+def test_trait_views_write_through_to_the_arrays(agent):
+    trait = agent.personality_traits["collaborative"]
+    index = list(_TRAIT_NAMES).index("collaborative")
+    stamp = datetime(2024, 1, 2, 3, 4, 5, 678901)
+
+    trait.evolution_rate = 0.25
+    trait.last_updated = stamp
+
+    assert agent._trait_rates[index] == 0.25
+    assert agent._trait_updated[index] == np.datetime64(stamp, "ns")
+    assert agent.personality_traits["collaborative"].last_updated == stamp
+
+
+def test_agents_do_not_share_trait_arrays(agent):
+    other = EvolvingAgent(role="Writer", goal="Write", backstory="I write")
+    agent.personality_traits["creative"].value = 1.0
+
+    assert other.personality_traits["creative"].value != 1.0
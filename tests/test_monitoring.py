@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Tests for the monitoring event buffers
+"""
+
+import threading
+import time
+
+from mcp_crewai.monitoring import MonitoringManager
+
+
+def test_threshold_flush_feeds_subscribers_without_a_reader():
+    manager = MonitoringManager(flush_threshold=4, flush_interval=60)
+    for i in range(4):
+        manager.add_event("task", f"event {i}")
+
+    # No read path ran, yet the producer's buffer hit the threshold
+    assert manager.event_queue.qsize() == 4
+    assert [e.message for e in manager.events] == [f"event {i}" for i in range(4)]
+    manager.close()
+
+
+def test_background_flush_publishes_events():
+    manager = MonitoringManager(flush_threshold=1000, flush_interval=0.01)
+    manager.add_event("evolution", "evolved")
+
+    deadline = time.monotonic() + 5
+    while manager.event_queue.empty() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert manager.event_queue.get_nowait().message == "evolved"
+    manager.close()
+    assert manager._metrics["total_evolutions"] == 1
+
+
+def test_small_buffers_flush_before_they_overflow():
+    manager = MonitoringManager(thread_buffer_size=4, flush_threshold=256, flush_interval=60)
+    for i in range(10):
+        manager.add_event("task", f"event {i}")
+
+    assert [e.message for e in manager.get_recent_events()] == [f"event {i}" for i in range(10)]
+    manager.close()
+
+
+def test_buffers_of_finished_threads_are_released():
+    manager = MonitoringManager(flush_threshold=1000, flush_interval=60)
+    worker = threading.Thread(target=manager.add_event, args=("task", "from worker"))
+    worker.start()
+    worker.join()
+    manager.add_event("task", "from main")
+
+    events = manager.get_recent_events()
+
+    assert [e.message for e in events] == ["from worker", "from main"]
+    assert [thread for thread, _ in manager._all_tls] == [threading.current_thread()]
+    manager.close()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Tests for need-driven request analysis and its SQLite-backed history
+"""
+
+import itertools
+
+import pytest
+
+from mcp_crewai.need_driven_evolution import (
+    NeedDrivenEvolution,
+    _COMPLEXITY_KW,
+    _SKILL_KW,
+    _match_keywords,
+    _tokenize,
+)
+
+QUERIES = [
+    "",
+    "Please analyze the data and write a report",
+    "Brainstorm a creative, innovative design with the team!",
+    "Lead the group; decide which system to program next.",
+    "A simple, quick summary of advanced research",
+    "Give me a detailed and thorough plan",
+    "nothing relevant here",
+    "analyzed datasets, programming, teams",
+]
+
+
+def _match_by_intersection(tokens):
+    """Reference: intersect each keyword set with the tokens"""
+    skills = tuple(skill for skill, keywords in _SKILL_KW.items() if keywords & tokens)
+    level = next((level for level, indicators in _COMPLEXITY_KW if indicators & tokens), "moderate")
+    return skills, level
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_matcher_agrees_with_set_intersection(query):
+    tokens = _tokenize(query.lower())
+    assert _match_keywords(tokens) == _match_by_intersection(tokens)
+
+
+def test_matcher_covers_every_keyword():
+    for keyword in itertools.chain(*_SKILL_KW.values(), *(kw for _, kw in _COMPLEXITY_KW)):
+        tokens = frozenset({keyword})
+        assert _match_keywords(tokens) == _match_by_intersection(tokens), keyword
+
+
+def test_matcher_orders_skills_and_prefers_higher_complexity():
+    skills, level = _match_keywords(_tokenize("lead the team to code a simple but complex system"))
+
+    assert skills == ("collaborative", "technical", "leadership")
+    assert level == "complex"
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    path = tmp_path / "need_driven_evolution.db"
+    monkeypatch.setenv("NDE_DB_PATH", str(path))
+    return path
+
+
+def test_database_path_comes_from_the_environment(db_path, tmp_path, monkeypatch):
+    workdir = tmp_path / "cwd"
+    workdir.mkdir()
+    monkeypatch.chdir(workdir)
+
+    evolution = NeedDrivenEvolution()
+    evolution.close()
+
+    assert evolution.db_path == str(db_path)
+    assert db_path.exists()
+    assert list(workdir.iterdir()) == []
+
+
+def test_history_survives_a_restart(db_path):
+    evolution = NeedDrivenEvolution()
+    request = evolution.analyze_user_request("Run a complex analysis of the sales data", "crew_1")
+    evolution.record_task_failure(request, "agent_1", "could not analyze", ["analytical"])
+    evolution.close()
+
+    restarted = NeedDrivenEvolution()
+    try:
+        history = restarted.get_improvement_history("agent_1")
+        need = restarted.should_trigger_research("agent_1")
+    finally:
+        restarted.close()
+
+    assert history["total_failures"] == 1
+    assert history["recent_failures"] == ["could not analyze"]
+    assert need is not None and need.agent_id == "agent_1"
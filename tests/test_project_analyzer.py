@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Tests for project analysis agent recommendations
+"""
+
+from mcp_crewai.project_analyzer import _TEMPLATE_DICTS, create_project_analyzer
+
+DESCRIPTION = "Build a web application with a REST API, database and automated deployment"
+
+
+def _template_skills():
+    return {domain: [list(t["required_skills"]) for t in templates]
+            for domain, templates in _TEMPLATE_DICTS.items()}
+
+
+def test_batch_recommendations_do_not_share_template_skills():
+    analyzer = create_project_analyzer(fresh=True)
+    before = _template_skills()
+
+    analysis = analyzer.analyze_projects([DESCRIPTION])[0]
+    for agent in analysis.recommended_agents:
+        agent["required_skills"].append("mutated by caller")
+
+    assert _template_skills() == before
+    again = analyzer.analyze_projects([DESCRIPTION])[0]
+    assert all("mutated by caller" not in agent["required_skills"]
+               for agent in again.recommended_agents)
+
+
+def test_uncached_recommendations_do_not_share_template_skills():
+    analyzer = create_project_analyzer(fresh=True)
+    before = _template_skills()
+
+    # Unhashable constraints take the uncached path
+    analysis = analyzer.analyze_project_sync(DESCRIPTION, constraints={"stack": ["python"]})
+    for agent in analysis.recommended_agents:
+        agent["required_skills"].append("mutated by caller")
+
+    assert _template_skills() == before
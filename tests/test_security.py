@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Tests for the security fast paths: generated argument validators, the HS256
+JWT path and the rate-limit kernel
+"""
+
+import hashlib
+import time
+
+import pytest
+
+from mcp_crewai.security import (
+    AuthenticationError,
+    AuthenticationManager,
+    RateLimiter,
+    RateLimitEntry,
+    SecurityConfig,
+    SecurityMiddleware,
+    ValidationError,
+    _rate_limit_check,
+    _NS_PER_SECOND,
+    _MINUTE_NS,
+    _HOUR_NS,
+)
+
+jwt = pytest.importorskip("jwt")
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string"},
+        "tags": {"type": "array"},
+        "config": {"type": "object"},
+        "count": {"type": "integer"},
+        "ratio": {"type": "number"},
+        "enabled": {"type": "boolean"},
+        "free_form": {},
+    },
+}
+
+ARGUMENT_CASES = [
+    {},
+    {"name": "crew", "tags": ["a", "b"], "config": {"k": 1}, "count": 3, "ratio": 0.5, "enabled": True},
+    {"name": "ctrl\x00chars\x07", "free_form": "x", "undeclared": [1, {"k": None}]},
+    # Declared names carrying a value of another type take the generic path
+    {"name": 5, "count": "five", "tags": {"k": "v"}, "config": [1, 2], "enabled": None},
+    {"name": "x" * (SecurityConfig.MAX_STRING_LENGTH + 1)},
+    {"k" * 101: 1},
+    {"undeclared": object()},
+    {"tags": [[[[[[[[[[[["too deep"]]]]]]]]]]]]},
+]
+
+
+def _outcome(validate, arguments):
+    try:
+        return validate(arguments)
+    except ValidationError as e:
+        return ("ValidationError", str(e))
+
+
+@pytest.mark.parametrize("arguments", ARGUMENT_CASES)
+def test_generated_validator_matches_generic_path(arguments):
+    middleware = SecurityMiddleware()
+    validator = middleware.register_tool_schema("tool", SCHEMA)
+
+    assert _outcome(validator, arguments) == _outcome(middleware._generic_validate, arguments)
+    assert _outcome(lambda a: middleware.validate_tool_arguments("tool", a), arguments) == \
+        _outcome(middleware._generic_validate, arguments)
+
+
+def test_generated_validator_skips_unusable_property_names():
+    middleware = SecurityMiddleware()
+    schema = {"properties": {"k" * 101: {"type": "string"}, "bad\nname": {"type": "string"}, 7: {"type": "string"}}}
+    validator = middleware.register_tool_schema("tool", schema)
+
+    assert _outcome(validator, {"bad\nname": "v"}) == _outcome(middleware._generic_validate, {"bad\nname": "v"})
+    assert validator({"ok": "v"}) == {"ok": "v"}
+
+
+def _api_key():
+    manager = AuthenticationManager()
+    return manager, manager.validate_api_key(manager.generate_api_key("client", ["read", "write"]))
+
+
+def test_fast_jwt_encode_matches_pyjwt():
+    manager, api_key = _api_key()
+    now_ns = 1_700_000_000 * _NS_PER_SECOND
+    issued_at = now_ns // _NS_PER_SECOND
+    payload = {
+        "client_id": "client",
+        "permissions": ["read", "write"],
+        "iat": issued_at,
+        "exp": issued_at + SecurityConfig.JWT_EXPIRATION_HOURS * 3600,
+    }
+
+    token = manager.generate_jwt_token(api_key, now_ns)
+
+    assert token == jwt.encode(payload, SecurityConfig.JWT_SECRET_KEY, algorithm="HS256")
+
+
+def test_fast_jwt_encode_matches_pyjwt_for_non_ascii_claims():
+    manager = AuthenticationManager()
+    api_key = manager.validate_api_key(manager.generate_api_key("clïent-δ", ["lecture", "écriture"]))
+    now_ns = 1_700_000_000 * _NS_PER_SECOND
+
+    token = manager.generate_jwt_token(api_key, now_ns)
+
+    assert token.isascii()
+    assert token == jwt.encode(jwt.decode(token, options={"verify_signature": False}),
+                               SecurityConfig.JWT_SECRET_KEY, algorithm="HS256")
+    assert jwt.decode(token, SecurityConfig.JWT_SECRET_KEY, algorithms=["HS256"],
+                      options={"verify_exp": False})["client_id"] == "clïent-δ"
+
+
+def test_jwt_signature_ignores_api_key_hash_setting(monkeypatch):
+    manager, api_key = _api_key()
+    monkeypatch.setattr(SecurityConfig, "HASH_IMPL", hashlib.sha512)
+
+    token = manager.generate_jwt_token(api_key)
+
+    assert jwt.decode(token, SecurityConfig.JWT_SECRET_KEY, algorithms=["HS256"])["client_id"] == "client"
+    assert manager.validate_jwt_token(token)["client_id"] == "client"
+
+
+def test_fast_jwt_decode_matches_pyjwt():
+    manager, api_key = _api_key()
+    token = manager.generate_jwt_token(api_key)
+
+    assert manager.validate_jwt_token(token) == jwt.decode(
+        token, SecurityConfig.JWT_SECRET_KEY, algorithms=["HS256"]
+    )
+
+
+def test_fast_jwt_decode_rejects_what_pyjwt_rejects():
+    manager, api_key = _api_key()
+    now = int(time.time())
+    token = manager.generate_jwt_token(api_key)
+    header, payload, signature = token.split(".")
+    secret = SecurityConfig.JWT_SECRET_KEY
+
+    expired = jwt.encode({"client_id": "c", "exp": now - 10}, secret, algorithm="HS256")
+    future_iat = jwt.encode({"client_id": "c", "iat": now + 3600}, secret, algorithm="HS256")
+    wrong_key = jwt.encode({"client_id": "c"}, "not-the-server-secret-" + "x" * 16, algorithm="HS256")
+    tampered = ".".join((header, payload[:-2] + "AA", signature))
+
+    with pytest.raises(AuthenticationError, match="Token expired"):
+        manager.validate_jwt_token(expired)
+    for bad in (future_iat, wrong_key, tampered, header + "." + payload + ".!!", "a.b"):
+        with pytest.raises(AuthenticationError, match="Invalid token"):
+            manager.validate_jwt_token(bad)
+
+
+def _window(*offsets_ns, now_ns):
+    entry = RateLimitEntry(client_id="client")
+    for offset in offsets_ns:
+        entry.append(now_ns - offset, 16)
+    return entry
+
+
+def test_rate_limit_kernel_prunes_the_hourly_window():
+    now_ns = 10 * _HOUR_NS
+    entry = _window(2 * _HOUR_NS, _HOUR_NS, _HOUR_NS - 1, 30 * _MINUTE_NS, now_ns=now_ns)
+
+    allowed, head, count, blocked_until_ns = _rate_limit_check(
+        entry.timestamps, entry.head, entry.count, now_ns, 10, 10
+    )
+
+    # Requests exactly an hour old are expired, as in RateLimitEntry.prune
+    assert (allowed, head, count, blocked_until_ns) == (True, 2, 2, 0)
+
+
+def test_rate_limit_kernel_blocks_at_the_hourly_limit():
+    now_ns = 10 * _HOUR_NS
+    entry = _window(50 * _MINUTE_NS, 40 * _MINUTE_NS, 30 * _MINUTE_NS, now_ns=now_ns)
+
+    allowed, head, count, blocked_until_ns = _rate_limit_check(
+        entry.timestamps, entry.head, entry.count, now_ns, 3, 10
+    )
+
+    assert (allowed, head, count) == (False, 0, 3)
+    assert blocked_until_ns == now_ns + _HOUR_NS
+
+
+def test_rate_limit_kernel_denies_bursts_without_blocking():
+    now_ns = 10 * _HOUR_NS
+    entry = _window(2 * _MINUTE_NS, 50 * _NS_PER_SECOND, 20 * _NS_PER_SECOND, now_ns=now_ns)
+
+    assert _rate_limit_check(entry.timestamps, entry.head, entry.count, now_ns, 100, 2) == (False, 0, 3, 0)
+    assert _rate_limit_check(entry.timestamps, entry.head, entry.count, now_ns, 100, 3) == (True, 0, 3, 0)
+
+
+def test_rate_limiter_allows_denies_and_reopens(monkeypatch):
+    monkeypatch.setattr(SecurityConfig, "BURST_LIMIT", 3)
+    limiter = RateLimiter()
+    start_ns = 10 * _HOUR_NS
+
+    assert [limiter.check_rate_limit("client", 100, start_ns + i) for i in range(4)] == [True, True, True, False]
+    # The burst window has moved on
+    assert limiter.check_rate_limit("client", 100, start_ns + _MINUTE_NS + 3)
+
+    # Hitting the hourly limit blocks the client until an hour has passed
+    assert not limiter.check_rate_limit("client", 4, start_ns + 2 * _MINUTE_NS)
+    assert not limiter.check_rate_limit("client", 100, start_ns + _HOUR_NS)
+    assert limiter.check_rate_limit("client", 100, start_ns + 2 * _MINUTE_NS + _HOUR_NS + 1)
+
+    # Other clients are unaffected
+    assert limiter.check_rate_limit("other", 4, start_ns + 2 * _MINUTE_NS)
@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""
+Tests for the background security audit writer in MCPCrewAIServer
+"""
+
+import asyncio
+
+import mcp_crewai.server as server_module
+from mcp_crewai.server import MCPCrewAIServer
+
+
+def test_flush_writes_every_queued_audit_record(monkeypatch):
+    written = []
+    monkeypatch.setattr(server_module, "security_audit_log",
+                        lambda event, details: written.append((event, details)))
+    server = MCPCrewAIServer()
+
+    async def scenario():
+        for i in range(600):
+            server._queue_audit_event("tool_execution", {"call": i})
+        await server._flush_audit_queue()
+
+    asyncio.run(scenario())
+
+    assert [details["call"] for _, details in written] == list(range(600))
+    assert server._audit_task is None
+    assert server._audit_queue is None
@@ -93,12 +93,14 @@ async def demonstrate_need_driven_improvement():
             for i, result in enumerate(search_results['results'][:2], 1):
                 print(f"   {i}. {result['title'][:50]}...")
             
-            # Conduct research
-            research_results = await web_search.research_topic(
-                topic=improvement_need.skill_gap,
-                depth="standard",
-                agent_id=agent_id
-            )
+            # Conduct research (reusing validated results for similar needs)
+            research_results = evolution_system.get_cached_research(improvement_need)
+            if research_results is None:
+                research_results = await web_search.research_topic(
+                    topic=improvement_need.skill_gap,
+                    depth="standard",
+                    agent_id=agent_id
+                )
             
             # Validate research relevance
             is_valid = evolution_system.validate_improvement_impact(
@@ -7,7 +7,8 @@ Connects the web dashboard to MCP CrewAI server tools
 import asyncio
 import json
 import logging
-from datetime import datetime
+import time
+from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional
 from contextlib import asynccontextmanager
 
@@ -113,7 +114,7 @@ async def health_check():
             "status": "healthy",
             "timestamp": datetime.now().isoformat(),
             "mcp_status": result,
-            "uptime": str(datetime.now() - mcp_server.startup_time) if mcp_server else "unknown"
+            "uptime": str(timedelta(seconds=time.monotonic() - mcp_server.startup_time_monotonic)) if mcp_server else "unknown"
         }
     except Exception as e:
         logger.error(f"Health check failed: {e}")